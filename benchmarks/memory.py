@@ -0,0 +1,95 @@
+"""
+Memory footprint of the per-patient and per-case objects.
+
+Run from the folder containing the medical_simulator package::
+
+    python -m medical_simulator.benchmarks.memory --n 20000
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Callable
+
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.core.batch import DEFAULT_DISEASES_PATH
+from medical_simulator.utils.rng import SimulationRNG
+from medical_simulator.utils.utils import build_treatments, generate_random_patient, load_diseases_from_json
+
+
+def bytes_per_object(factory: Callable[[int], object], n: int) -> float:
+    """
+    Average traced allocation of the objects built by ``factory(i)`` for ``i in range(n)``.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # the list holding the objects is not part of their footprint
+    return (after - before) / n - 8 if objects else 0.0
+
+
+def patient_footprint(n: int, seed: int = 0) -> float:
+    """
+    Bytes per patient that has revealed its symptoms and gone through every test.
+    """
+    diseases = load_diseases_from_json(str(DEFAULT_DISEASES_PATH))
+    rng = SimulationRNG(seed)
+
+    def build(_):
+        patient = generate_random_patient(diseases, rng)
+        patient.advance_time(1)
+        patient.catch_up(5)
+        patient.apply_vital_signs_test()
+        patient.apply_blood_test()
+        patient.apply_xray()
+        patient.apply_ecg()
+        return patient
+
+    return bytes_per_object(build, n)
+
+
+def case_result_footprint(n: int) -> float:
+    """
+    Bytes per `CaseResult`, as recorded by `Hospital.discharge_patient`.
+    """
+    diseases = load_diseases_from_json(str(DEFAULT_DISEASES_PATH))
+    hospital = Hospital(Clock(), WaitingRoom(n), diseases, build_treatments(), rng=SimulationRNG(0))
+    patients = [generate_random_patient(diseases, hospital.demographics_rng) for _ in range(n)]
+
+    def build(i):
+        hospital.discharge_patient(patients[i])
+        hospital.events.clear()
+        return hospital.daily_case_results.pop()
+
+    return bytes_per_object(build, n)
+
+
+def run(n: int) -> dict[str, float]:
+    return {
+        "patient_bytes": round(patient_footprint(n), 1),
+        "case_result_bytes": round(case_result_footprint(n), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure per-object memory footprint")
+    parser.add_argument("--n", type=int, default=20000, help="objects to build per measurement")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.n)
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for name, value in results.items():
+            print(f"{name:>20}: {value:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Startup time of the command line and of batch workers, against a budget.
+
+Each case runs in a fresh interpreter: its wall time (best of a few runs) must
+stay within the budget, and it must not import the modules it has no use for
+(checked with ``python -X importtime``). Exits with status 1 on any failure.
+
+Run from the folder containing the medical_simulator package::
+
+    python -m medical_simulator.benchmarks.startup
+    python -m medical_simulator.benchmarks.startup --budget 150 --repeat 10
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+
+PACKAGE_DIR = Path(__file__).parent.parent
+MAIN = PACKAGE_DIR / "main.py"
+
+BUDGET_MS = 100.0
+
+# never needed by the short invocations (nor by a worker playing a batch)
+HEAVY = (
+    "asyncio",
+    "cProfile",
+    "medical_simulator.core.server",
+    "medical_simulator.core.instrumentation",
+    "medical_simulator.core.simulator_controller",
+    "medical_simulator.core.event_log",
+)
+
+
+class StartupCase:
+    """
+    One command, run in a fresh interpreter.
+
+    Parameters
+    ----------
+    name : str
+        Shown in the report.
+    args : list[str]
+        Arguments of the interpreter.
+    forbidden : tuple[str, ...]
+        Modules the command must not import.
+    """
+
+    def __init__(self, name: str, args: list[str], forbidden: tuple[str, ...] = HEAVY):
+        self.name = name
+        self.args = args
+        self.forbidden = forbidden
+
+
+def cases() -> list[StartupCase]:
+    return [
+        StartupCase("interpreter", ["-c", "pass"], ()),
+        StartupCase("main.py --version", [str(MAIN), "--version"]),
+        StartupCase("main.py --validate-catalog", [str(MAIN), "--validate-catalog"]),
+        # what a spawned batch worker imports before playing
+        StartupCase("worker imports", ["-c", "import medical_simulator.core.batch"]),
+    ]
+
+
+def _environment() -> dict[str, str]:
+    env = dict(os.environ)
+    # the package is imported as `medical_simulator`, from the folder containing it
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (str(PACKAGE_DIR.parent), env.get("PYTHONPATH"))))
+    return env
+
+
+def wall_time(args: list[str], repeat: int) -> float:
+    """
+    Best wall time in seconds of ``python <args>`` over `repeat` runs.
+    """
+    env = _environment()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def imported_modules(args: list[str]) -> set[str]:
+    """
+    Every module ``python <args>`` imports, as reported by ``-X importtime``.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        env=_environment(), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True
+    )
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def run(budget_ms: float = BUDGET_MS, repeat: int = 5) -> list[dict]:
+    results = []
+    for case in cases():
+        elapsed_ms = wall_time(case.args, repeat) * 1000
+        loaded = sorted(imported_modules(case.args) & set(case.forbidden)) if case.forbidden else []
+        results.append({
+            "name": case.name,
+            "ms": elapsed_ms,
+            "over_budget": elapsed_ms > budget_ms,
+            "forbidden_imports": loaded,
+        })
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Check the startup time of the CLI and batch workers")
+    parser.add_argument("--budget", type=float, default=BUDGET_MS, help=f"allowed wall time per command, in ms (default {BUDGET_MS:g})")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per command (best is kept)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.budget, args.repeat)
+    failed = [r for r in results if r["over_budget"] or r["forbidden_imports"]]
+
+    if args.json:
+        print(json.dumps(results))
+    else:
+        print(f"{'Command':<32} {'wall':>10}")
+        for r in results:
+            problems = []
+            if r["over_budget"]:
+                problems.append(f"over the {args.budget:g} ms budget")
+            if r["forbidden_imports"]:
+                problems.append("imports " + ", ".join(r["forbidden_imports"]))
+            print(f"{r['name']:<32} {r['ms']:>8.1f}ms  {'; '.join(problems) or 'ok'}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""
+Reproducible benchmarks of the simulation hot paths.
+
+Every case runs on fixed seeds and synthetic catalogs (see `utils/synthetic.py`),
+reports the best time of a few repetitions (per-call latency and, for the
+hospital, simulated hours per second) and the peak traced memory of one extra
+run. Results can be saved as a JSON baseline and later runs compared against it.
+
+Run from the folder containing the medical_simulator package::
+
+    python -m medical_simulator.benchmarks.suite --save baseline.json
+    python -m medical_simulator.benchmarks.suite --compare baseline.json
+"""
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from medical_simulator.core.arrivals import HourlyCoinArrivals, PoissonArrivals
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils import catalog
+from medical_simulator.utils.rng import SimulationRNG
+from medical_simulator.utils.lazy_catalog import LazyCatalog
+from medical_simulator.utils.synthetic import generate_catalog, write_catalog
+from medical_simulator.utils.utils import build_treatments, generate_random_patient
+
+
+SEED = 1234
+
+CATALOG_SIZES = (10, 100, 10_000)
+ROOM_SIZES = (4, 100, 1_000, 10_000)
+
+# smaller grid for a quick check
+QUICK_CATALOG_SIZES = (10, 100)
+QUICK_ROOM_SIZES = (4, 100)
+
+
+# -------------------------
+# Synthetic data
+# -------------------------
+
+def synthetic_diseases(n_diseases: int, seed: int = SEED) -> list[Disease]:
+    return catalog.build_diseases(generate_catalog(n_diseases, seed))
+
+
+def full_hospital(diseases: list[Disease], n_patients: int, seed: int = SEED) -> Hospital:
+    """
+    Hospital at the start of a day with `n_patients` waiting and no arrivals scheduled.
+    """
+    hospital = Hospital(Clock(), WaitingRoom(n_patients), diseases, build_treatments(), rng=SimulationRNG(seed))
+    hospital.clock.start_new_day()
+    for _ in range(n_patients):
+        hospital.admit_patient(generate_random_patient(diseases, hospital.demographics_rng))
+    hospital.pop_events()
+    return hospital
+
+
+# -------------------------
+# Cases
+# -------------------------
+
+class Benchmark:
+    """
+    One benchmark case.
+
+    Parameters
+    ----------
+    name : str
+        Unique name, used as key in the results and baselines.
+    setup : Callable[[], Any]
+        Builds the state of one repetition; not timed.
+    run : Callable[[Any], int]
+        Runs the measured code on that state and returns how many calls it made.
+    hours : int, optional (default=0)
+        Simulated hours covered by one run, to report hours per second.
+    """
+
+    def __init__(self, name: str, setup: Callable[[], Any], run: Callable[[Any], int], hours: int = 0):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.hours = hours
+
+
+def _catalog_cases(size: int, workdir: Path) -> list[Benchmark]:
+    path = workdir / f"catalog_{size}.json"
+    write_catalog(path, generate_catalog(size, SEED))
+    cache_dir = workdir / "cache"
+
+    def parse(_):
+        catalog.parse_catalog(path)
+        return 1
+
+    def load_cached(_):
+        catalog._loaded.clear()
+        catalog.load_catalog(path, cache_dir=cache_dir)
+        return 1
+
+    # a worker that only needs a handful of diseases
+    wanted = [f"disease {i}" for i in range(0, size, max(1, size // 5))]
+
+    def lazy_subset(_):
+        LazyCatalog(path, cache_dir=cache_dir).subset(wanted)
+        return 1
+
+    # warm the on-disk caches so the cached cases never parse
+    catalog.load_catalog(path, cache_dir=cache_dir)
+    LazyCatalog(path, cache_dir=cache_dir)
+
+    return [
+        Benchmark(f"catalog.parse[{size}]", lambda: None, parse),
+        Benchmark(f"catalog.load_cached[{size}]", lambda: None, load_cached),
+        Benchmark(f"catalog.lazy_subset[{size}]", lambda: None, lazy_subset),
+    ]
+
+
+def _patient_cases(diseases: list[Disease], n: int = 10_000) -> list[Benchmark]:
+    def patients():
+        rng = SimulationRNG(SEED)
+        return [generate_random_patient(diseases, rng) for _ in range(n)]
+
+    def advance(ps):
+        for p in ps:
+            p.advance_time(1)
+        return len(ps)
+
+    def update_symptoms(ps):
+        for p in ps:
+            p.time_elapsed += 1
+            p._update_symptoms()
+        return len(ps)
+
+    def catch_up(ps):
+        for p in ps:
+            p.catch_up(12)
+        return len(ps)
+
+    def fast_forward(ps):
+        for p in ps:
+            p.fast_forward(12)
+        return len(ps)
+
+    return [
+        Benchmark("patient.advance_time", patients, advance),
+        Benchmark("patient._update_symptoms", patients, update_symptoms),
+        Benchmark("patient.catch_up[12h]", patients, catch_up),
+        Benchmark("patient.fast_forward[12h]", patients, fast_forward),
+    ]
+
+
+def _arrival_case(diseases: list[Disease], days: int = 2_000) -> Benchmark:
+    def setup():
+        rng = SimulationRNG(SEED)
+        return HourlyCoinArrivals(), rng.spawn("arrivals"), rng.spawn("demographics")
+
+    def run(state):
+        # what the hospital does at the start of every day, then at each arrival
+        process, arrivals, demographics = state
+        calls = 0
+        for day in range(1, days + 1):
+            for _, source in process.schedule_day(day, arrivals):
+                source.draw_patient(diseases, demographics)
+                calls += 1
+        return calls
+
+    return Benchmark("arrivals.hourly_coin_day", setup, run)
+
+
+def _poisson_day_case(diseases: list[Disease], rate: float = 1_000.0) -> Benchmark:
+    hours = 11
+
+    def setup():
+        hospital = Hospital(
+            Clock(), WaitingRoom(10**9), diseases, build_treatments(),
+            rng=SimulationRNG(SEED), arrivals=PoissonArrivals(rate)
+        )
+        hospital.start_new_day()
+        hospital.pop_events()
+        return hospital
+
+    def run(hospital):
+        hospital.advance_time(hours)
+        return 1
+
+    return Benchmark(f"hospital.poisson_day[{rate:g}/h]", setup, run, hours=hours)
+
+
+def _hospital_cases(diseases: list[Disease], size: int) -> list[Benchmark]:
+    hours = 11
+
+    def advance(hospital):
+        hospital.advance_time(hours)
+        return 1
+
+    def advance_observed(hospital):
+        # a doctor looking at the whole room every hour
+        for _ in range(hours):
+            hospital.advance_time(1)
+            hospital.sync_all()
+        return 1
+
+    def end_day(hospital):
+        hospital.end_day()
+        return 1
+
+    return [
+        Benchmark(f"hospital.advance_time[{size}]", lambda: full_hospital(diseases, size), advance, hours=hours),
+        Benchmark(f"hospital.advance_observed[{size}]", lambda: full_hospital(diseases, size), advance_observed, hours=hours),
+        Benchmark(f"hospital.end_day[{size}]", lambda: full_hospital(diseases, size), end_day),
+    ]
+
+
+def build_cases(workdir: Path, quick: bool = False) -> list[Benchmark]:
+    catalog_sizes = QUICK_CATALOG_SIZES if quick else CATALOG_SIZES
+    room_sizes = QUICK_ROOM_SIZES if quick else ROOM_SIZES
+    diseases = synthetic_diseases(100)
+
+    cases = []
+    for size in catalog_sizes:
+        cases.extend(_catalog_cases(size, workdir))
+    cases.extend(_patient_cases(diseases))
+    cases.append(_arrival_case(diseases))
+    if not quick:
+        cases.append(_poisson_day_case(diseases))
+    for size in room_sizes:
+        cases.extend(_hospital_cases(diseases, size))
+    return cases
+
+
+# -------------------------
+# Measurement
+# -------------------------
+
+def measure(benchmark: Benchmark, repeat: int = 5) -> dict[str, float]:
+    """
+    Best-of-`repeat` timing of a case, plus the peak memory of one traced run.
+    """
+    best = float("inf")
+    calls = 1
+
+    for _ in range(repeat):
+        state = benchmark.setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            calls = benchmark.run(state)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed)
+        del state
+
+    # traced separately: tracemalloc slows allocations down a lot
+    gc.collect()
+    tracemalloc.start()
+    benchmark.run(benchmark.setup())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    result = {
+        "seconds": best,
+        "per_call_us": best / calls * 1e6,
+        "peak_kib": peak / 1024,
+    }
+    if benchmark.hours:
+        result["hours_per_s"] = benchmark.hours / best
+    return result
+
+
+def run(quick: bool = False, repeat: int = 5, only: Optional[str] = None) -> dict[str, dict[str, float]]:
+    with tempfile.TemporaryDirectory() as workdir:
+        cases = build_cases(Path(workdir), quick)
+        if only:
+            cases = [c for c in cases if only in c.name]
+        return {case.name: measure(case, repeat) for case in cases}
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    """
+    Returns the cases whose per-call latency regressed by more than `tolerance` (a fraction).
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["per_call_us"] / baseline[name]["per_call_us"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline")
+    return regressions
+
+
+def _print_results(results: dict[str, dict[str, float]], baseline: Optional[dict]) -> None:
+    print(f"{'case':<40}{'per call':>14}{'hours/s':>12}{'peak KiB':>12}{'vs base':>10}")
+    for name, r in results.items():
+        hours = f"{r['hours_per_s']:.1f}" if "hours_per_s" in r else "-"
+        ratio = "-"
+        if baseline and name in baseline:
+            ratio = f"{r['per_call_us'] / baseline[name]['per_call_us']:.2f}x"
+        print(f"{name:<40}{r['per_call_us']:>12.2f}us{hours:>12}{r['peak_kib']:>12.0f}{ratio:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the simulation hot paths")
+    parser.add_argument("--quick", action="store_true", help="skip the largest catalogs and waiting rooms")
+    parser.add_argument("--repeat", type=int, default=5, help="timed repetitions per case (best is kept)")
+    parser.add_argument("--only", help="run only the cases whose name contains this string")
+    parser.add_argument("--save", metavar="PATH", help="write the results to a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown before failing (default 0.15)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.quick, args.repeat, args.only)
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_results(results, baseline)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2))
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import random
+from enum import Enum
+from typing import Mapping, Optional, Sequence, Union
+
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.patient import Patient
+from medical_simulator.utils.sampling import poisson
+from medical_simulator.utils.utils import generate_random_patient
+
+
+DEFAULT_ARRIVAL_HOURS = range(1, 7)
+
+
+class OverflowPolicy(Enum):
+    """
+    What happens to a patient who arrives while the waiting room is full.
+    """
+    DIVERT = "divert"
+    QUEUE = "queue"
+
+
+def poisson_counts(rates: Sequence[float], rng: random.Random) -> list[int]:
+    """
+    Draws one Poisson count per rate.
+
+    Always uses the pure-Python sampler of `utils/sampling.py`, one uniform
+    draw per count (per 500 expected arrivals), so the counts only depend on
+    the seed, whether or not numpy is installed.
+    """
+    return [poisson(rate, rng) for rate in rates]
+
+
+class ArrivalProcess:
+    """
+    Base class of the processes generating each day's patient arrivals.
+
+    At the start of every day the hospital asks the process for the whole
+    day's schedule, in one call, and turns it into scheduled arrival events.
+    New patients are only drawn when they actually arrive.
+
+    Parameters
+    ----------
+    disease_weights : Mapping[str, float] | None, optional (default=None)
+        Relative frequency of each disease, by name, among new patients
+        (missing diseases get weight 0). Diseases are equally likely when omitted.
+    """
+
+    def __init__(self, disease_weights: Optional[Mapping[str, float]] = None):
+        self.disease_weights = dict(disease_weights) if disease_weights is not None else None
+        self._weights_for: Optional[tuple[int, list[float]]] = None
+
+    def arrival_hours(self, day: int, rng: random.Random) -> list[int]:
+        """
+        Hours of the arrivals of `day`, sorted, one entry per arriving patient.
+        """
+        raise NotImplementedError
+
+    def schedule_day(self, day: int, rng: random.Random) -> list[tuple[int, "ArrivalProcess"]]:
+        """
+        ``(hour, process)`` pairs of the day's arrivals; `process` draws the patient.
+        """
+        return [(hour, self) for hour in self.arrival_hours(day, rng)]
+
+    def draw_patient(self, diseases: list[Disease], rng: Optional[random.Random]) -> Patient:
+        if self.disease_weights is None:
+            return generate_random_patient(diseases, rng)
+        return generate_random_patient(diseases, rng, weights=self._cum_weights(diseases))
+
+    def _cum_weights(self, diseases: list[Disease]) -> list[float]:
+        # cached per catalog, which does not change during a run
+        if self._weights_for is None or self._weights_for[0] != id(diseases):
+            total = 0.0
+            cumulative = []
+            for disease in diseases:
+                total += self.disease_weights.get(disease.name, 0.0)
+                cumulative.append(total)
+            if total <= 0:
+                raise ValueError("disease_weights gives no weight to any disease of the catalog")
+            self._weights_for = (id(diseases), cumulative)
+        return self._weights_for[1]
+
+
+class HourlyCoinArrivals(ArrivalProcess):
+    """
+    At most one arrival per hour, each with probability `probability` (the original behaviour).
+
+    Parameters
+    ----------
+    probability : float, optional (default=0.5)
+        Chance of an arrival in each hour of `hours`.
+    hours : Sequence[int], optional (default=range(1, 7))
+        Hours of the day in which patients may arrive.
+    disease_weights : Mapping[str, float] | None, optional (default=None)
+        See `ArrivalProcess`.
+    """
+
+    def __init__(self, probability: float = 0.5, hours: Sequence[int] = DEFAULT_ARRIVAL_HOURS, disease_weights: Optional[Mapping[str, float]] = None):
+        super().__init__(disease_weights)
+        self.probability = probability
+        self.hours = tuple(hours)
+
+    def arrival_hours(self, day: int, rng: random.Random) -> list[int]:
+        return [hour for hour in self.hours if rng.random() < self.probability]
+
+
+class PoissonArrivals(ArrivalProcess):
+    """
+    Poisson arrivals, homogeneous or with a different rate for every hour.
+
+    The counts of all hours are drawn at once (see `poisson_counts`).
+
+    Parameters
+    ----------
+    rate : float | Mapping[int, float]
+        Expected arrivals per hour: one rate for every hour of `hours`, or a
+        rate per hour of the day (non-homogeneous process; hours not listed get 0).
+    hours : Sequence[int], optional (default=range(1, 7))
+        Hours of the day in which patients may arrive, for a scalar `rate`.
+    disease_weights : Mapping[str, float] | None, optional (default=None)
+        See `ArrivalProcess`.
+    """
+
+    def __init__(self, rate: Union[float, Mapping[int, float]], hours: Sequence[int] = DEFAULT_ARRIVAL_HOURS, disease_weights: Optional[Mapping[str, float]] = None):
+        super().__init__(disease_weights)
+        if isinstance(rate, Mapping):
+            self.hours = tuple(sorted(rate))
+            self.rates = [float(rate[h]) for h in self.hours]
+        else:
+            self.hours = tuple(hours)
+            self.rates = [float(rate)] * len(self.hours)
+        if any(r < 0 for r in self.rates):
+            raise ValueError("Arrival rates must be non-negative")
+
+    def arrival_hours(self, day: int, rng: random.Random) -> list[int]:
+        hours = []
+        for hour, count in zip(self.hours, poisson_counts(self.rates, rng)):
+            hours.extend([hour] * count)
+        return hours
+
+
+class SurgeArrivals(ArrivalProcess):
+    """
+    A base process plus extra Poisson arrivals during a surge (e.g. a mass-casualty event).
+
+    Parameters
+    ----------
+    base : ArrivalProcess
+        Arrivals outside of the surge, which continue during it.
+    rate : float
+        Expected extra arrivals per hour during the surge.
+    hours : Sequence[int]
+        Hours of the day the surge lasts.
+    days : Sequence[int] | None, optional (default=None)
+        Days with a surge; every day when omitted.
+    disease_weights : Mapping[str, float] | None, optional (default=None)
+        Disease mix of the surge patients (e.g. an outbreak); the base mix is
+        not affected. Diseases are equally likely when omitted.
+    """
+
+    def __init__(
+        self,
+        base: ArrivalProcess,
+        rate: float,
+        hours: Sequence[int],
+        days: Optional[Sequence[int]] = None,
+        disease_weights: Optional[Mapping[str, float]] = None
+    ):
+        super().__init__(disease_weights)
+        self.base = base
+        self.surge = PoissonArrivals(rate, hours, disease_weights)
+        self.days = set(days) if days is not None else None
+
+    def arrival_hours(self, day: int, rng: random.Random) -> list[int]:
+        return [hour for hour, _ in self.schedule_day(day, rng)]
+
+    def schedule_day(self, day: int, rng: random.Random) -> list[tuple[int, ArrivalProcess]]:
+        schedule = self.base.schedule_day(day, rng)
+        if self.days is None or day in self.days:
+            schedule += self.surge.schedule_day(day, rng)
+            # stable: base arrivals stay first within an hour
+            schedule.sort(key=lambda entry: entry[0])
+        return schedule
@@ -0,0 +1,285 @@
+import multiprocessing
+import statistics
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from medical_simulator.core.case_result import CaseResult
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.engine import SimulationEngine
+from medical_simulator.core.events import EventKind
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.policies import Policy
+from medical_simulator.core.result_sink import ResultSink
+from medical_simulator.core.scoring import ScoringRules
+from medical_simulator.core.treatment import Treatment
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+from medical_simulator.utils.catalog import load_catalog
+from medical_simulator.utils.utils import build_treatments
+
+
+DEFAULT_DISEASES_PATH = Path(__file__).parent.parent / "data" / "diseases.json"
+
+
+class RunResult:
+    """
+    Outcome of one complete simulation run.
+
+    Attributes
+    ----------
+    seed : int
+        Seed the run was started from.
+    total_score : int
+        Final score of the run.
+    case_results : list[CaseResult]
+        Every case closed during the run, in order.
+    """
+    def __init__(self, seed: int, total_score: int, case_results: list[CaseResult]):
+        self.seed = seed
+        self.total_score = total_score
+        self.case_results = case_results
+
+
+class BatchSummary:
+    """
+    Aggregate statistics of the total scores of a batch of runs.
+
+    Attributes
+    ----------
+    n_runs : int
+        Number of runs aggregated.
+    mean : float
+        Mean total score.
+    variance : float
+        Sample variance of the total score (0 for a single run).
+    std : float
+        Sample standard deviation of the total score.
+    minimum, maximum : int
+        Extreme total scores.
+    percentiles : dict[int, float]
+        Total score at the 5th, 25th, 50th, 75th and 95th percentiles.
+    """
+
+    PERCENTILES = (5, 25, 50, 75, 95)
+
+    def __init__(self, scores: Sequence[int]):
+        if not scores:
+            raise ValueError("Cannot summarize an empty batch")
+
+        self.n_runs = len(scores)
+        self.mean = statistics.fmean(scores)
+        self.variance = statistics.variance(scores) if len(scores) > 1 else 0.0
+        self.std = self.variance ** 0.5
+        self.minimum = min(scores)
+        self.maximum = max(scores)
+
+        if len(scores) > 1:
+            cuts = statistics.quantiles(scores, n=100, method="inclusive")
+            self.percentiles = {p: cuts[p - 1] for p in self.PERCENTILES}
+        else:
+            self.percentiles = {p: float(scores[0]) for p in self.PERCENTILES}
+
+    def __repr__(self) -> str:
+        return (f"BatchSummary(n_runs={self.n_runs}, mean={self.mean:.2f}, std={self.std:.2f}, "
+                f"min={self.minimum}, median={self.percentiles[50]}, max={self.maximum})")
+
+
+class BatchResult:
+    """
+    Runs of a batch together with their summary.
+
+    Attributes
+    ----------
+    runs : list[RunResult]
+        Results ordered by seed position.
+    summary : BatchSummary
+        Aggregate statistics of the total scores.
+    """
+    def __init__(self, runs: list[RunResult]):
+        self.runs = runs
+        self.summary = BatchSummary([r.total_score for r in runs])
+
+
+# -------------------------
+# Single run
+# -------------------------
+
+def run_simulation(
+    seed: int,
+    policy: Policy,
+    diseases: list[Disease],
+    max_days: int = 5,
+    capacity: int = 4,
+    treatments: Optional[list[Treatment]] = None,
+    scoring: Optional[ScoringRules] = None
+) -> RunResult:
+    """
+    Plays one full simulation with `policy` and returns its result.
+
+    Every random draw of the run comes from a `SimulationRNG` seeded with
+    `seed`, so the same seed always replays the same patients and arrivals;
+    comparing policies on shared seeds gives common random numbers.
+    `treatments` and `scoring` default to `build_treatments()` and the
+    original scoring rules.
+    """
+    hospital = Hospital(
+        clock=Clock(),
+        waiting_room=WaitingRoom(capacity),
+        diseases=diseases,
+        treatments=treatments if treatments is not None else build_treatments(),
+        max_days=max_days,
+        rng=SimulationRNG(seed),
+        scoring=scoring
+    )
+    engine = SimulationEngine(hospital)
+    policy.reset(hospital, seed)
+
+    case_results: list[CaseResult] = []
+    observation, events = engine.reset()
+
+    while not engine.done:
+        observation, events = engine.step(policy.act(observation))
+        for event in events:
+            if event.kind is EventKind.DAY_ENDED:
+                case_results.extend(event.data["results"])
+
+    return RunResult(seed, hospital.total_score, case_results)
+
+
+# -------------------------
+# Worker process state
+# -------------------------
+
+_worker_diseases: Optional[list[Disease]] = None
+_worker_config: dict = {}
+
+
+def _init_worker(diseases_path: str, policy: Policy, max_days: int, capacity: int) -> None:
+    global _worker_diseases, _worker_config
+    # forked workers find the catalog already loaded by the parent, spawned ones unpickle the cache
+    _worker_diseases = load_catalog(diseases_path)
+    _worker_config = {"policy": policy, "max_days": max_days, "capacity": capacity}
+
+
+def _run_in_worker(seed: int) -> RunResult:
+    return run_simulation(
+        seed,
+        _worker_config["policy"],
+        _worker_diseases,
+        max_days=_worker_config["max_days"],
+        capacity=_worker_config["capacity"]
+    )
+
+
+# -------------------------
+# Batch entry points
+# -------------------------
+
+def iter_batch(
+    n_runs: int,
+    policy: Policy,
+    seeds: Optional[Sequence[int]] = None,
+    workers: Optional[int] = None,
+    max_days: int = 5,
+    capacity: int = 4,
+    diseases_path: Optional[str] = None,
+    chunksize: Optional[int] = None,
+    sink: Optional[ResultSink] = None
+) -> Iterator[RunResult]:
+    """
+    Runs `n_runs` independent simulations and yields each `RunResult` as soon as it completes.
+
+    Runs are fanned out over a process pool of `workers` processes (all CPU
+    cores by default); each worker loads the disease catalog once. With
+    ``workers=1`` everything runs in the calling process. Results arrive in
+    completion order, not in seed order.
+
+    Parameters
+    ----------
+    n_runs : int
+        Number of simulations to run.
+    policy : Policy
+        Automated doctor playing every run; it is copied into each worker.
+    seeds : Sequence[int] | None, optional (default=None)
+        One seed per run; defaults to ``range(n_runs)``.
+    workers : int | None, optional (default=None)
+        Number of worker processes; defaults to the number of CPU cores.
+    max_days, capacity : int
+        Simulation length and waiting-room capacity of every run.
+    diseases_path : str | None, optional (default=None)
+        Disease catalog to load; defaults to the bundled ``data/diseases.json``.
+    chunksize : int | None, optional (default=None)
+        Runs handed to a worker at a time; by default tuned from `n_runs` and `workers`.
+    sink : ResultSink | None, optional (default=None)
+        If given, the case results of every run are written to it (with the
+        run seed as run id) and not kept in the yielded `RunResult`s, so that
+        memory stays flat however many runs are made.
+    """
+    for result in _iter_runs(n_runs, policy, seeds, workers, max_days, capacity, diseases_path, chunksize):
+        if sink is not None:
+            sink.write_many(result.seed, result.case_results)
+            result.case_results = []
+        yield result
+
+
+def _iter_runs(
+    n_runs: int,
+    policy: Policy,
+    seeds: Optional[Sequence[int]],
+    workers: Optional[int],
+    max_days: int,
+    capacity: int,
+    diseases_path: Optional[str],
+    chunksize: Optional[int]
+) -> Iterator[RunResult]:
+    seeds = list(range(n_runs)) if seeds is None else list(seeds)
+    if len(seeds) != n_runs:
+        raise ValueError(f"Expected {n_runs} seeds, got {len(seeds)}")
+
+    diseases_path = str(diseases_path or DEFAULT_DISEASES_PATH)
+    workers = workers or multiprocessing.cpu_count()
+
+    # validates the catalog (failing fast, before any worker starts) and warms the cache
+    diseases = load_catalog(diseases_path)
+
+    if workers <= 1 or n_runs <= 1:
+        for seed in seeds:
+            yield run_simulation(seed, policy, diseases, max_days=max_days, capacity=capacity)
+        return
+
+    if chunksize is None:
+        # a few chunks per worker keeps the pool busy without per-run IPC overhead
+        chunksize = max(1, n_runs // (workers * 4))
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(diseases_path, policy, max_days, capacity)) as pool:
+        yield from pool.imap_unordered(_run_in_worker, seeds, chunksize=chunksize)
+
+
+def run_batch(
+    n_runs: int,
+    policy: Policy,
+    seeds: Optional[Sequence[int]] = None,
+    workers: Optional[int] = None,
+    max_days: int = 5,
+    capacity: int = 4,
+    diseases_path: Optional[str] = None,
+    sink: Optional[ResultSink] = None
+) -> BatchResult:
+    """
+    Runs a batch of simulations in parallel and aggregates their scores.
+
+    See `iter_batch` for the parameters. The returned runs are ordered like
+    `seeds`; a seed listed twice is run twice.
+    """
+    seeds = list(range(n_runs)) if seeds is None else list(seeds)
+    # positions of each seed, the first one last: runs of a repeated seed are
+    # identical, so any of its positions fits any of its results
+    positions: dict[int, list[int]] = {}
+    for i in reversed(range(len(seeds))):
+        positions.setdefault(seeds[i], []).append(i)
+
+    runs: list[Optional[RunResult]] = [None] * len(seeds)
+    for result in iter_batch(n_runs, policy, seeds, workers, max_days, capacity, diseases_path, sink=sink):
+        runs[positions[result.seed].pop()] = result
+    return BatchResult(runs)
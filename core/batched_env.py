@@ -0,0 +1,308 @@
+import itertools
+from typing import Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("BatchedEnv requires numpy: pip install numpy") from e
+
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.engine import Action, SimulationEngine
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.treatment import TestType, Treatment
+from medical_simulator.core.vocabulary import Vocabulary
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG, derive_seed
+from medical_simulator.utils.utils import build_treatments
+
+
+class BatchedEnv:
+    """
+    Gym-style environment over `n_envs` independent hospitals.
+
+    Each environment is a full `SimulationEngine` episode of `max_days` days.
+    A step applies one action to each engine in turn, in a plain Python
+    loop: the simulation itself is not vectorized, only its inputs and
+    outputs are batched. Observations are dicts of stacked NumPy arrays with one row per
+    environment and one column per waiting-room slot (slot ``p`` is the
+    ``p``-th patient in waiting-room order):
+
+    ==============  =======================  ==========================================
+    key             shape                    content
+    ==============  =======================  ==========================================
+    present         (n_envs, capacity)       True where the slot holds a patient
+    health          (n_envs, capacity)       current health (0 for empty slots)
+    time_elapsed    (n_envs, capacity)       hours since arrival
+    symptoms        (n_envs, capacity, S)    visible symptoms, multi-hot over `symptom_names`
+    findings        (n_envs, capacity, F)    discovered findings, multi-hot over `finding_names`
+    tests_done      (n_envs, capacity, K)    tests performed, in `TestType` order
+    vitals          (n_envs, capacity, 2)    temperature and systolic BP, 0 until measured
+    day, hour       (n_envs,)                clock of each environment
+    ==============  =======================  ==========================================
+
+    Actions are integers in ``range(n_actions)``: ``0`` waits one hour, ``1``
+    ends the day, and for slot ``p`` the block starting at
+    ``2 + p * (n_treatments + n_diseases)`` performs each treatment, then
+    guesses each disease. Actions on empty slots are invalid and wait one
+    hour instead; `action_mask` tells which actions are valid.
+
+    Rewards are the scores of the cases closed during the step, as computed
+    by `Hospital.discharge_patient`, `unresolved_patient` and `patient_died`,
+    so the rewards of an episode add up to its total score. Finished
+    environments are reset automatically with a seed derived from their
+    original one.
+
+    Requires `numpy`.
+
+    Parameters
+    ----------
+    n_envs : int
+        Number of hospitals stepped together.
+    diseases : list[Disease]
+        Disease catalog, shared by every environment (read-only).
+    treatments : list[Treatment] | None, optional (default=None)
+        Available tests and treatments; `build_treatments()` when omitted.
+    max_days : int, optional (default=5)
+        Length of an episode in days.
+    capacity : int, optional (default=4)
+        Size of each waiting room, i.e. number of observation slots.
+    """
+
+    def __init__(
+        self,
+        n_envs: int,
+        diseases: list[Disease],
+        treatments: Optional[list[Treatment]] = None,
+        max_days: int = 5,
+        capacity: int = 4
+    ):
+        if n_envs < 1:
+            raise ValueError("n_envs must be at least 1")
+
+        self.n_envs = n_envs
+        self.diseases = diseases
+        self.treatments = treatments if treatments is not None else build_treatments()
+        self.max_days = max_days
+        self.capacity = capacity
+
+        self.n_treatments = len(self.treatments)
+        self.n_diseases = len(diseases)
+        self._block = self.n_treatments + self.n_diseases
+        self.n_actions = 2 + capacity * self._block
+
+        self._compile_catalog()
+
+        self.engines: list[SimulationEngine] = []
+        self._seeds = list(range(n_envs))
+        self._episodes = [0] * n_envs
+        self._scores = [0] * n_envs
+
+    # -------------------------
+    # Catalog encoding
+    # -------------------------
+
+    def _compile_catalog(self) -> None:
+        symptoms = self.diseases[0].symptom_vocabulary if self.diseases else Vocabulary()
+        if any(d.symptom_vocabulary is not symptoms for d in self.diseases):
+            raise ValueError("Every disease must share the same symptom vocabulary (load them as one catalog)")
+
+        findings = Vocabulary()
+
+        self._disease_index = {}
+        # symptom ids visible at each symptom cursor, and finding ids of each test, per disease
+        self._visible_ids: list[list[np.ndarray]] = []
+        self._finding_ids: list[dict[TestType, np.ndarray]] = []
+        self._vitals = np.zeros((len(self.diseases), 2), dtype=np.float32)
+
+        for i, disease in enumerate(self.diseases):
+            self._disease_index[disease] = i
+            self._visible_ids.append([
+                np.array([symptoms.get_id(name) for name in prefix], dtype=np.intp)
+                for prefix in disease.visible_prefixes
+            ])
+
+            self._finding_ids.append({
+                test: np.array([findings.intern(f) for f in result], dtype=np.intp)
+                for test, result in disease.test_results.items()
+            })
+            self._vitals[i] = (disease.base_temperature, disease.base_systolic_bp)
+
+        self.symptom_names = list(symptoms.names)
+        self.finding_names = list(findings.names)
+        self._test_bits = [(k, Patient.TEST_BITS[test]) for k, test in enumerate(TestType)]
+
+    # -------------------------
+    # Episodes
+    # -------------------------
+
+    def reset(self, seeds: Optional[Sequence[int]] = None) -> dict[str, np.ndarray]:
+        """
+        Starts a new episode in every environment; ``seeds[i]`` seeds environment ``i``.
+
+        Seeds default to ``0 .. n_envs - 1``.
+        """
+        seeds = list(range(self.n_envs)) if seeds is None else list(seeds)
+        if len(seeds) != self.n_envs:
+            raise ValueError(f"Expected {self.n_envs} seeds, got {len(seeds)}")
+
+        self._seeds = seeds
+        self._episodes = [0] * self.n_envs
+        self.engines = [self._start(seed) for seed in seeds]
+        self._scores = [0] * self.n_envs
+        return self.observe()
+
+    def _start(self, seed: int) -> SimulationEngine:
+        hospital = Hospital(
+            clock=Clock(),
+            waiting_room=WaitingRoom(self.capacity),
+            diseases=self.diseases,
+            treatments=self.treatments,
+            max_days=self.max_days,
+            rng=SimulationRNG(seed)
+        )
+        engine = SimulationEngine(hospital)
+        engine.reset()
+        hospital.pop_events()
+        return engine
+
+    def step(self, actions: Sequence[int]) -> tuple[dict[str, np.ndarray], np.ndarray, np.ndarray, dict[str, np.ndarray]]:
+        """
+        Applies one action per environment.
+
+        Returns
+        -------
+        observation : dict[str, np.ndarray]
+            Stacked observations; for environments that just finished, the
+            first observation of their next episode.
+        rewards : np.ndarray[float32]
+            Score gained by each environment during the step.
+        dones : np.ndarray[bool]
+            True for environments whose episode ended during the step.
+        info : dict[str, np.ndarray]
+            ``final_score`` (total score of finished episodes, 0 elsewhere) and
+            ``invalid`` (True where the action was invalid and replaced by a wait).
+        """
+        if not self.engines:
+            raise RuntimeError("Call reset() before step().")
+
+        actions = np.asarray(actions)
+        if actions.shape != (self.n_envs,):
+            raise ValueError(f"Expected {self.n_envs} actions, got shape {actions.shape}")
+
+        rewards = np.zeros(self.n_envs, dtype=np.float32)
+        dones = np.zeros(self.n_envs, dtype=bool)
+        final_scores = np.zeros(self.n_envs, dtype=np.int64)
+        invalid = np.zeros(self.n_envs, dtype=bool)
+
+        for i, engine in enumerate(self.engines):
+            action = self.decode(int(actions[i]), engine.hospital)
+            if action is None:
+                invalid[i] = True
+                action = Action.wait(1)
+
+            engine.apply(action)
+            hospital = engine.hospital
+
+            score = hospital.total_score + sum(r.score for r in hospital.daily_case_results)
+            rewards[i] = score - self._scores[i]
+            self._scores[i] = score
+
+            if engine.done:
+                dones[i] = True
+                final_scores[i] = hospital.total_score
+                self._episodes[i] += 1
+                self.engines[i] = self._start(derive_seed(self._seeds[i], ("episode", self._episodes[i])))
+                self._scores[i] = 0
+
+        return self.observe(), rewards, dones, {"final_score": final_scores, "invalid": invalid}
+
+    # -------------------------
+    # Actions
+    # -------------------------
+
+    def decode(self, action: int, hospital: Hospital) -> Optional[Action]:
+        """
+        Translates an integer action into an `Action`, or None if it is invalid.
+        """
+        if action == 0:
+            return Action.wait(1)
+        if action == 1:
+            return Action.end_day()
+        if not 2 <= action < self.n_actions:
+            return None
+
+        slot, choice = divmod(action - 2, self._block)
+        if slot >= len(hospital.waiting_room):
+            return None
+        if choice < self.n_treatments:
+            return Action.perform(slot, choice)
+        return Action.guess_disease(slot, self.diseases[choice - self.n_treatments].name)
+
+    def action_mask(self) -> np.ndarray:
+        """
+        Boolean array of shape (n_envs, n_actions), True for valid actions.
+        """
+        mask = np.zeros((self.n_envs, self.n_actions), dtype=bool)
+        mask[:, :2] = True
+        for i, engine in enumerate(self.engines):
+            occupied = len(engine.hospital.waiting_room)
+            mask[i, 2:2 + occupied * self._block] = True
+        return mask
+
+    # -------------------------
+    # Observations
+    # -------------------------
+
+    def observe(self) -> dict[str, np.ndarray]:
+        n, c = self.n_envs, self.capacity
+
+        present = np.zeros((n, c), dtype=bool)
+        health = np.zeros((n, c), dtype=np.float32)
+        time_elapsed = np.zeros((n, c), dtype=np.int32)
+        symptoms = np.zeros((n, c, len(self.symptom_names)), dtype=np.uint8)
+        findings = np.zeros((n, c, len(self.finding_names)), dtype=np.uint8)
+        tests_done = np.zeros((n, c, len(self._test_bits)), dtype=bool)
+        vitals = np.zeros((n, c, 2), dtype=np.float32)
+        day = np.zeros(n, dtype=np.int32)
+        hour = np.zeros(n, dtype=np.int32)
+
+        vitals_bit = Patient.TEST_BITS[TestType.VITALS]
+
+        for i, engine in enumerate(self.engines):
+            hospital = engine.hospital
+            hospital.sync_all()
+            day[i] = hospital.clock.day
+            hour[i] = hospital.clock.hour
+
+            for p, patient in enumerate(itertools.islice(hospital.waiting_room.patients, c)):
+                d = self._disease_index[patient.disease]
+                present[i, p] = True
+                health[i, p] = patient.health
+                time_elapsed[i, p] = patient.time_elapsed
+                symptoms[i, p, self._visible_ids[d][patient._symptom_cursor]] = 1
+
+                done = patient._tests_done
+                if not done:
+                    continue
+                for k, bit in self._test_bits:
+                    if done & bit:
+                        tests_done[i, p, k] = True
+                for test, ids in self._finding_ids[d].items():
+                    if done & Patient.TEST_BITS[test]:
+                        findings[i, p, ids] = 1
+                if done & vitals_bit:
+                    vitals[i, p] = self._vitals[d]
+
+        return {
+            "present": present,
+            "health": health,
+            "time_elapsed": time_elapsed,
+            "symptoms": symptoms,
+            "findings": findings,
+            "tests_done": tests_done,
+            "vitals": vitals,
+            "day": day,
+            "hour": hour,
+        }
@@ -1,3 +1,16 @@
+from enum import Enum
+from typing import Optional, Union
+
+
+class Outcome(Enum):
+    """
+    Possible outcomes of a patient's case.
+    """
+    DISCHARGED = "Discharged"
+    NOT_DISCHARGED = "Not discharged"
+    DIED = "Died"
+
+
 class CaseResult:
     """
     Represents the result of a patient's case in the simulation, including outcome, score, and notes.
@@ -6,15 +19,53 @@ class CaseResult:
     ----------
     patient_name : str
         The name of the patient.
-    outcome : str
-        Outcome of the case (e.g., "Discharged", "Not discharged", "Died").
+    outcome : Outcome
+        Outcome of the case. Strings such as "Discharged" are converted to the matching `Outcome`.
     score : int
         Points earned or lost for this case.
+    health : int | None, optional (default=None)
+        Health of the patient when the case was closed.
+    disease : str | None, optional (default=None)
+        Name of the patient's disease.
+    day : int | None, optional (default=None)
+        Simulation day at which the case was closed.
+    hour : int | None, optional (default=None)
+        Hour of the day at which the case was closed.
+    actions : tuple[str, ...], optional (default=())
+        Names of the tests and treatments performed on the patient, in order.
+
+    Attributes
+    ----------
     notes : str
-        Optional notes or comments about the case.
+        Comment about the case, derived from the outcome.
     """
-    def __init__(self, patient_name: str, outcome: str, score: int, notes: str = ""):
+
+    __slots__ = ("patient_name", "outcome", "score", "health", "disease", "day", "hour", "actions")
+
+    def __init__(
+        self,
+        patient_name: str,
+        outcome: Union[Outcome, str],
+        score: int,
+        health: Optional[int] = None,
+        disease: Optional[str] = None,
+        day: Optional[int] = None,
+        hour: Optional[int] = None,
+        actions: tuple[str, ...] = ()
+    ):
         self.patient_name = patient_name
-        self.outcome = outcome
+        self.outcome = Outcome(outcome)
         self.score = score
-        self.notes = notes
+        self.health = health
+        self.disease = disease
+        self.day = day
+        self.hour = hour
+        self.actions = actions
+
+    @property
+    def notes(self) -> str:
+        if self.outcome is Outcome.DISCHARGED:
+            return f"Health at discharge: {self.health}"
+        if self.outcome is Outcome.DIED:
+            return "Critical deterioration"
+        return "Patient still under observation"
@@ -9,6 +9,10 @@ class Clock:
     hour : int
         The current hour within the day (0–12).
     """
+
+    # hours in a working day
+    DAY_LENGTH = 12
+
     def __init__(self):
         self.day = 0
         self.hour = 0
@@ -20,5 +24,8 @@ class Clock:
     def advance(self, hours: int) -> None:
         self.hour += hours
 
+    def hours_left(self) -> int:
+        return max(0, self.DAY_LENGTH - self.hour)
+
     def is_day_over(self) -> bool:
-        return self.hour >= 12
\ No newline at end of file
+        return self.hour >= self.DAY_LENGTH
\ No newline at end of file
@@ -0,0 +1,217 @@
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.treatment import TestType
+
+
+class DiagnosisIndex:
+    """
+    Inverted index of a disease catalog, mapping evidence to the diseases it fits.
+
+    Built once per catalog and shared (read-only) by any number of
+    `DifferentialDiagnosis` trackers, which use it to narrow down the diseases
+    consistent with what has been observed of a patient.
+
+    Parameters
+    ----------
+    diseases : list[Disease]
+        Disease catalog; diseases are referred to by their index in this list.
+    vitals_tolerance : tuple[float, float], optional (default=(0.0, 0.0))
+        Accepted distance between measured and expected temperature and systolic BP.
+
+    Attributes
+    ----------
+    by_symptom : dict[str, tuple[tuple[int, ...], tuple[frozenset[int], ...]]]
+        For each symptom, the distinct hours at which it appears in some
+        timeline, in increasing order, and for each of those hours the diseases
+        already showing it by then (see `showing`).
+    by_result : dict[TestType, dict[frozenset[str], frozenset[int]]]
+        Diseases producing each exact set of findings, per test.
+    onsets_at : dict[int, list[tuple[int, str]]]
+        ``(disease, symptom)`` pairs revealed at each hour.
+    """
+
+    def __init__(self, diseases: list[Disease], vitals_tolerance: tuple[float, float] = (0.0, 0.0)):
+        self.diseases = diseases
+        self.vitals_tolerance = vitals_tolerance
+
+        # symptom -> onset hour -> diseases
+        onsets: dict[str, dict[int, set[int]]] = {}
+        by_result: dict[TestType, dict[frozenset[str], set[int]]] = {
+            TestType.BLOOD: {}, TestType.XRAY: {}, TestType.ECG: {}
+        }
+        self.onsets_at: dict[int, list[tuple[int, str]]] = {}
+
+        for i, disease in enumerate(diseases):
+            vocabulary = disease.symptom_vocabulary
+            for hour, id_ in disease.symptom_onsets:
+                name = vocabulary[id_]
+                onsets.setdefault(name, {}).setdefault(hour, set()).add(i)
+                self.onsets_at.setdefault(hour, []).append((i, name))
+
+            for test, result in disease.test_results.items():
+                by_result[test].setdefault(frozenset(result), set()).add(i)
+
+        self.by_symptom: dict[str, tuple[tuple[int, ...], tuple[frozenset[int], ...]]] = {}
+        for name, by_hour in onsets.items():
+            hours = tuple(sorted(by_hour))
+            shown: list[frozenset[int]] = []
+            for hour in hours:
+                shown.append(frozenset(by_hour[hour]).union(*shown[-1:]))
+            self.by_symptom[name] = (hours, tuple(shown))
+        self.by_result = {test: {k: frozenset(v) for k, v in table.items()} for test, table in by_result.items()}
+
+        # vitals are matched by range: sorted values with the disease of each
+        self._temperatures = sorted((d.base_temperature, i) for i, d in enumerate(diseases))
+        self._pressures = sorted((d.base_systolic_bp, i) for i, d in enumerate(diseases))
+
+    def showing(self, symptom: str, hour: int) -> frozenset[int]:
+        """
+        Diseases whose timeline shows `symptom` by `hour` (from an onset at or before it).
+        """
+        entry = self.by_symptom.get(symptom)
+        if entry is None:
+            return frozenset()
+        hours, shown = entry
+        k = bisect_right(hours, hour)
+        return shown[k - 1] if k else frozenset()
+
+    def names(self, candidates: Optional[set[int]]) -> list[str]:
+        if candidates is None:
+            return [d.name for d in self.diseases]
+        return [self.diseases[i].name for i in sorted(candidates)]
+
+    def matching_vitals(self, temperature: float, systolic_bp: float) -> set[int]:
+        t_tol, bp_tol = self.vitals_tolerance
+        return self._in_range(self._temperatures, temperature, t_tol) & self._in_range(self._pressures, systolic_bp, bp_tol)
+
+    @staticmethod
+    def _in_range(values: list[tuple[float, int]], value: float, tolerance: float) -> set[int]:
+        low = bisect_left(values, (value - tolerance, -1))
+        high = bisect_right(values, (value + tolerance, len(values)))
+        return {i for _, i in values[low:high]}
+
+    def tracker(self) -> "DifferentialDiagnosis":
+        return DifferentialDiagnosis(self)
+
+
+class DifferentialDiagnosis:
+    """
+    Diseases still consistent with the evidence gathered on one patient.
+
+    Evidence is folded in incrementally: each call only looks at what is new
+    since the previous one (newly visible symptoms, newly performed tests,
+    newly elapsed hours), so keeping a differential up to date costs time
+    proportional to the new evidence, not to the catalog size.
+
+    Parameters
+    ----------
+    index : DiagnosisIndex
+        Index of the catalog the patient's disease comes from.
+
+    Attributes
+    ----------
+    candidates : set[int] | None
+        Indices of the consistent diseases; None while nothing rules any out.
+    """
+
+    def __init__(self, index: DiagnosisIndex):
+        self.index = index
+        self.candidates: Optional[set[int]] = None
+        self._symptoms: set[str] = set()
+        self._tests: set[TestType] = set()
+        self._checked_hour = -1
+
+    # -------------------------
+    # Evidence
+    # -------------------------
+
+    def _restrict(self, diseases: "set[int] | frozenset[int]") -> None:
+        if self.candidates is None:
+            self.candidates = set(diseases)
+        else:
+            self.candidates &= diseases
+
+    def add_symptoms(self, names: "tuple[str, ...] | list[str]", hour: int) -> None:
+        """
+        Keeps the diseases that show every newly visible symptom by `hour`.
+
+        `hour` is the patient's `time_elapsed` when the symptoms are seen: a
+        disease whose onset of one of them comes later is ruled out.
+        """
+        for name in names:
+            if name not in self._symptoms:
+                self._symptoms.add(name)
+                self._restrict(self.index.showing(name, hour))
+
+    def add_test_result(self, test_type: TestType, findings) -> None:
+        """
+        Keeps the diseases producing exactly these findings (or vital signs).
+        """
+        if test_type in self._tests:
+            return
+        self._tests.add(test_type)
+
+        if test_type is TestType.VITALS:
+            self._restrict(self.index.matching_vitals(findings["temperature"], findings["systolic_bp"]))
+        else:
+            self._restrict(self.index.by_result[test_type].get(frozenset(findings), frozenset()))
+
+    def advance_to(self, revealed_until: int) -> None:
+        """
+        Drops the diseases that would have shown a symptom, missing so far, by `revealed_until`.
+
+        Together with `add_symptoms`, this keeps exactly the diseases whose
+        visible symptoms at that hour (`Disease.visible_prefixes`) are the patient's.
+
+        Must be called after `add_symptoms` with every symptom visible at that hour.
+        """
+        if revealed_until <= self._checked_hour:
+            return
+
+        hours = range(self._checked_hour + 1, revealed_until + 1)
+        self._checked_hour = revealed_until
+        onsets_at = self.index.onsets_at
+        window = sum(len(onsets_at.get(h, ())) for h in hours)
+
+        if self.candidates is not None and len(self.candidates) < window:
+            # few candidates left: check their own timelines instead of the whole window
+            diseases = self.index.diseases
+            for i in list(self.candidates):
+                disease = diseases[i]
+                vocabulary = disease.symptom_vocabulary
+                for hour, id_ in disease.symptom_onsets:
+                    if hour > revealed_until:
+                        break
+                    if hour >= hours.start and vocabulary[id_] not in self._symptoms:
+                        self.candidates.discard(i)
+                        break
+            return
+
+        if self.candidates is None:
+            self.candidates = set(range(len(self.index.diseases)))
+        for h in hours:
+            for i, name in onsets_at.get(h, ()):
+                if name not in self._symptoms:
+                    self.candidates.discard(i)
+
+    def update(self, patient: Patient) -> list[str]:
+        """
+        Folds in everything new about `patient` and returns the consistent disease names.
+        """
+        self.add_symptoms(patient.visible_symptoms, patient.time_elapsed)
+
+        for test in TestType:
+            if test not in self._tests and patient.has_done_test(test):
+                if test is TestType.VITALS:
+                    self.add_test_result(test, patient.vital_signs)
+                else:
+                    self.add_test_result(test, patient.discovered_findings(test))
+
+        # symptoms are revealed on the first time step after arrival
+        if patient.time_elapsed > 0:
+            self.advance_to(patient.time_elapsed)
+
+        return self.index.names(self.candidates)
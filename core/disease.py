@@ -1,4 +1,11 @@
 
+import math
+from typing import Optional
+
+from medical_simulator.core.treatment import TestType
+from medical_simulator.core.vocabulary import Vocabulary
+
+
 class Disease:
 
     """
@@ -26,6 +33,22 @@ class Disease:
         Min and max initial health for a patient with this disease.
     correct_treatments : list[str]
         List of treatment names considered effective for this disease.
+    symptom_vocabulary : Vocabulary
+        Vocabulary interning symptom names; shared by every disease of a catalog.
+    symptom_onsets : tuple[tuple[int, int], ...]
+        ``(from_hour, symptom_id)`` of each distinct symptom, sorted by hour
+        and then by timeline order.
+    reveal_hours : tuple[int, ...]
+        Distinct hours at which new symptoms appear, in increasing order.
+    reveal_groups : tuple[tuple[str, ...], ...]
+        Interned names of the symptoms that appear at each of `reveal_hours`.
+    visible_prefixes : tuple[tuple[str, ...], ...]
+        Symptoms visible once the first ``k`` reveal groups are revealed, for each ``k``.
+    decay_distribution : tuple[tuple[int, ...], tuple[float, ...]]
+        Possible hourly health drops of a patient and their probabilities.
+    test_results : dict[TestType, tuple[str, ...]]
+        Findings of the blood test, X-ray and ECG, computed once and shared by
+        every patient (a normal result when the disease has no findings).
     """
 
     def __init__(
@@ -39,7 +62,8 @@ class Disease:
         base_systolic_bp: float,
         severity: float,
         initial_health_range: tuple[int, int],
-        correct_treatments: list[str]
+        correct_treatments: list[str],
+        symptom_vocabulary: Optional[Vocabulary] = None
     ):
         self.name = name
         self.symptoms_timeline = symptoms_timeline
@@ -52,6 +76,95 @@ class Disease:
         self.initial_health_range = initial_health_range
         self.correct_treatments = correct_treatments
 
+        self.symptom_vocabulary = symptom_vocabulary if symptom_vocabulary is not None else Vocabulary()
+        self._compile_timeline()
+        self._compile_results()
+
+    def _compile_timeline(self) -> None:
+        """
+        Precompiles `symptoms_timeline` into integer-coded reveal groups, so
+        patients can reveal symptoms with a cursor instead of rescanning it.
+        """
+        vocabulary = self.symptom_vocabulary
+        onset: dict[int, int] = {}
+
+        # a symptom listed twice shows up at its earliest hour
+        for symptom in self.symptoms_timeline:
+            id_ = vocabulary.intern(symptom["name"])
+            hour = symptom["from_hour"]
+            if id_ not in onset or hour < onset[id_]:
+                onset[id_] = hour
+
+        # dicts keep timeline order, and sorted() is stable
+        self.symptom_onsets = tuple(sorted(((hour, id_) for id_, hour in onset.items()), key=lambda o: o[0]))
+
+        hours: list[int] = []
+        groups: list[list[str]] = []
+        for hour, id_ in self.symptom_onsets:
+            if not hours or hours[-1] != hour:
+                hours.append(hour)
+                groups.append([])
+            groups[-1].append(vocabulary[id_])
+
+        self.reveal_hours = tuple(hours)
+        self.reveal_groups = tuple(tuple(g) for g in groups)
+
+        prefixes = [()]
+        for group in self.reveal_groups:
+            prefixes.append(prefixes[-1] + group)
+        self.visible_prefixes = tuple(prefixes)
+
+    # result reported by each test when the disease has no findings for it
+    NORMAL_RESULTS = {
+        TestType.BLOOD: "normal blood test",
+        TestType.XRAY: "normal chest x-ray",
+        TestType.ECG: "normal ECG",
+    }
+
+    def _compile_results(self) -> None:
+        """
+        Precomputes the findings of every test as immutable tuples, so tests
+        return them without copying.
+        """
+        findings = {
+            TestType.BLOOD: self.blood_findings,
+            TestType.XRAY: self.xray_findings,
+            TestType.ECG: self.ecg_findings,
+        }
+        self.test_results = {
+            test: tuple(found) or (self.NORMAL_RESULTS[test],)
+            for test, found in findings.items()
+        }
+
+    @property
+    def decay_distribution(self) -> tuple[tuple[int, ...], tuple[float, ...]]:
+        """
+        Distribution of the health lost by a patient in one hour.
+
+        Health is an integer and an hour's decay is ``severity * u`` with
+        ``u ~ U(0.5, 1)``, truncated away, so the patient loses exactly
+        ``ceil(severity * u)`` points: one of a few integers, each with the
+        probability that ``severity * u`` falls in the interval below it.
+        Recomputed whenever `severity` changes.
+        """
+        cached = self.__dict__.get("_decay")
+        if cached is None or cached[0] != self.severity:
+            cached = self._decay = (self.severity, self._compile_decay(self.severity))
+        return cached[1]
+
+    @staticmethod
+    def _compile_decay(severity: float) -> tuple[tuple[int, ...], tuple[float, ...]]:
+        low, high = severity * 0.5, severity
+        if high <= 0:
+            return (0,), (1.0,)
+
+        drops, probabilities = [], []
+        for drop in range(math.floor(low) + 1, math.ceil(high) + 1):
+            p = (min(drop, high) - max(drop - 1, low)) / (high - low)
+            if p > 0:
+                drops.append(drop)
+                probabilities.append(p)
+        return tuple(drops), tuple(probabilities)
 
     def is_correct_treatment(self, treatment_name: str) -> bool:
         return treatment_name in self.correct_treatments
@@ -0,0 +1,213 @@
+from enum import Enum
+from typing import Optional
+
+from medical_simulator.core.events import Event, EventKind
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.patient import Patient
+
+
+class ActionKind(Enum):
+    """
+    Kinds of decisions the doctor can take.
+    """
+    WAIT = "wait"
+    PERFORM = "perform"
+    GUESS = "guess"
+    END_DAY = "end_day"
+
+
+class Action:
+    """
+    A single decision submitted to the engine.
+
+    Use the constructors `wait`, `perform`, `guess` and `end_day` rather than
+    building actions by hand.
+
+    Parameters
+    ----------
+    kind : ActionKind
+        The kind of decision.
+    patient_index : int | None
+        Position of the target patient in the waiting room (0-based).
+    treatment_index : int | None
+        Position of the treatment in `Hospital.treatments` (0-based).
+    guess : str | None
+        Disease name guessed by the doctor.
+    hours : int
+        Hours to wait, for `WAIT` actions.
+    """
+    def __init__(self, kind: ActionKind, patient_index: Optional[int] = None, treatment_index: Optional[int] = None, guess: Optional[str] = None, hours: int = 1):
+        self.kind = kind
+        self.patient_index = patient_index
+        self.treatment_index = treatment_index
+        self.guess = guess
+        self.hours = hours
+
+    @classmethod
+    def wait(cls, hours: int = 1) -> "Action":
+        return cls(ActionKind.WAIT, hours=hours)
+
+    @classmethod
+    def perform(cls, patient_index: int, treatment_index: int) -> "Action":
+        return cls(ActionKind.PERFORM, patient_index=patient_index, treatment_index=treatment_index)
+
+    @classmethod
+    def guess_disease(cls, patient_index: int, guess: str) -> "Action":
+        return cls(ActionKind.GUESS, patient_index=patient_index, guess=guess)
+
+    @classmethod
+    def end_day(cls) -> "Action":
+        return cls(ActionKind.END_DAY)
+
+    def __repr__(self) -> str:
+        return (f"Action({self.kind.value}, patient={self.patient_index}, "
+                f"treatment={self.treatment_index}, guess={self.guess!r}, hours={self.hours})")
+
+
+class PatientObservation:
+    """
+    What the doctor can see about a patient (everything except the disease).
+
+    Parameters
+    ----------
+    patient : Patient
+        The observed patient.
+    patient_id : int | None, optional (default=None)
+        Stable id of the patient in its waiting room.
+    """
+    def __init__(self, patient: Patient, patient_id: Optional[int] = None):
+        self.patient_id = patient_id
+        self.name = patient.name
+        self.sex = patient.sex
+        self.age = patient.age
+        self.health = patient.health
+        self.time_elapsed = patient.time_elapsed
+        self.visible_symptoms = list(patient.visible_symptoms)
+        self.vital_signs = dict(patient.vital_signs)
+        self.blood_findings = list(patient.discovered_blood_findings)
+        self.xray_findings = list(patient.discovered_xray_findings)
+        self.ecg_findings = list(patient.discovered_ecg_findings)
+
+
+class Observation:
+    """
+    Snapshot of the simulation state as seen by the doctor.
+
+    Attributes
+    ----------
+    day : int
+        Current simulation day.
+    hour : int
+        Current hour of the day.
+    total_score : int
+        Score accumulated so far.
+    patients : list[PatientObservation]
+        Patients in the waiting room, in waiting-room order.
+    done : bool
+        True once the last day has ended.
+    """
+    def __init__(self, hospital: Hospital, done: bool):
+        self.day = hospital.clock.day
+        self.hour = hospital.clock.hour
+        self.total_score = hospital.total_score
+        room = hospital.waiting_room
+        self.patients = [PatientObservation(p, room.id_of(p)) for p in room.patients]
+        self.done = done
+
+
+class SimulationEngine:
+    """
+    Headless, I/O-free driver of a `Hospital`.
+
+    The engine takes one `Action` at a time and returns the resulting
+    observation together with the events that happened meanwhile. Days are
+    rolled over automatically once the clock runs out or the doctor ends
+    the day, so callers only ever see `step` and `done`.
+
+    Parameters
+    ----------
+    hospital : Hospital
+        The hospital to drive. Its clock should not have started yet.
+    """
+
+    def __init__(self, hospital: Hospital):
+        self.hospital = hospital
+        self.done = False
+
+    def reset(self) -> tuple[Observation, list[Event]]:
+        """
+        Starts the first day of the simulation.
+        """
+        self.done = False
+        self.hospital.pop_events()
+        self.hospital.start_new_day()
+        return self.observe(), self.hospital.pop_events()
+
+    def observe(self) -> Observation:
+        # looking at the room is what brings its patients up to date
+        self.hospital.sync_all()
+        return Observation(self.hospital, self.done)
+
+    def step(self, action: Action) -> tuple[Observation, list[Event]]:
+        """
+        Applies an action and advances the simulation accordingly.
+
+        Raises
+        ------
+        RuntimeError
+            If the simulation is already over.
+        ValueError
+            If the action references a patient or treatment that does not exist.
+        """
+        events = self.apply(action)
+        return self.observe(), events
+
+    def apply(self, action: Action) -> list[Event]:
+        """
+        Like `step`, without building an `Observation`; returns only the events.
+
+        Raises
+        ------
+        RuntimeError
+            If the simulation is already over.
+        ValueError
+            If the action references a patient or treatment that does not exist.
+        """
+        if self.done:
+            raise RuntimeError("The simulation is over; call reset() to start again.")
+
+        hospital = self.hospital
+        kind = action.kind
+
+        if kind is ActionKind.WAIT:
+            hospital.wait_and_observe(action.hours)
+
+        elif kind is ActionKind.PERFORM:
+            patient = self._patient(action.patient_index)
+            if action.treatment_index is None or not 0 <= action.treatment_index < len(hospital.treatments):
+                raise ValueError(f"Invalid treatment index: {action.treatment_index}")
+            hospital.perform_action(patient, hospital.treatments[action.treatment_index])
+
+        elif kind is ActionKind.GUESS:
+            hospital.guess_disease(self._patient(action.patient_index), action.guess or "")
+
+        if kind is ActionKind.END_DAY or hospital.clock.is_day_over():
+            self._roll_over_day()
+
+        return hospital.pop_events()
+
+    def _patient(self, index: Optional[int]) -> Patient:
+        patient = self.hospital.waiting_room.get_patient(index) if index is not None else None
+        if patient is None:
+            raise ValueError(f"Invalid patient index: {index}")
+        return patient
+
+    def _roll_over_day(self) -> None:
+        hospital = self.hospital
+        hospital.end_day()
+
+        if hospital.is_simulation_over():
+            self.done = True
+            hospital.emit(EventKind.SIMULATION_ENDED, total_score=hospital.total_score)
+        else:
+            hospital.start_new_day()
@@ -0,0 +1,558 @@
+import hashlib
+import json
+import struct
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Union
+
+from medical_simulator.core.arrivals import (
+    ArrivalProcess, HourlyCoinArrivals, OverflowPolicy, PoissonArrivals, SurgeArrivals
+)
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.engine import Action, ActionKind, SimulationEngine
+from medical_simulator.core.events import Event, EventKind
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.scoring import ScoringRules
+from medical_simulator.core.treatment import TestType, Treatment
+from medical_simulator.core.waiting_room import AcuityScore, WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+
+
+LOG_MAGIC = b"MSEL"
+# bump whenever a record layout or one of the code tables below changes
+# (2: event health is taken when the event happens, not when it is logged;
+#  3: the run parameters are a JSON block, with the whole hospital configuration;
+#  4: wait hours, event days and event hours are 32-bit)
+LOG_VERSION = 4
+
+EVENT_CODES = {kind: code for code, kind in enumerate(EventKind)}
+EVENT_KINDS = list(EventKind)
+ACTION_CODES = {kind: code for code, kind in enumerate(ActionKind)}
+ACTION_KINDS = list(ActionKind)
+TEST_CODES = {test: code for code, test in enumerate(TestType)}
+
+TAG_ACTION = 1
+TAG_EVENT = 2
+
+NO_PATIENT = 0xFFFFFFFF
+NO_TREATMENT = 0xFFFF
+
+# magic, version, catalog fingerprint, length of the JSON run parameters (which follow)
+HEADER = struct.Struct("<4sB8sI")
+# tag, kind, patient index, treatment index, hours, guess length (the guess follows)
+ACTION = struct.Struct("<BBIHIH")
+# tag, kind, day, hour, patient id, patient health, kind-specific value
+EVENT = struct.Struct("<BBIIIhi")
+
+# latest clock hour an event record can hold (a long wait runs the clock past the day's end)
+MAX_HOUR = 0xFFFFFFFF
+
+
+class ReplayError(ValueError):
+    """
+    Raised when a log cannot be replayed or the replay diverges from it.
+    """
+
+
+def catalog_fingerprint(diseases: list[Disease], treatments: list[Treatment]) -> bytes:
+    """
+    8-byte digest of the disease and treatment names, in order.
+    """
+    names = "\x1f".join(d.name for d in diseases) + "\x1e" + "\x1f".join(t.name for t in treatments)
+    return hashlib.blake2b(names.encode(), digest_size=8).digest()
+
+
+# -------------------------
+# Run parameters
+# -------------------------
+
+def _describe_arrivals(process: ArrivalProcess) -> dict:
+    # exact types only: a subclass may draw its arrivals differently
+    weights = process.disease_weights
+    if type(process) is HourlyCoinArrivals:
+        return {"process": "hourly_coin", "probability": process.probability, "hours": list(process.hours), "disease_weights": weights}
+    if type(process) is PoissonArrivals:
+        if len(set(process.rates)) > 1:
+            # only a mapping gives different rates, and its hours are sorted
+            rate = [[hour, r] for hour, r in zip(process.hours, process.rates)]
+        else:
+            rate = process.rates[0] if process.rates else 0.0
+        return {"process": "poisson", "rate": rate, "hours": list(process.hours), "disease_weights": weights}
+    if type(process) is SurgeArrivals:
+        surge = process.surge
+        return {
+            "process": "surge",
+            "base": _describe_arrivals(process.base),
+            "rate": surge.rates[0] if surge.rates else 0.0,
+            "hours": list(surge.hours),
+            "days": sorted(process.days) if process.days is not None else None,
+            "disease_weights": weights
+        }
+    raise ValueError(f"Cannot record a run with arrival process {type(process).__name__}: it cannot be rebuilt on replay")
+
+
+def _build_arrivals(data: dict) -> ArrivalProcess:
+    kind = data["process"]
+    if kind == "hourly_coin":
+        return HourlyCoinArrivals(data["probability"], data["hours"], data["disease_weights"])
+    if kind == "poisson":
+        rate = data["rate"]
+        if isinstance(rate, list):
+            return PoissonArrivals({hour: r for hour, r in rate}, disease_weights=data["disease_weights"])
+        return PoissonArrivals(rate, data["hours"], data["disease_weights"])
+    if kind == "surge":
+        return SurgeArrivals(_build_arrivals(data["base"]), data["rate"], data["hours"], data["days"], data["disease_weights"])
+    raise ValueError(f"unknown arrival process {kind!r}")
+
+
+def hospital_config(hospital: Hospital) -> dict:
+    """
+    Everything needed to rebuild `hospital` for a replay, as JSON-compatible data.
+
+    Raises
+    ------
+    ValueError
+        If the hospital uses an arrival process, acuity score or scoring rules
+        of a custom type, which a replay could not rebuild.
+    """
+    acuity = hospital.waiting_room.acuity
+    if acuity is not None and type(acuity) is not AcuityScore:
+        raise ValueError("Cannot record a run whose waiting room uses a custom acuity score")
+    if type(hospital.scoring) is not ScoringRules:
+        raise ValueError(f"Cannot record a run with scoring rules {type(hospital.scoring).__name__}")
+
+    return {
+        "seed": hospital.rng.root_seed,
+        "max_days": hospital.max_days,
+        "capacity": hospital.waiting_room.capacity,
+        "acuity": None if acuity is None else {
+            "health_weight": acuity.health_weight,
+            "severity_weight": acuity.severity_weight,
+            "wait_weight": acuity.wait_weight
+        },
+        "arrivals": _describe_arrivals(hospital.arrivals),
+        "overflow": hospital.overflow.value,
+        "scoring": hospital.scoring.to_dict(),
+        "fast_forward": hospital.fast_forward
+    }
+
+
+def build_hospital(config: dict, diseases: list[Disease], treatments: list[Treatment]) -> Hospital:
+    """
+    A fresh hospital with the configuration returned by `hospital_config`.
+    """
+    acuity = config["acuity"]
+    return Hospital(
+        clock=Clock(),
+        waiting_room=WaitingRoom(config["capacity"], acuity=AcuityScore(**acuity) if acuity is not None else None),
+        diseases=diseases,
+        treatments=treatments,
+        max_days=config["max_days"],
+        rng=SimulationRNG(config["seed"]),
+        arrivals=_build_arrivals(config["arrivals"]),
+        overflow=OverflowPolicy(config["overflow"]),
+        scoring=ScoringRules(**config["scoring"]),
+        fast_forward=config["fast_forward"]
+    )
+
+
+# -------------------------
+# Records
+# -------------------------
+
+class ActionRecord:
+    """
+    A decision read back from a log.
+    """
+    def __init__(self, action: Action):
+        self.action = action
+
+    def __repr__(self) -> str:
+        return f"ActionRecord({self.action!r})"
+
+
+class EventRecord:
+    """
+    An event as stored in a log.
+
+    Attributes
+    ----------
+    kind : EventKind
+        What happened.
+    day, hour : int
+        When it happened.
+    patient_id : int | None
+        Patient id, assigned in order of arrival over the whole run.
+    health : int | None
+        Health of the patient at the time of the event.
+    value : int
+        Kind-specific payload: disease index (arrival), test type code (test
+        result), 1 if effective (treatment), 1 if correct (diagnosis), score
+        (discharge), day score (day ended) or total score (simulation ended).
+    """
+    __slots__ = ("kind", "day", "hour", "patient_id", "health", "value")
+
+    def __init__(self, kind: EventKind, day: int, hour: int, patient_id: Optional[int], health: Optional[int], value: int):
+        self.kind = kind
+        self.day = day
+        self.hour = hour
+        self.patient_id = patient_id
+        self.health = health
+        self.value = value
+
+    def as_tuple(self) -> tuple:
+        return (self.kind, self.day, self.hour, self.patient_id, self.health, self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, EventRecord) and self.as_tuple() == other.as_tuple()
+
+    def __repr__(self) -> str:
+        return (f"EventRecord({self.kind.value}, day={self.day}, hour={self.hour}, "
+                f"patient={self.patient_id}, health={self.health}, value={self.value})")
+
+
+class _PatientIds:
+    """
+    Numbers patients in order of first appearance, identically when recording and replaying.
+    """
+    def __init__(self):
+        self._ids: dict[Patient, int] = {}
+
+    def __call__(self, patient: Patient) -> int:
+        patient_id = self._ids.get(patient)
+        if patient_id is None:
+            patient_id = self._ids[patient] = len(self._ids)
+        return patient_id
+
+
+def _event_record(event: Event, ids: _PatientIds, disease_index: dict[Disease, int], treatment_index: dict[str, int]) -> EventRecord:
+    kind = event.kind
+    data = event.data
+    patient = event.patient
+
+    if kind is EventKind.ARRIVAL:
+        value = disease_index[patient.disease]
+    elif kind is EventKind.TEST_RESULT:
+        value = TEST_CODES[data["test_type"]]
+    elif kind is EventKind.TREATMENT_RESULT:
+        value = treatment_index[data["treatment"]] * 2 + bool(data["effective"])
+    elif kind is EventKind.DIAGNOSIS:
+        value = int(data["correct"])
+    elif kind is EventKind.DISCHARGE:
+        value = data["score"]
+    elif kind is EventKind.DAY_ENDED:
+        value = data["day_score"]
+    elif kind is EventKind.SIMULATION_ENDED:
+        value = data["total_score"]
+    else:
+        value = 0
+
+    if patient is None:
+        return EventRecord(kind, event.day, event.hour, None, None, value)
+    return EventRecord(kind, event.day, event.hour, ids(patient), int(event.health), value)
+
+
+# -------------------------
+# Writing
+# -------------------------
+
+def _action_record(action: Action) -> bytes:
+    """
+    Packs an action into its log record.
+
+    Raises
+    ------
+    ValueError
+        If a field does not fit its record (e.g. a wait of 2**32 hours or more).
+    """
+    guess = (action.guess or "").encode("utf-8") if action.kind is ActionKind.GUESS else b""
+    try:
+        return ACTION.pack(
+            TAG_ACTION,
+            ACTION_CODES[action.kind],
+            action.patient_index if action.patient_index is not None else NO_PATIENT,
+            action.treatment_index if action.treatment_index is not None else NO_TREATMENT,
+            action.hours,
+            len(guess)
+        ) + guess
+    except struct.error as e:
+        raise ValueError(f"Cannot record {action!r}: {e}") from None
+
+
+class EventLogWriter:
+    """
+    Append-only binary log of one run: its configuration (seed included), every
+    action and every event.
+
+    Records are fixed-size `struct`s (plus the text of guesses), written
+    through a buffered file; the log is complete once closed.
+
+    Parameters
+    ----------
+    file : str | Path | BinaryIO
+        Destination; paths are opened (and later closed) by the writer.
+    hospital : Hospital
+        The hospital being recorded. It must not have started yet.
+
+    Raises
+    ------
+    ValueError
+        If the configuration of `hospital` cannot be recorded (see `hospital_config`).
+    """
+
+    def __init__(self, file: Union[str, Path, BinaryIO], hospital: Hospital):
+        # checked before the file is created
+        config = json.dumps(hospital_config(hospital), separators=(",", ":")).encode("utf-8")
+
+        self._owns_file = isinstance(file, (str, Path))
+        self._file: BinaryIO = open(file, "wb") if self._owns_file else file
+
+        self._ids = _PatientIds()
+        self._disease_index = {d: i for i, d in enumerate(hospital.diseases)}
+        self._treatment_index = {t.name: i for i, t in enumerate(hospital.treatments)}
+
+        self._file.write(HEADER.pack(
+            LOG_MAGIC, LOG_VERSION, catalog_fingerprint(hospital.diseases, hospital.treatments), len(config)
+        ) + config)
+
+    def write_action(self, action: Action) -> None:
+        self._file.write(_action_record(action))
+
+    def write_events(self, events: list[Event]) -> None:
+        pack = EVENT.pack
+        self._file.write(b"".join(
+            pack(TAG_EVENT, EVENT_CODES[r.kind], r.day, r.hour,
+                 NO_PATIENT if r.patient_id is None else r.patient_id,
+                 -1 if r.health is None else r.health, r.value)
+            for r in (_event_record(e, self._ids, self._disease_index, self._treatment_index) for e in events)
+        ))
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class RecordingEngine(SimulationEngine):
+    """
+    `SimulationEngine` that writes every action and event to an `EventLogWriter`.
+
+    An action that cannot be recorded (e.g. a wait running the clock past
+    `MAX_HOUR`) raises `ValueError` before it is applied.
+
+    Parameters
+    ----------
+    hospital : Hospital
+        The hospital to drive. Its clock should not have started yet.
+    log : EventLogWriter
+        Destination of the records.
+    """
+
+    def __init__(self, hospital: Hospital, log: EventLogWriter):
+        super().__init__(hospital)
+        self.log = log
+
+    def reset(self):
+        observation, events = super().reset()
+        self.log.write_events(events)
+        return observation, events
+
+    def apply(self, action: Action) -> list[Event]:
+        # refused before it is applied, so the log never misses an action or its events
+        _action_record(action)
+        if action.kind is ActionKind.WAIT and self.hospital.clock.hour + action.hours > MAX_HOUR:
+            raise ValueError(f"Cannot record {action!r}: the clock would pass hour {MAX_HOUR}")
+        events = super().apply(action)
+        self.log.write_action(action)
+        self.log.write_events(events)
+        return events
+
+
+# -------------------------
+# Reading and replay
+# -------------------------
+
+class EventLog:
+    """
+    Contents of a log: the run parameters and its records, in order.
+
+    Attributes
+    ----------
+    config : dict
+        Hospital configuration of the run (see `hospital_config`).
+    fingerprint : bytes
+        `catalog_fingerprint` of the catalog the run used.
+    records : list[ActionRecord | EventRecord]
+        Every action and event, in order.
+    """
+
+    def __init__(self, config: dict, fingerprint: bytes, records: list):
+        self.config = config
+        self.fingerprint = fingerprint
+        self.records = records
+
+    @property
+    def seed(self) -> int:
+        return self.config["seed"]
+
+    @property
+    def max_days(self) -> int:
+        return self.config["max_days"]
+
+    @property
+    def capacity(self) -> int:
+        return self.config["capacity"]
+
+    @property
+    def actions(self) -> list[Action]:
+        return [r.action for r in self.records if isinstance(r, ActionRecord)]
+
+
+def _iter_records(data: bytes, offset: int) -> Iterator[Union[ActionRecord, EventRecord]]:
+    unpack_action = ACTION.unpack_from
+    unpack_event = EVENT.unpack_from
+
+    while offset < len(data):
+        tag = data[offset]
+        if tag == TAG_EVENT:
+            _, code, day, hour, patient_id, health, value = unpack_event(data, offset)
+            offset += EVENT.size
+            yield EventRecord(
+                EVENT_KINDS[code], day, hour,
+                None if patient_id == NO_PATIENT else patient_id,
+                None if health == -1 else health, value
+            )
+        elif tag == TAG_ACTION:
+            _, code, patient, treatment, hours, length = unpack_action(data, offset)
+            offset += ACTION.size
+            guess = data[offset:offset + length].decode("utf-8") if length or ACTION_KINDS[code] is ActionKind.GUESS else None
+            offset += length
+            yield ActionRecord(Action(
+                ACTION_KINDS[code],
+                patient_index=None if patient == NO_PATIENT else patient,
+                treatment_index=None if treatment == NO_TREATMENT else treatment,
+                guess=guess,
+                hours=hours
+            ))
+        else:
+            raise ReplayError(f"Corrupted log: unknown record tag {tag} at byte {offset}")
+
+
+def read_log(file: Union[str, Path, bytes]) -> EventLog:
+    """
+    Parses a whole log.
+
+    Raises
+    ------
+    ReplayError
+        If the data is not an event log of this version, or is corrupted or truncated.
+    """
+    data = file if isinstance(file, bytes) else Path(file).read_bytes()
+    if len(data) < HEADER.size:
+        raise ReplayError("Not an event log: file too short")
+
+    magic, version, fingerprint, length = HEADER.unpack_from(data)
+    if magic != LOG_MAGIC:
+        raise ReplayError("Not an event log")
+    if version != LOG_VERSION:
+        raise ReplayError(f"Unsupported event log version {version}")
+
+    start = HEADER.size + length
+    try:
+        config = json.loads(data[HEADER.size:start])
+        records = list(_iter_records(data, start))
+    except (ValueError, IndexError, struct.error) as e:
+        # truncated records, unknown codes, undecodable text or parameters
+        raise ReplayError(f"Corrupted log: {e}") from None
+    if not isinstance(config, dict):
+        raise ReplayError("Corrupted log: invalid run parameters")
+
+    return EventLog(config, fingerprint, records)
+
+
+def replay(
+    file: Union[str, Path, bytes, EventLog],
+    diseases: list[Disease],
+    treatments: list[Treatment],
+    verify: bool = True
+) -> SimulationEngine:
+    """
+    Re-runs a logged game from its seed and actions, without any UI.
+
+    Parameters
+    ----------
+    file : str | Path | bytes | EventLog
+        The log to replay.
+    diseases : list[Disease]
+        Catalog the run was recorded with.
+    treatments : list[Treatment]
+        Treatments the run was recorded with.
+    verify : bool, optional (default=True)
+        Whether to check that the replay emits exactly the logged events.
+
+    Returns
+    -------
+    SimulationEngine
+        The engine in its final state; ``engine.hospital.total_score`` is the score of the run.
+
+    Raises
+    ------
+    ReplayError
+        If the log is corrupted or truncated, if the catalog differs from the
+        recorded one or, when verifying, as soon as the replay diverges from the log.
+    """
+    log = file if isinstance(file, EventLog) else read_log(file)
+    if log.fingerprint != catalog_fingerprint(diseases, treatments):
+        raise ReplayError("The log was recorded with a different disease catalog or treatments")
+
+    try:
+        hospital = build_hospital(log.config, diseases, treatments)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ReplayError(f"Corrupted log: invalid run parameters ({e!r})") from None
+    engine = SimulationEngine(hospital)
+
+    ids = _PatientIds()
+    disease_index = {d: i for i, d in enumerate(diseases)}
+    treatment_index = {t.name: i for i, t in enumerate(treatments)}
+
+    _, events = engine.reset()
+    expected: list[EventRecord] = []
+    # the action whose events are being checked, None for the reset
+    cause: Optional[int] = None
+
+    def check(events: list[Event]) -> None:
+        replayed = [_event_record(e, ids, disease_index, treatment_index) for e in events]
+        if replayed != expected:
+            where = "at reset" if cause is None else f"at action record {cause} ({log.records[cause].action!r})"
+            raise ReplayError(f"Replay diverged {where}: expected {expected}, got {replayed}")
+
+    for position, record in enumerate(log.records):
+        if isinstance(record, EventRecord):
+            expected.append(record)
+            continue
+
+        if verify:
+            check(events)
+        expected = []
+        cause = position
+        try:
+            events = engine.apply(record.action)
+        except (RuntimeError, ValueError) as e:
+            # e.g. an action after the end of the run, or out of range
+            raise ReplayError(f"Corrupted log: action record {position} ({record.action!r}) cannot be applied: {e}") from e
+
+    if verify:
+        check(events)
+
+    return engine
@@ -0,0 +1,65 @@
+from enum import Enum
+from typing import Any, Optional
+
+from medical_simulator.core.patient import Patient
+
+
+class EventKind(Enum):
+    """
+    Kinds of observable events emitted by the simulation engine.
+    """
+    DAY_STARTED = "day_started"
+    ARRIVAL = "arrival"
+    DEATH = "death"
+    TEST_RESULT = "test_result"
+    TREATMENT_RESULT = "treatment_result"
+    DIAGNOSIS = "diagnosis"
+    DISCHARGE = "discharge"
+    DAY_ENDED = "day_ended"
+    SIMULATION_ENDED = "simulation_ended"
+    DIVERTED = "diverted"
+
+
+class Event:
+    """
+    Something observable that happened during the simulation.
+
+    Events replace the messages that used to be printed by the hospital, so
+    that a renderer (or an automated policy) can decide what to do with them.
+
+    Parameters
+    ----------
+    kind : EventKind
+        What happened.
+    day : int
+        Simulation day at which the event happened.
+    hour : int
+        Hour of the day at which the event happened.
+    patient : Patient | None, optional (default=None)
+        The patient the event refers to, if any.
+    data : dict, optional (default=None)
+        Extra payload specific to the event kind (e.g. test findings).
+    health : int | None, optional (default=None)
+        Health of the patient when the event happened. Patients are brought
+        up to date lazily, so `patient.health` may since have changed or be
+        behind.
+    """
+    def __init__(
+        self,
+        kind: EventKind,
+        day: int,
+        hour: int,
+        patient: Optional[Patient] = None,
+        data: Optional[dict[str, Any]] = None,
+        health: Optional[int] = None
+    ):
+        self.kind = kind
+        self.day = day
+        self.hour = hour
+        self.patient = patient
+        self.data = data if data is not None else {}
+        self.health = health
+
+    def __repr__(self) -> str:
+        who = f" {self.patient.name}" if self.patient is not None else ""
+        return f"Event({self.kind.value}{who} @ day {self.day} hour {self.hour})"
@@ -1,9 +1,19 @@
-from medical_simulator.core.case_result import CaseResult
+import math
+from collections import deque
+from typing import Callable, Optional
+
+from medical_simulator.core.arrivals import ArrivalProcess, HourlyCoinArrivals, OverflowPolicy
+from medical_simulator.core.case_result import CaseResult, Outcome
 from medical_simulator.core.clock import Clock
 from medical_simulator.core.disease import Disease
+from medical_simulator.core.events import Event, EventKind
 from medical_simulator.core.patient import Patient
+from medical_simulator.core.result_sink import ResultSink
+from medical_simulator.core.scheduler import Scheduler
+from medical_simulator.core.scoring import ScoringRules
 from medical_simulator.core.treatment import Treatment
 from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
 
 
 class Hospital:
@@ -11,7 +21,16 @@ class Hospital:
     Central orchestrator of the clinical simulation.
 
     Coordinates time progression, patient management, clinical actions,
-    and scoring logic for a single simulation run.
+    and scoring logic for a single simulation run. The hospital performs no
+    terminal I/O: everything observable is recorded as an `Event` that
+    callers collect with `pop_events()`.
+
+    Time is event-driven: instead of stepping every patient every hour, the
+    hospital keeps a `Scheduler` of arrivals, patient wake-ups (at the
+    earliest hour a patient could die) and action completions, and jumps
+    from one event to the next. A patient, and its symptoms, is only brought
+    up to date when it matters: when it wakes up, is treated, diagnosed or
+    leaves, and when someone looks at it through `sync` or `sync_all`.
 
     Parameters
     ----------
@@ -25,6 +44,28 @@ class Hospital:
         A list of all available diagnostic and therapeutic treatments.
     max_days : int, optional (default=5)
         Maximum number of days for the simulation.
+    rng : SimulationRNG | None, optional (default=None)
+        Root random stream of the run; an unseeded one is created when omitted.
+        Arrivals and patient demographics use their own substreams, and every
+        patient gets its own stream for health decay.
+    result_sink : ResultSink | None, optional (default=None)
+        Destination every case result is streamed to as soon as it is closed.
+    run_id : int, optional (default=0)
+        Identifier of the run, written alongside each streamed result.
+    arrivals : ArrivalProcess | None, optional (default=None)
+        Generates each day's arrivals; one coin flip per morning hour
+        (`HourlyCoinArrivals`) when omitted.
+    overflow : OverflowPolicy, optional (default=OverflowPolicy.DIVERT)
+        Fate of patients arriving at a full waiting room: diverted elsewhere,
+        or queued outside until a place frees up (the queue does not carry
+        over to the next day).
+    scoring : ScoringRules | None, optional (default=None)
+        Scoring constants; the original rules (`ScoringRules()`) when omitted.
+    fast_forward : bool, optional (default=False)
+        Brings patients up to date with `Patient.fast_forward`, in one step
+        however long they went unattended, instead of hour by hour. Runs are
+        statistically equivalent but no longer reproduce hourly runs of the
+        same seed; their draws also depend on when patients are observed.
 
     Attributes
     ----------
@@ -32,9 +73,29 @@ class Hospital:
         Total score accumulated during the simulation.
     daily_case_results : list[CaseResult]
         List of patient results for the current day.
+    events : list[Event]
+        Events emitted since the last call to `pop_events()`.
+    scheduler : Scheduler
+        Pending events of the current day.
+    diverted : int
+        Number of patients turned away because the waiting room was full.
     """
 
-    def __init__(self, clock: Clock, waiting_room: WaitingRoom, diseases: list[Disease], treatments: list[Treatment], max_days=5):
+    def __init__(
+        self,
+        clock: Clock,
+        waiting_room: WaitingRoom,
+        diseases: list[Disease],
+        treatments: list[Treatment],
+        max_days=5,
+        rng: Optional[SimulationRNG] = None,
+        result_sink: Optional[ResultSink] = None,
+        run_id: int = 0,
+        arrivals: Optional[ArrivalProcess] = None,
+        overflow: OverflowPolicy = OverflowPolicy.DIVERT,
+        scoring: Optional[ScoringRules] = None,
+        fast_forward: bool = False
+    ):
 
         self.clock = clock
         self.waiting_room = waiting_room
@@ -43,64 +104,62 @@ class Hospital:
         self.diseases = diseases
         self.max_days = max_days
         self.total_score = 0
+        self.scoring = scoring if scoring is not None else ScoringRules()
+
+        self.rng = rng if rng is not None else SimulationRNG()
+        self.arrivals_rng = self.rng.spawn("arrivals")
+        self.demographics_rng = self.rng.spawn("demographics")
 
         self.daily_case_results: list[CaseResult] = []
+        self.events: list[Event] = []
+        self.result_sink = result_sink
+        self.run_id = run_id
+
+        self.arrivals = arrivals if arrivals is not None else HourlyCoinArrivals()
+        self.overflow = overflow
+        self.diverted = 0
+        # patients queued outside a full waiting room (OverflowPolicy.QUEUE)
+        self._outside: deque[Patient] = deque()
+
+        self.fast_forward = fast_forward
+        self.scheduler = Scheduler()
+        # patient -> [clock hour at which its time_elapsed was 0, hour of its pending wake-up]
+        self._tracked: dict[Patient, list[int]] = {}
 
     # -------------------------
-    # Simulation flow
+    # Events
     # -------------------------
 
-    def visit_patient(self, patient: Patient) -> None:
-        """
-        Handles the visit of a single patient.
+    def emit(self, kind: EventKind, patient: Optional[Patient] = None, **data) -> None:
+        health = patient.health if patient is not None else None
+        self.events.append(Event(kind, self.clock.day, self.clock.hour, patient, data, health))
 
-        It runs a loop until the player returns to the waiting room, or the hospital day is over.
+    def pop_events(self) -> list[Event]:
         """
+        Returns the events emitted since the last call and clears the buffer.
+        """
+        events = self.events
+        self.events = []
+        return events
 
-        while not self.clock.is_day_over():
-
-            if patient.is_dead():
-                return
-
-            patient.show_patient_status()
-            self.show_available_actions()
-
-            print("0) Back to waiting room")
-
-            choice = input("\nChoose action: ").strip()
-
-            if choice == "0":
-                return
-
-            if not choice.isdigit():
-                print("Invalid input. Please enter a number.")
-                continue
-
-            choice_num = int(choice)
-            total_actions = len(self.treatments) + 1
+    # -------------------------
+    # Simulation flow
+    # -------------------------
 
-            if choice == total_actions:
-                guess = input("Enter the disease name: ").strip()
-                correct = patient.disease.name.lower() == guess.lower()
-                patient.diagnosis_correct = correct
-                if correct:
-                    print(f"Correct! The patient had {patient.disease.name}.")
-                    patient.health = min(100, patient.health + 10)
-                    self.discharge_patient(patient)
-                    self.waiting_room.remove_patient(patient)
-                else:
-                    print(f"Incorrect.")
-                    patient.health -= 30
-                    patient.health = max(0, patient.health)
+    def start_new_day(self) -> None:
+        self.clock.start_new_day()
+        self.scheduler.clear()
+        self.emit(EventKind.DAY_STARTED)
 
+        for hour, source in self.arrivals.schedule_day(self.clock.day, self.arrivals_rng):
+            self.scheduler.schedule(hour, Scheduler.ARRIVAL, self._on_arrival, source)
 
-            elif 1 <= choice_num < total_actions:
-                for f in self.perform_action(patient, self.treatments[choice_num - 1]):
-                    if not patient.is_dead():
-                        print(f"- {f}")
+        self.admit_patient(self.arrivals.draw_patient(self.diseases, self.demographics_rng))
 
-    def start_new_day(self) -> None:
-        self.clock.start_new_day()
+    def admit_patient(self, patient: Patient) -> None:
+        self.waiting_room.add_patient(patient)
+        self.emit(EventKind.ARRIVAL, patient)
+        self._track(patient, self.clock.hour)
 
     def is_simulation_over(self) -> bool:
         return self.clock.day >= self.max_days
@@ -109,44 +168,37 @@ class Hospital:
     # Patient status
     # -------------------------
 
-    def discharge_patient(self, patient: Patient) -> None:
+    def _close_case(self, patient: Patient, outcome: Outcome, score: int) -> None:
+        result = CaseResult(
+            patient_name=patient.name,
+            outcome=outcome,
+            score=score,
+            health=patient.health,
+            disease=patient.disease.name,
+            day=self.clock.day,
+            hour=self.clock.hour,
+            actions=tuple(patient.actions or ())
+        )
+        self.daily_case_results.append(result)
 
-        base_score = 100
-        health_bonus = int(patient.health * 0.3)
+        if self.result_sink is not None:
+            self.result_sink.write(self.run_id, result)
 
-        score = base_score + health_bonus
+    def discharge_patient(self, patient: Patient) -> None:
+        score = self.scoring.discharge(patient.health)
 
-        self.daily_case_results.append(
-            CaseResult(
-                patient_name=patient.name,
-                outcome="Discharged",
-                score=score,
-                notes=f"Health at discharge: {patient.health}"
-            )
-        )
+        self.emit(EventKind.DISCHARGE, patient, score=score)
+        self._close_case(patient, Outcome.DISCHARGED, score)
 
     def unresolved_patient(self, patient: Patient) -> None:
-        score = int(patient.health * 0.8)
-
-        self.daily_case_results.append(
-            CaseResult(
-                patient_name=patient.name,
-                outcome="Not discharged",
-                score=score,
-                notes="Patient still under observation"
-            )
-        )
+        score = self.scoring.unresolved(patient.health)
+
+        self._close_case(patient, Outcome.NOT_DISCHARGED, score)
 
     def patient_died(self, patient: Patient) -> None:
-        self.daily_case_results.append(
-            CaseResult(
-                patient_name=patient.name,
-                outcome="Died",
-                score=-100,
-                notes="Critical deterioration"
-            )
-        )
-        self.waiting_room.remove_patient(patient)
+        self.emit(EventKind.DEATH, patient)
+        self._close_case(patient, Outcome.DIED, self.scoring.death())
+        self._release(patient)
 
 
     # -------------------------
@@ -154,50 +206,168 @@ class Hospital:
     # -------------------------
 
     def advance_time(self, hours: int) -> None:
-        for _ in range(hours):
-            self.clock.advance(1)
-            self.waiting_room.maybe_add_new_patients(self.clock.hour, self.diseases)
+        """
+        Moves the clock forward by `hours`, processing only the events due meanwhile.
 
-            for patient in list(self.waiting_room.patients):
-                patient.advance_time(1)
+        Patients nothing happened to are left behind: call `sync` or
+        `sync_all` before reading their state.
+        """
+        self.scheduler.run_until(self.clock.hour + hours, self.clock)
 
-                if patient.is_dead():
-                    print(f"\nPatient {patient.name} has died.")
-                    self.patient_died(patient)
+    def sync(self, patient: Patient) -> None:
+        """
+        Brings a patient of the waiting room up to the current hour (health,
+        symptoms, waiting time and triage order). Patients that left are
+        not touched.
+        """
+        if patient in self._tracked:
+            self._sync(patient)
 
+    def sync_all(self) -> None:
+        """
+        Brings every patient of the waiting room up to the current hour, e.g.
+        before showing the room or ranking it by acuity.
+        """
+        for patient in self.waiting_room.patients:
+            self._sync(patient)
 
-    def show_available_actions(self) -> None:
-        print("\nAvailable actions:")
-        for i, t in enumerate(self.treatments, start=1):
-            print(f"{i}) {t.name} ({t.time_cost}h) – {t.description}")
+    # -------------------------
+    # Scheduled events
+    # -------------------------
 
-        print(f"{len(self.treatments) + 1}) Guess Disease")
+    def _on_arrival(self, source: ArrivalProcess) -> None:
+        room = self.waiting_room
 
-    def perform_action(self, patient: Patient, treatment: Treatment):
+        if len(room) >= room.capacity:
+            if self.overflow is OverflowPolicy.QUEUE:
+                self._outside.append(source.draw_patient(self.diseases, self.demographics_rng))
+            else:
+                self.diverted += 1
+                self.emit(EventKind.DIVERTED)
+            return
 
-        self.advance_time(treatment.time_cost)
+        patient = source.draw_patient(self.diseases, self.demographics_rng)
+        room.add_patient(patient)
+        self.emit(EventKind.ARRIVAL, patient)
+        # arrivals are examined in the hour they arrive, as if they had come in the hour before
+        self._track(patient, self.clock.hour - 1)
+
+    def _on_patient_wake(self, patient: Patient) -> None:
+        tracked = self._tracked.get(patient)
+        if tracked is None or tracked[1] != self.clock.hour:
+            return
+
+        self._sync(patient)
 
         if patient.is_dead():
-            return []
+            self.patient_died(patient)
+        else:
+            self._schedule_wake(patient)
 
-        t = treatment.test_type
+    def _track(self, patient: Patient, origin: int) -> None:
+        self._tracked[patient] = [origin, None]
+        self._schedule_wake(patient)
+
+    def _release(self, patient: Patient) -> None:
+        self._tracked.pop(patient, None)
+        self.waiting_room.remove_patient(patient)
+
+        if self._outside:
+            self.admit_patient(self._outside.popleft())
+
+    def _sync(self, patient: Patient) -> None:
+        """
+        Brings a tracked patient up to the current hour. Symptoms only matter
+        to the doctor, so they are revealed here rather than through scheduled
+        events. Only a patient that changed is reprioritized.
+        """
+        behind = self.clock.hour - self._tracked[patient][0] - patient.time_elapsed
+        if behind > 0:
+            if self.fast_forward:
+                patient.fast_forward(behind)
+            else:
+                patient.catch_up(behind)
+            self.waiting_room.reprioritize(patient)
+
+    def _schedule_wake(self, patient: Patient) -> None:
+        """
+        Schedules a check at the earliest hour the patient could die, so that
+        nothing needs to happen to the patient until then.
 
-        if t == "blood":
-            print("\nBlood findings:")
-            return patient.apply_blood_test()
+        A pending check that is earlier than needed is kept: it only causes a
+        harmless re-check.
+        """
+        tracked = self._tracked[patient]
+        now = self.clock.hour
+
+        # health is an integer and drops by at most ceil(severity) per hour
+        max_drop = math.ceil(patient.disease.severity)
+        if patient.health <= 0:
+            wake = now + 1
+        elif max_drop > 0:
+            wake = now + max(1, math.ceil(patient.health / max_drop))
+        else:
+            return
+
+        pending = tracked[1]
+        if pending is not None and now < pending <= wake:
+            return
+
+        tracked[1] = wake
+        self.scheduler.schedule(wake, Scheduler.PATIENT, self._on_patient_wake, patient)
+
+    def perform_action(self, patient: Patient, treatment: Treatment) -> list:
+        """
+        Performs a test or treatment on a patient, advancing time by its cost.
 
-        if t == "xray":
-            print("\nX-Ray findings:")
-            return patient.apply_xray()
+        Returns the findings of a test (or the outcome of a treatment); an empty
+        list if the patient died in the meantime or the action had no effect.
+        """
+        outcome = self.start_action(patient, treatment)
+        self.advance_time(treatment.time_cost)
+        return outcome[0] if outcome else []
 
-        if t == "vitals":
-            print("\nVital signs:")
-            return patient.apply_vital_signs_test()
+    def start_action(self, patient: Patient, treatment: Treatment, on_done: Optional[Callable[[], None]] = None) -> list:
+        """
+        Starts a test or treatment that completes `treatment.time_cost` hours
+        from now, without advancing time.
 
-        if t == "ecg":
-            print("\nECG findings:")
-            return patient.apply_ecg()
+        Returns a list that receives the result of the action once it
+        completes (it stays empty if the patient left or died meanwhile).
+        `on_done` is called at completion in every case.
+        """
+        outcome = []
+        self.scheduler.schedule(
+            self.clock.hour + treatment.time_cost, Scheduler.COMPLETION,
+            self._complete_action, patient, treatment, outcome, on_done
+        )
+        return outcome
 
+    def _complete_action(self, patient: Patient, treatment: Treatment, outcome: list, on_done: Optional[Callable[[], None]] = None) -> None:
+        if patient in self._tracked:
+            self._sync(patient)
+            if not patient.is_dead():
+                patient.record_action(treatment.name)
+            outcome.append(self._apply_action(patient, treatment))
+
+            if patient in self._tracked:
+                self.waiting_room.reprioritize(patient)
+                self._schedule_wake(patient)
+
+        if on_done is not None:
+            on_done()
+
+    def _apply_action(self, patient: Patient, treatment: Treatment):
+
+        if patient.is_dead():
+            return []
+
+        t = treatment.test_type
+
+        if t is not None:
+            findings = patient.apply_test(t)
+            self.emit(EventKind.TEST_RESULT, patient, treatment=treatment.name, test_type=t, findings=findings)
+            return findings
 
         if treatment.effect > 0 or treatment.penalty > 0:
             if patient.disease.is_correct_treatment(treatment.name):
@@ -208,32 +378,63 @@ class Hospital:
                 result = ["treatment ineffective"]
 
             patient.health = max(0, min(100, patient.health))
+            self.emit(EventKind.TREATMENT_RESULT, patient, treatment=treatment.name, effective=result == ["treatment effective"])
             return result
 
+        return []
+
+    def guess_disease(self, patient: Patient, guess: str) -> bool:
+        """
+        Checks the doctor's diagnosis; a correct guess discharges the patient,
+        a wrong one costs health points (30 with the default scoring rules).
+        """
+        self.sync(patient)
+        correct = patient.disease.name.lower() == guess.strip().lower()
+        patient.diagnosis_correct = correct
+        self.emit(EventKind.DIAGNOSIS, patient, guess=guess, correct=correct)
+
+        if correct:
+            patient.health = min(100, int(patient.health + self.scoring.diagnosis_bonus))
+            self.discharge_patient(patient)
+            self._release(patient)
+        else:
+            patient.health = max(0, int(patient.health - self.scoring.misdiagnosis_penalty))
+            self.waiting_room.reprioritize(patient)
+            self._schedule_wake(patient)
+
+        return correct
+
     def wait_and_observe(self, hours: int) -> None:
-        print(f"\nWaiting for {hours} hour...")
         self.advance_time(hours)
 
     # -------------------------
     # Day end & scoring
     # -------------------------
 
-    def end_day(self) -> None:
+    def end_day(self) -> list[CaseResult]:
+        """
+        Closes the current day: every patient still waiting is scored as unresolved.
+
+        Returns the case results of the day.
+        """
+
+        # patients still queued outside go elsewhere
+        self.diverted += len(self._outside)
+        self._outside.clear()
 
         # iterate over a copy of the patients to avoid skipping elements
         for p in list(self.waiting_room.patients):
+            self._sync(p)
             self.unresolved_patient(p)
-            self.waiting_room.remove_patient(p)
-
-        day_score = sum(r.score for r in self.daily_case_results)
-
-        print("\n--- Day Summary ---")
+            self._release(p)
 
-        for r in self.daily_case_results:
-            print(f"{r.patient_name}: {r.outcome} → {r.score} points")
+        self.scheduler.clear()
 
-        print(f"Total day score: {day_score}")
+        results = self.daily_case_results
+        day_score = sum(r.score for r in results)
 
         self.total_score += day_score
+        self.emit(EventKind.DAY_ENDED, results=results, day_score=day_score)
 
-        self.daily_case_results.clear()
+        self.daily_case_results = []
+        return results
@@ -0,0 +1,111 @@
+from typing import Iterator, Optional
+
+
+class IndexedHeap:
+    """
+    Binary min-heap of integer ids with a position index.
+
+    Unlike `heapq`, the position of every id is tracked, so an id can be
+    removed or have its key changed in O(log n) without searching the heap.
+    Ties between equal keys are broken by id.
+
+    Attributes
+    ----------
+    _heap : list[tuple[float, int]]
+        ``(key, id)`` entries in heap order.
+    _position : dict[int, int]
+        Index of each id in `_heap`.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[float, int]] = []
+        self._position: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, id_: int) -> bool:
+        return id_ in self._position
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Ids in heap (not sorted) order.
+        """
+        return (id_ for _, id_ in self._heap)
+
+    def key(self, id_: int) -> float:
+        return self._heap[self._position[id_]][0]
+
+    def push(self, id_: int, key: float) -> None:
+        if id_ in self._position:
+            raise KeyError(f"id {id_} is already in the heap")
+        self._heap.append((key, id_))
+        self._position[id_] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self) -> Optional[int]:
+        return self._heap[0][1] if self._heap else None
+
+    def pop(self) -> int:
+        id_ = self._heap[0][1]
+        self.remove(id_)
+        return id_
+
+    def remove(self, id_: int) -> None:
+        i = self._position.pop(id_)
+        last = self._heap.pop()
+        if i < len(self._heap):
+            self._heap[i] = last
+            self._position[last[1]] = i
+            self._restore(i)
+
+    def update(self, id_: int, key: float) -> None:
+        i = self._position[id_]
+        if self._heap[i][0] != key:
+            self._heap[i] = (key, id_)
+            self._restore(i)
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._position.clear()
+
+    # -------------------------
+    # Heap maintenance
+    # -------------------------
+
+    def _restore(self, i: int) -> None:
+        if i > 0 and self._heap[i] < self._heap[(i - 1) >> 1]:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def _sift_up(self, i: int) -> None:
+        heap, position = self._heap, self._position
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if not entry < heap[parent]:
+                break
+            heap[i] = heap[parent]
+            position[heap[i][1]] = i
+            i = parent
+        heap[i] = entry
+        position[entry[1]] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, position = self._heap, self._position
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < entry:
+                break
+            heap[i] = heap[child]
+            position[heap[i][1]] = i
+            i = child
+        heap[i] = entry
+        position[entry[1]] = i
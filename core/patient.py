@@ -1,5 +1,9 @@
+import copy
 import random
+from typing import Optional
 from medical_simulator.core.disease import Disease
+from medical_simulator.core.treatment import TestType
+from medical_simulator.utils.sampling import multinomial, multivariate_hypergeometric
 
 
 class Patient:
@@ -7,12 +11,17 @@ class Patient:
     """
     Patient obj in the clinical simulation.
 
-    Health and symptoms evolve as simulation time advances.
+    Health and symptoms evolve as simulation time advances. Patients are
+    slotted and keep symptoms and test results as a cursor and a bitmask
+    into their disease, so that large populations stay small in memory.
 
     Parameters
     ----------
     disease : Disease
         The disease affecting the patient.
+    rng : random.Random | SplitMix64 | None, optional (default=None)
+        Random stream used for the initial health and the health decay of this
+        patient. The global `random` module is used when omitted.
 
     Attributes
     ----------
@@ -26,39 +35,113 @@ class Patient:
         Current health of the patient (0–100).
     time_elapsed : int
         Number of hours elapsed since patient arrival.
-    visible_symptoms : list[str]
-        Symptoms currently visible to the doctor.
-    _revealed_symptoms : set[str]
-        Internal set of symptoms that have already been revealed; used to avoid duplicating symptoms.
-    discovered_blood_findings : list[str]
+    diagnosis_correct : bool | None
+        Outcome of the last diagnosis attempt, None if never attempted.
+    actions : list[str] | None
+        Names of the tests and treatments performed so far, None if none yet.
+    visible_symptoms : tuple[str, ...]
+        Symptoms currently visible to the doctor (names interned by the disease vocabulary).
+    discovered_blood_findings : tuple[str, ...]
         Blood test findings discovered so far.
-    discovered_xray_findings : list[str]
+    discovered_xray_findings : tuple[str, ...]
         X-ray findings discovered so far.
-    discovered_ecg_findings : list[str]
+    discovered_ecg_findings : tuple[str, ...]
         ECG findings discovered so far.
     vital_signs : dict
         Latest vital signs readings (temperature, systolic_bp).
+    _symptom_cursor : int
+        Number of `Disease.reveal_groups` already revealed.
+    _tests_done : int
+        Bitmask of the `TestType`s performed so far (see `TEST_BITS`).
     """
 
-    def __init__(self, disease: Disease):
+    __slots__ = (
+        "sex", "name", "age", "rng", "disease", "health", "time_elapsed",
+        "diagnosis_correct", "actions", "_symptom_cursor", "_tests_done"
+    )
+
+    TEST_BITS = {test: 1 << i for i, test in enumerate(TestType)}
+
+    def __init__(self, disease: Disease, rng: Optional[random.Random] = None):
         self.sex = None
         self.name = None
         self.age = None
 
+        self.rng = rng
         self.disease = disease
-        self.health = random.randint(
+        self.health = (rng or random).randint(
             disease.initial_health_range[0],
             disease.initial_health_range[1]
         )
 
         self.time_elapsed = 0
-        self.visible_symptoms = []
-        self._revealed_symptoms = set()
+        self.diagnosis_correct = None
+        self.actions = None
+        self._symptom_cursor = 0
+        self._tests_done = 0
+
+    def __deepcopy__(self, memo: dict) -> "Patient":
+        # the disease is part of the read-only catalog and is shared; the rest
+        # is flat, so copy it directly instead of through deepcopy's reduce path
+        clone = Patient.__new__(Patient)
+        memo[id(self)] = clone
+        clone.sex = self.sex
+        clone.name = self.name
+        clone.age = self.age
+        clone.rng = copy.deepcopy(self.rng, memo)
+        clone.disease = self.disease
+        clone.health = self.health
+        clone.time_elapsed = self.time_elapsed
+        clone.diagnosis_correct = self.diagnosis_correct
+        clone.actions = list(self.actions) if self.actions is not None else None
+        clone._symptom_cursor = self._symptom_cursor
+        clone._tests_done = self._tests_done
+        return clone
+
+    # -------------------------
+    # Findings
+    # -------------------------
+
+    def record_action(self, name: str) -> None:
+        if self.actions is None:
+            self.actions = [name]
+        else:
+            self.actions.append(name)
+
+    @property
+    def visible_symptoms(self) -> tuple[str, ...]:
+        return self.disease.visible_prefixes[self._symptom_cursor]
+
+    def has_done_test(self, test_type: TestType) -> bool:
+        return bool(self._tests_done & self.TEST_BITS[test_type])
+
+    def discovered_findings(self, test_type: TestType) -> tuple[str, ...]:
+        """
+        Findings of a blood test, X-ray or ECG, empty if it was not performed.
+        """
+        return self.disease.test_results[test_type] if self._tests_done & self.TEST_BITS[test_type] else ()
+
+    @property
+    def discovered_blood_findings(self) -> tuple[str, ...]:
+        return self.discovered_findings(TestType.BLOOD)
 
-        self.discovered_blood_findings = []
-        self.discovered_xray_findings = []
-        self.discovered_ecg_findings = []
-        self.vital_signs = {}
+    @property
+    def discovered_xray_findings(self) -> tuple[str, ...]:
+        return self.discovered_findings(TestType.XRAY)
+
+    @property
+    def discovered_ecg_findings(self) -> tuple[str, ...]:
+        return self.discovered_findings(TestType.ECG)
+
+    @property
+    def vital_signs(self) -> dict[str, float]:
+        return self._vital_signs() if self.has_done_test(TestType.VITALS) else {}
+
+    def _vital_signs(self) -> dict[str, float]:
+        return {
+            "temperature": self.disease.base_temperature,
+            "systolic_bp": self.disease.base_systolic_bp
+        }
 
     # -------------------------
     # Patient status
@@ -115,83 +198,108 @@ class Patient:
 
         self._update_symptoms()
 
-        decay = self.disease.severity * hours * random.uniform(0.5, 1.0)
+        decay = self.disease.severity * hours * (self.rng or random).uniform(0.5, 1.0)
         self.health -= decay
         self.health = max(0, int(self.health))
 
 
 
-    def _update_symptoms(self)  -> None:
-
-        for symptom in self.disease.symptoms_timeline:
-            name = symptom["name"]
-            from_hour = symptom["from_hour"]
-
-            if self.time_elapsed >= from_hour and name not in self._revealed_symptoms:
-                self.visible_symptoms.append(name)
-                self._revealed_symptoms.add(name)
-
-    # -------------------------
-    # Diagnostic tests
-    # -------------------------
-
-    def apply_vital_signs_test(self)  -> dict[str, float]:
-
-        # print("\nVital signs:")
-        # print(f"- Temperature: {self.disease.base_temperature}")
-        # print(f"- Systolic BP: {self.disease.base_systolic_bp}")
-
-        self.vital_signs = {
-            "temperature": self.disease.base_temperature,
-            "systolic_bp": self.disease.base_systolic_bp
-        }
-        return self.vital_signs
-
-    def apply_blood_test(self) -> list[str]:
-
-        # print("\nBlood findings:")
-
-
-        findings = self.disease.blood_findings.copy()
-        if not findings:
-            # print(f"normal blood test")
-            findings = ["normal blood test"]
+    def catch_up(self, hours: int) -> None:
+        """
+        Advances the patient hour by hour, stopping early if the patient dies.
+
+        Equivalent to calling ``advance_time(1)`` `hours` times.
+        """
+        for _ in range(hours):
+            self.advance_time(1)
+            if self.health <= 0:
+                return
+
+    def fast_forward(self, hours: int) -> None:
+        """
+        Advances the patient `hours` hours at once, stopping at death.
+
+        Statistically equivalent to ``catch_up(hours)``, but in time almost
+        independent of `hours`. Each hour's health drop follows
+        `Disease.decay_distribution`, so the drops of all the hours are drawn
+        as one multinomial. If they add up to the patient's health, the exact
+        death hour is found by bisection, drawing how the drops split
+        between the two halves of the interval (multivariate hypergeometric).
+        The random stream is used differently from the hourly loop, so runs
+        are not reproduced draw for draw.
+        """
+        if hours <= 0:
+            return
+        # the hourly loop is cheaper for a couple of hours
+        if hours <= 2 or type(self.health) is not int or self.health <= 0:
+            self.catch_up(hours)
+            return
+
+        rng = self.rng or random
+        drops, probabilities = self.disease.decay_distribution
+        counts = multinomial(hours, probabilities, rng)
+        lost = sum(d * c for d, c in zip(drops, counts))
+
+        if lost < self.health:
+            self.health -= lost
+            self.time_elapsed += hours
+        else:
+            self.time_elapsed += self._hours_to_death(self.health, drops, counts, hours, rng)
+            self.health = 0
 
-        for f in findings:
-            if f not in self.discovered_blood_findings:
-                # print(f"- {f}")
-                self.discovered_blood_findings.append(f)
+        self._update_symptoms()
 
-        return findings
+    @staticmethod
+    def _hours_to_death(health: int, drops: tuple[int, ...], counts: list[int], hours: int, rng) -> int:
+        # the drops of `hours` hours, `counts` of each size, add up to at least
+        # `health`: halve the interval until the hour where they reach it
+        elapsed = 0
+        while hours > 1:
+            half = hours // 2
+            first = multivariate_hypergeometric(counts, half, rng)
+            lost = sum(d * c for d, c in zip(drops, first))
+            if lost >= health:
+                counts = first
+                hours = half
+            else:
+                health -= lost
+                elapsed += half
+                hours -= half
+                counts = [c - f for c, f in zip(counts, first)]
+        return elapsed + 1
 
-    def apply_xray(self) -> list[str]:
+    def _update_symptoms(self)  -> None:
 
-        # print("\nX-Ray findings:")
+        hours = self.disease.reveal_hours
+        cursor = self._symptom_cursor
 
-        findings = self.disease.xray_findings.copy()
-        if not findings:
-            # print(f"normal chest x-ray")
-            findings = ["normal chest x-ray"]
+        while cursor < len(hours) and hours[cursor] <= self.time_elapsed:
+            cursor += 1
 
-        for f in findings:
-            if f not in self.discovered_xray_findings:
-                # print(f"- {f}")
-                self.discovered_xray_findings.append(f)
+        self._symptom_cursor = cursor
 
-        return findings
+    # -------------------------
+    # Diagnostic tests
+    # -------------------------
 
-    def apply_ecg(self) -> list[str]:
+    def apply_test(self, test_type: TestType) -> "tuple[str, ...] | dict[str, float]":
+        """
+        Performs a test and returns its result: the vital signs, or the
+        findings precomputed by the disease (shared, immutable, never copied).
+        """
+        self._tests_done |= self.TEST_BITS[test_type]
+        if test_type is TestType.VITALS:
+            return self._vital_signs()
+        return self.disease.test_results[test_type]
 
-        # print("\nECG findings:")
+    def apply_vital_signs_test(self)  -> dict[str, float]:
+        return self.apply_test(TestType.VITALS)
 
-        findings = getattr(self.disease, "ecg_findings", []).copy()
-        if not findings:
-            # print(f"normal ECG")
-            findings = ["normal ECG"]
+    def apply_blood_test(self) -> tuple[str, ...]:
+        return self.apply_test(TestType.BLOOD)
 
-        for f in findings:
-            if f not in self.discovered_ecg_findings:
-                # print(f"- {f}")
-                self.discovered_ecg_findings.append(f)
+    def apply_xray(self) -> tuple[str, ...]:
+        return self.apply_test(TestType.XRAY)
 
-        return findings
+    def apply_ecg(self) -> tuple[str, ...]:
+        return self.apply_test(TestType.ECG)
@@ -0,0 +1,74 @@
+import random
+from abc import ABC, abstractmethod
+
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.engine import Action, Observation
+from medical_simulator.core.hospital import Hospital
+
+
+class Policy(ABC):
+    """
+    Base class of automated doctors that drive a `SimulationEngine`.
+
+    A policy only sees what the doctor sees (`Observation`), never the hidden
+    disease. Subclasses must be picklable so they can be shipped to worker
+    processes by the batch runner.
+    """
+
+    def reset(self, hospital: Hospital, seed: int) -> None:
+        """
+        Called once before each run, with the hospital to be driven and the run seed.
+        """
+
+    @abstractmethod
+    def act(self, observation: Observation) -> Action:
+        """
+        Returns the action to take given what the doctor sees.
+        """
+
+
+class WaitPolicy(Policy):
+    """
+    Never visits anyone: waits until every day is over. Useful as a baseline.
+    """
+
+    def act(self, observation: Observation) -> Action:
+        return Action.wait(max(1, Clock.DAY_LENGTH - observation.hour))
+
+
+class RandomPolicy(Policy):
+    """
+    Picks a random patient and a random test, treatment or diagnosis.
+
+    Parameters
+    ----------
+    guess_probability : float, optional (default=0.2)
+        Probability of guessing a disease instead of performing a treatment.
+    wait_probability : float, optional (default=0.3)
+        Probability of waiting instead of visiting a patient.
+    """
+
+    def __init__(self, guess_probability: float = 0.2, wait_probability: float = 0.3):
+        self.guess_probability = guess_probability
+        self.wait_probability = wait_probability
+        self._rng = random.Random()
+        self._disease_names: list[str] = []
+        self._n_treatments = 0
+
+    def reset(self, hospital: Hospital, seed: int) -> None:
+        self._rng.seed(seed)
+        self._disease_names = [d.name for d in hospital.diseases]
+        self._n_treatments = len(hospital.treatments)
+
+    def act(self, observation: Observation) -> Action:
+        rng = self._rng
+
+        if not observation.patients or rng.random() < self.wait_probability:
+            return Action.wait(1)
+
+        patient_index = rng.randrange(len(observation.patients))
+
+        if rng.random() < self.guess_probability:
+            return Action.guess_disease(patient_index, rng.choice(self._disease_names))
+
+        return Action.perform(patient_index, rng.randrange(self._n_treatments))
@@ -0,0 +1,246 @@
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("PatientPopulation requires numpy: pip install numpy") from e
+
+from medical_simulator.core.disease import Disease
+
+
+class PopulationUpdate:
+    """
+    Outcome of a single `PatientPopulation.advance` call.
+
+    Attributes
+    ----------
+    died : np.ndarray
+        Slots of the patients that died during the update.
+    revealed : np.ndarray
+        Slots of the patients that revealed at least one new symptom.
+    """
+    def __init__(self, died: np.ndarray, revealed: np.ndarray):
+        self.died = died
+        self.revealed = revealed
+
+
+class PatientPopulation:
+    """
+    Struct-of-arrays store of patients backed by contiguous NumPy arrays.
+
+    This is an alternative to a list of `Patient` objects for large
+    populations: every attribute lives in its own array indexed by a patient
+    *slot*, and a whole population (possibly spread over many hospitals) is
+    advanced with one batched decay and symptom update per tick.
+
+    Symptoms of each disease follow `Disease.symptom_onsets`, so the revealed
+    symptoms of a patient are always a prefix of that order; bit ``i`` of the
+    ``revealed`` mask is set when the ``i``-th symptom is visible.
+
+    Parameters
+    ----------
+    diseases : list[Disease]
+        Disease catalog; patients refer to diseases by their index in this list.
+    capacity : int, optional (default=1024)
+        Initial number of slots. The store grows automatically when full.
+
+    Attributes
+    ----------
+    health : np.ndarray[int32]
+        Current health of each slot (0–100).
+    time_elapsed : np.ndarray[int32]
+        Hours elapsed since arrival.
+    disease : np.ndarray[int32]
+        Index of the disease of each slot.
+    hospital : np.ndarray[int32]
+        Index of the hospital the slot belongs to.
+    revealed : np.ndarray[uint64]
+        Bitmask of revealed symptoms (in per-disease `from_hour` order).
+    active : np.ndarray[bool]
+        True for slots currently holding a live, admitted patient.
+    """
+
+    MAX_SYMPTOMS = 64
+    _NEVER = np.iinfo(np.int32).max
+
+    def __init__(self, diseases: list[Disease], capacity: int = 1024):
+        self.diseases = diseases
+
+        width = max((len(d.symptom_onsets) for d in diseases), default=0)
+        if width > self.MAX_SYMPTOMS:
+            raise ValueError(f"At most {self.MAX_SYMPTOMS} symptoms per disease are supported, got {width}")
+
+        # from_hour of the i-th symptom of each disease, padded with "never"
+        self._from_hours = np.full((len(diseases), width + 1), self._NEVER, dtype=np.int32)
+        for i, d in enumerate(diseases):
+            self._from_hours[i, :len(d.symptom_onsets)] = [hour for hour, _ in d.symptom_onsets]
+        self._symptom_names = [[d.symptom_vocabulary[id_] for _, id_ in d.symptom_onsets] for d in diseases]
+        self._severity = np.array([d.severity for d in diseases], dtype=np.float64)
+        self._health_range = np.array([d.initial_health_range for d in diseases], dtype=np.int32).reshape(len(diseases), 2)
+
+        self.health = np.zeros(capacity, dtype=np.int32)
+        self.time_elapsed = np.zeros(capacity, dtype=np.int32)
+        self.disease = np.zeros(capacity, dtype=np.int32)
+        self.hospital = np.zeros(capacity, dtype=np.int32)
+        self.revealed = np.zeros(capacity, dtype=np.uint64)
+        self.active = np.zeros(capacity, dtype=bool)
+
+        self._revealed_count = np.zeros(capacity, dtype=np.int32)
+        self._next_reveal = np.full(capacity, self._NEVER, dtype=np.int32)
+        self._free: list[int] = list(range(capacity - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return int(self.active.sum())
+
+    @property
+    def capacity(self) -> int:
+        return self.health.shape[0]
+
+    # -------------------------
+    # Admission and removal
+    # -------------------------
+
+    def add(self, disease_index: int, health: int, hospital: int = 0) -> int:
+        """
+        Admits a patient and returns its slot.
+        """
+        if not self._free:
+            self._grow()
+
+        slot = self._free.pop()
+        self.health[slot] = health
+        self.time_elapsed[slot] = 0
+        self.disease[slot] = disease_index
+        self.hospital[slot] = hospital
+        self.revealed[slot] = 0
+        self._revealed_count[slot] = 0
+        self._next_reveal[slot] = self._from_hours[disease_index, 0]
+        self.active[slot] = True
+
+        # symptoms that are present from the start
+        self._reveal(np.array([slot]))
+        return slot
+
+    def add_many(self, disease_indices: np.ndarray, health: np.ndarray, hospital: int = 0) -> np.ndarray:
+        """
+        Admits a batch of patients and returns their slots.
+        """
+        disease_indices = np.asarray(disease_indices, dtype=np.int32)
+        while len(self._free) < disease_indices.shape[0]:
+            self._grow()
+
+        slots = np.array([self._free.pop() for _ in range(disease_indices.shape[0])], dtype=np.intp)
+        self.health[slots] = health
+        self.time_elapsed[slots] = 0
+        self.disease[slots] = disease_indices
+        self.hospital[slots] = hospital
+        self.revealed[slots] = 0
+        self._revealed_count[slots] = 0
+        self._next_reveal[slots] = self._from_hours[disease_indices, 0]
+        self.active[slots] = True
+
+        self._reveal(slots)
+        return slots
+
+    def admit_random(self, n: int, hospital: int = 0, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Admits `n` patients with uniformly drawn diseases and initial health, like
+        `generate_random_patient` does one patient at a time.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        disease_indices = rng.integers(0, len(self.diseases), size=n)
+        low, high = self._health_range[disease_indices].T
+        return self.add_many(disease_indices, rng.integers(low, high, endpoint=True), hospital)
+
+    def remove(self, slot: int) -> None:
+        if not self.active[slot]:
+            return
+        self.active[slot] = False
+        self._free.append(int(slot))
+
+    def remove_hospital(self, hospital: int) -> np.ndarray:
+        """
+        Removes every patient of a hospital (e.g. at the end of the day) and returns their slots.
+        """
+        slots = np.flatnonzero(self.active & (self.hospital == hospital))
+        self.active[slots] = False
+        self._free.extend(int(s) for s in slots)
+        return slots
+
+    def slots(self, hospital: Optional[int] = None) -> np.ndarray:
+        if hospital is None:
+            return np.flatnonzero(self.active)
+        return np.flatnonzero(self.active & (self.hospital == hospital))
+
+    # -------------------------
+    # Time progression
+    # -------------------------
+
+    def advance(self, hours: int = 1, rng: Optional[np.random.Generator] = None, hospital: Optional[int] = None) -> PopulationUpdate:
+        """
+        Advances every active patient (or only those of `hospital`) by `hours`,
+        with one batched update.
+
+        Health decays by ``severity * hours * U(0.5, 1.0)`` and is truncated to an
+        integer, exactly like `Patient.advance_time`. Patients whose health reaches
+        zero are deactivated and reported in the returned update. Pass
+        `SimulationRNG.numpy()` as `rng` for reproducible runs.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+
+        slots = self.slots(hospital)
+        self.time_elapsed[slots] += hours
+
+        revealed = self._reveal(slots)
+
+        decay = self._severity[self.disease[slots]] * hours * rng.uniform(0.5, 1.0, size=slots.shape[0])
+        health = np.trunc(self.health[slots] - decay)
+        np.maximum(health, 0, out=health)
+        self.health[slots] = health
+
+        died = slots[health <= 0]
+        self.active[died] = False
+        self._free.extend(int(s) for s in died)
+
+        return PopulationUpdate(died, revealed)
+
+    def _reveal(self, slots: np.ndarray) -> np.ndarray:
+        due = slots[self.time_elapsed[slots] >= self._next_reveal[slots]]
+        if due.shape[0] == 0:
+            return due
+
+        counts = (self._from_hours[self.disease[due]] <= self.time_elapsed[due, None]).sum(axis=1).astype(np.int32)
+        self._revealed_count[due] = counts
+        self._next_reveal[due] = self._from_hours[self.disease[due], counts]
+        self.revealed[due] = np.where(
+            counts >= self.MAX_SYMPTOMS,
+            np.uint64(np.iinfo(np.uint64).max),
+            (np.uint64(1) << counts.astype(np.uint64)) - np.uint64(1),
+        )
+        return due
+
+    def _grow(self) -> None:
+        old = self.capacity
+        new = max(1, old * 2)
+        for name in ("health", "time_elapsed", "disease", "hospital", "revealed", "active", "_revealed_count"):
+            array = getattr(self, name)
+            grown = np.zeros(new, dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+
+        grown = np.full(new, self._NEVER, dtype=np.int32)
+        grown[:old] = self._next_reveal
+        self._next_reveal = grown
+
+        self._free.extend(range(new - 1, old - 1, -1))
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def is_dead(self, slot: int) -> bool:
+        return self.health[slot] <= 0
+
+    def visible_symptoms(self, slot: int) -> list[str]:
+        names = self._symptom_names[self.disease[slot]]
+        return names[:self._revealed_count[slot]]
@@ -0,0 +1,214 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from medical_simulator.core.case_result import CaseResult
+
+
+COLUMNS = ("run_id", "day", "hour", "patient_name", "disease", "outcome", "score", "health", "actions")
+
+
+def result_row(run_id: int, result: CaseResult) -> tuple:
+    """
+    Flattens a case result into a row following `COLUMNS`.
+    """
+    return (
+        run_id,
+        result.day,
+        result.hour,
+        result.patient_name,
+        result.disease,
+        result.outcome.value,
+        result.score,
+        result.health,
+        result.actions,
+    )
+
+
+class ResultSink(ABC):
+    """
+    Destination of the case results of one or many simulation runs.
+
+    Results are buffered and handed to `_write_rows` in batches of
+    `batch_size`, so memory stays bounded however many cases are streamed.
+    Sinks are context managers; leaving the block flushes and closes them.
+
+    Parameters
+    ----------
+    batch_size : int, optional (default=10000)
+        Number of rows buffered before they are written out.
+    """
+
+    def __init__(self, batch_size: int = 10000):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._buffer: list[tuple] = []
+
+    def write(self, run_id: int, result: CaseResult) -> None:
+        self._buffer.append(result_row(run_id, result))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, run_id: int, results: list[CaseResult]) -> None:
+        for result in results:
+            self.write(run_id, result)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._write_rows(self._buffer)
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+
+    @abstractmethod
+    def _write_rows(self, rows: list[tuple]) -> None:
+        """
+        Writes out a batch of rows following `COLUMNS`.
+        """
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class MemorySink(ResultSink):
+    """
+    Keeps every row in memory; handy for small runs and interactive analysis.
+
+    Attributes
+    ----------
+    rows : list[tuple]
+        Rows written so far, following `COLUMNS`.
+    """
+
+    def __init__(self, batch_size: int = 10000):
+        super().__init__(batch_size)
+        self.rows: list[tuple] = []
+
+    def _write_rows(self, rows: list[tuple]) -> None:
+        self.rows.extend(rows)
+
+
+class JsonlSink(ResultSink):
+    """
+    Writes one JSON object per case result (JSON Lines).
+
+    Parameters
+    ----------
+    path : str | Path
+        Output file, overwritten.
+    batch_size : int, optional (default=10000)
+        Number of rows buffered before they are written out.
+    """
+
+    def __init__(self, path: Union[str, Path], batch_size: int = 10000):
+        super().__init__(batch_size)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def _write_rows(self, rows: list[tuple]) -> None:
+        self._file.write("".join(
+            json.dumps(dict(zip(COLUMNS, row[:-1] + (list(row[-1]),)))) + "\n" for row in rows
+        ))
+
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+
+class CsvSink(ResultSink):
+    """
+    Writes case results as CSV with a header row; actions are joined with ``|``.
+
+    Parameters
+    ----------
+    path : str | Path
+        Output file, overwritten.
+    batch_size : int, optional (default=10000)
+        Number of rows buffered before they are written out.
+    """
+
+    def __init__(self, path: Union[str, Path], batch_size: int = 10000):
+        super().__init__(batch_size)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+
+    def _write_rows(self, rows: list[tuple]) -> None:
+        self._writer.writerows(row[:-1] + ("|".join(row[-1]),) for row in rows)
+
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+
+class ParquetSink(ResultSink):
+    """
+    Writes case results to a columnar Parquet file, one row group per batch.
+
+    Requires `pyarrow`.
+
+    Parameters
+    ----------
+    path : str | Path
+        Output file, overwritten.
+    batch_size : int, optional (default=10000)
+        Number of rows per row group.
+    """
+
+    def __init__(self, path: Union[str, Path], batch_size: int = 10000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("ParquetSink requires pyarrow: pip install pyarrow") from e
+
+        super().__init__(batch_size)
+        self._pa = pa
+        self._schema = pa.schema([
+            ("run_id", pa.int64()),
+            ("day", pa.int32()),
+            ("hour", pa.int32()),
+            ("patient_name", pa.string()),
+            ("disease", pa.string()),
+            ("outcome", pa.dictionary(pa.int8(), pa.string())),
+            ("score", pa.int32()),
+            ("health", pa.int32()),
+            ("actions", pa.list_(pa.string())),
+        ])
+        self._writer = pq.ParquetWriter(str(path), self._schema)
+
+    def _write_rows(self, rows: list[tuple]) -> None:
+        columns = [list(column) for column in zip(*rows)]
+        columns[-1] = [list(actions) for actions in columns[-1]]
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self) -> None:
+        super().close()
+        self._writer.close()
+
+
+SINKS_BY_SUFFIX = {
+    ".jsonl": JsonlSink,
+    ".ndjson": JsonlSink,
+    ".csv": CsvSink,
+    ".parquet": ParquetSink,
+}
+
+
+def open_sink(path: Union[str, Path], batch_size: int = 10000) -> ResultSink:
+    """
+    Opens the sink matching the extension of `path` (.jsonl/.ndjson, .csv or .parquet).
+    """
+    suffix = Path(path).suffix.lower()
+    sink_class: Optional[type] = SINKS_BY_SUFFIX.get(suffix)
+    if sink_class is None:
+        raise ValueError(f"Unsupported result file extension {suffix!r}; expected one of {sorted(SINKS_BY_SUFFIX)}")
+    return sink_class(path, batch_size=batch_size)
@@ -0,0 +1,63 @@
+import heapq
+from typing import Any, Callable, Optional
+
+from medical_simulator.core.clock import Clock
+
+
+class Scheduler:
+    """
+    Discrete-event queue driving the simulation clock.
+
+    Events are ordered by hour, then by phase, then by insertion order. The
+    phases reproduce the order in which things used to happen within one hour
+    of the tick loop: new arrivals first, then patient updates (symptoms,
+    deaths), then the completion of the doctor's action.
+
+    Attributes
+    ----------
+    ARRIVAL, PATIENT, COMPLETION : int
+        Phases of an hour, in processing order.
+    """
+
+    ARRIVAL = 0
+    PATIENT = 1
+    COMPLETION = 2
+
+    def __init__(self):
+        self._queue: list[tuple] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def schedule(self, hour: int, phase: int, handler: Callable[..., Any], *args: Any) -> None:
+        self._seq += 1
+        heapq.heappush(self._queue, (hour, phase, self._seq, handler, args))
+
+    def next_hour(self) -> Optional[int]:
+        return self._queue[0][0] if self._queue else None
+
+    def run_until(self, hour: int, clock: Clock) -> int:
+        """
+        Processes every event due at or before `hour`, moving `clock` to each
+        event's hour before handling it, and finally to `hour` itself.
+
+        Returns the number of events processed.
+        """
+        queue = self._queue
+        processed = 0
+
+        while queue and queue[0][0] <= hour:
+            event_hour, _, _, handler, args = heapq.heappop(queue)
+            if event_hour > clock.hour:
+                clock.advance(event_hour - clock.hour)
+            handler(*args)
+            processed += 1
+
+        if hour > clock.hour:
+            clock.advance(hour - clock.hour)
+
+        return processed
+
+    def clear(self) -> None:
+        self._queue.clear()
@@ -0,0 +1,62 @@
+class ScoringRules:
+    """
+    Scoring constants of a simulation.
+
+    The defaults are the game's original rules: a discharged patient is worth
+    ``100 + 0.3 * health``, a patient still waiting at the end of the day
+    ``0.8 * health``, a death -100, and a wrong diagnosis costs the patient 30
+    health points (a right one gives back 10).
+
+    Parameters
+    ----------
+    discharge_base : float, optional (default=100)
+        Points for every correctly diagnosed patient.
+    discharge_health_weight : float, optional (default=0.3)
+        Extra points per health point left at discharge.
+    unresolved_health_weight : float, optional (default=0.8)
+        Points per health point of a patient left waiting at the end of the day.
+    death_score : float, optional (default=-100)
+        Points for a patient who dies.
+    misdiagnosis_penalty : float, optional (default=30)
+        Health points lost on a wrong diagnosis.
+    diagnosis_bonus : float, optional (default=10)
+        Health points gained on a correct diagnosis (health is capped at 100).
+    """
+
+    FIELDS = (
+        "discharge_base", "discharge_health_weight", "unresolved_health_weight",
+        "death_score", "misdiagnosis_penalty", "diagnosis_bonus"
+    )
+
+    __slots__ = FIELDS
+
+    def __init__(
+        self,
+        discharge_base: float = 100,
+        discharge_health_weight: float = 0.3,
+        unresolved_health_weight: float = 0.8,
+        death_score: float = -100,
+        misdiagnosis_penalty: float = 30,
+        diagnosis_bonus: float = 10
+    ):
+        self.discharge_base = discharge_base
+        self.discharge_health_weight = discharge_health_weight
+        self.unresolved_health_weight = unresolved_health_weight
+        self.death_score = death_score
+        self.misdiagnosis_penalty = misdiagnosis_penalty
+        self.diagnosis_bonus = diagnosis_bonus
+
+    def discharge(self, health: int) -> int:
+        return int(self.discharge_base) + int(health * self.discharge_health_weight)
+
+    def unresolved(self, health: int) -> int:
+        return int(health * self.unresolved_health_weight)
+
+    def death(self) -> int:
+        return int(self.death_score)
+
+    def to_dict(self) -> dict[str, float]:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __repr__(self) -> str:
+        return f"ScoringRules({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
@@ -0,0 +1,492 @@
+import asyncio
+import itertools
+import json
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Optional
+
+from medical_simulator.core.case_result import CaseResult
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.engine import Action, ActionKind, Observation, SimulationEngine
+from medical_simulator.core.events import Event
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.treatment import Treatment
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+from medical_simulator.utils.utils import build_treatments
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# longest accepted request line
+MAX_LINE = 64 * 1024
+
+
+# -------------------------
+# JSON encoding
+# -------------------------
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, CaseResult):
+        return {name: _jsonable(getattr(value, name)) for name in CaseResult.__slots__}
+    if isinstance(value, Patient):
+        return value.name
+    return str(value)
+
+
+def observation_to_dict(observation: Observation) -> dict[str, Any]:
+    return {
+        "day": observation.day,
+        "hour": observation.hour,
+        "total_score": observation.total_score,
+        "done": observation.done,
+        "patients": [_jsonable(vars(p)) for p in observation.patients],
+    }
+
+
+def event_to_dict(event: Event, hospital: Hospital) -> dict[str, Any]:
+    data = {"kind": event.kind.value, "day": event.day, "hour": event.hour}
+    if event.patient is not None:
+        data["patient"] = event.patient.name
+        patient_id = hospital.waiting_room.id_of(event.patient)
+        if patient_id is not None:
+            data["patient_id"] = patient_id
+    if event.data:
+        data["data"] = _jsonable(event.data)
+    return data
+
+
+def action_from_dict(data: dict[str, Any], treatments: list[Treatment]) -> Action:
+    """
+    Builds an `Action` from its JSON form, e.g. ``{"kind": "perform",
+    "patient": 0, "treatment": "X-Ray"}``. Treatments are given by index or name.
+
+    Raises
+    ------
+    ValueError
+        If the action is malformed.
+    """
+    try:
+        kind = ActionKind(data.get("kind"))
+    except ValueError:
+        raise ValueError(f"Unknown action kind: {data.get('kind')!r}") from None
+
+    if kind is ActionKind.WAIT:
+        hours = data.get("hours", 1)
+        if not isinstance(hours, int) or hours < 1:
+            raise ValueError(f"Invalid hours: {hours!r}")
+        return Action.wait(hours)
+    if kind is ActionKind.END_DAY:
+        return Action.end_day()
+
+    patient = data.get("patient")
+    if not isinstance(patient, int):
+        raise ValueError(f"Invalid patient index: {patient!r}")
+    if kind is ActionKind.GUESS:
+        return Action.guess_disease(patient, str(data.get("guess", "")))
+
+    treatment = data.get("treatment")
+    if isinstance(treatment, str):
+        names = [t.name.lower() for t in treatments]
+        if treatment.lower() not in names:
+            raise ValueError(f"Unknown treatment: {treatment!r}")
+        treatment = names.index(treatment.lower())
+    if not isinstance(treatment, int):
+        raise ValueError(f"Invalid treatment: {treatment!r}")
+    return Action.perform(patient, treatment)
+
+
+# -------------------------
+# Sessions
+# -------------------------
+
+class LatencyStats:
+    """
+    Service time of the requests of one session (or of the whole server).
+
+    Parameters
+    ----------
+    window : int, optional (default=256)
+        Number of most recent requests the percentiles are computed on.
+    """
+
+    __slots__ = ("count", "total", "maximum", "recent")
+
+    def __init__(self, window: int = 256):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+        self.recent.append(seconds)
+
+    def summary(self) -> dict[str, float]:
+        recent = sorted(self.recent)
+
+        def percentile(p: float) -> float:
+            return recent[min(len(recent) - 1, int(p * len(recent)))] * 1e3 if recent else 0.0
+
+        return {
+            "requests": self.count,
+            "mean_ms": self.total / self.count * 1e3 if self.count else 0.0,
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+            "max_ms": self.maximum * 1e3,
+        }
+
+
+class Session:
+    """
+    One trainee's simulation, hosted by a `SessionServer`.
+
+    A session is only its engine and a few counters: nothing runs for it
+    between requests.
+
+    Attributes
+    ----------
+    id : int
+        Identifier the client refers to the session by.
+    engine : SimulationEngine
+        Engine of the session's own hospital.
+    last_active : float
+        Monotonic time of the last request.
+    latency : LatencyStats
+        Service time of the session's requests.
+    """
+
+    __slots__ = ("id", "engine", "created", "last_active", "latency")
+
+    def __init__(self, session_id: int, engine: SimulationEngine):
+        self.id = session_id
+        self.engine = engine
+        self.created = self.last_active = time.monotonic()
+        self.latency = LatencyStats()
+
+
+class SessionServer:
+    """
+    Hosts many independent simulator sessions in one process.
+
+    Clients speak JSON lines over TCP: every request is one JSON object with
+    an ``op`` field (and an optional ``id`` echoed back), answered by one JSON
+    object with ``ok`` and either the result or an ``error``. The operations
+    are:
+
+    - ``open`` (``seed``, ``max_days``, ``capacity``, all optional): starts a
+      session; returns ``session``, ``observation`` and ``events``.
+    - ``step`` (``session``, ``action``): applies an action (see
+      `action_from_dict`); returns ``observation``, ``events`` and ``done``.
+      A wait never goes past the end of the current day.
+    - ``observe`` (``session``): returns the current ``observation``.
+    - ``close`` (``session``): ends the session.
+    - ``stats`` (``session`` optional): latency and session counts.
+
+    Requests are served on the event loop, one at a time: a step takes well
+    under a millisecond, so thousands of sessions, over any number of
+    connections, are multiplexed without threads.
+
+    Parameters
+    ----------
+    diseases : list[Disease]
+        Catalog shared by every session.
+    treatments : list[Treatment] | None, optional (default=None)
+        Available treatments; `build_treatments()` when omitted.
+    max_sessions : int, optional (default=10000)
+        Sessions open at once; ``open`` fails beyond it.
+    idle_timeout : float | None, optional (default=None)
+        Seconds after which an inactive session is closed; never when omitted.
+    """
+
+    def __init__(
+        self,
+        diseases: list[Disease],
+        treatments: Optional[list[Treatment]] = None,
+        max_sessions: int = 10_000,
+        idle_timeout: Optional[float] = None
+    ):
+        self.diseases = diseases
+        self.treatments = treatments if treatments is not None else build_treatments()
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.sessions: dict[int, Session] = {}
+        self.latency = LatencyStats(window=4096)
+        self.expired = 0
+        self._ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._expire_task: Optional[asyncio.Task] = None
+
+    # -------------------------
+    # Requests
+    # -------------------------
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Serves one decoded request and returns the response, timing it.
+        """
+        start = time.perf_counter()
+        session = None
+        try:
+            op = request.get("op")
+            handler = self._OPS.get(op)
+            if handler is None:
+                raise ValueError(f"Unknown op: {op!r}")
+            if op in ("step", "observe", "close"):
+                session = self._session(request)
+                result = handler(self, session, request)
+            else:
+                result = handler(self, request)
+            response = {"ok": True, **result}
+        except (ValueError, TypeError, RuntimeError) as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception as e:
+            # a bug must not take down the connection, nor the other sessions on it
+            response = {"ok": False, "error": f"Internal error: {type(e).__name__}: {e}"}
+
+        if "id" in request:
+            response["id"] = request["id"]
+
+        elapsed = time.perf_counter() - start
+        self.latency.add(elapsed)
+        if session is not None:
+            session.latency.add(elapsed)
+            session.last_active = time.monotonic()
+        return response
+
+    def _session(self, request: dict[str, Any]) -> Session:
+        session = self.sessions.get(request.get("session"))
+        if session is None:
+            raise ValueError(f"Unknown session: {request.get('session')!r}")
+        return session
+
+    def _events(self, session: Session, events: list[Event]) -> list[dict[str, Any]]:
+        hospital = session.engine.hospital
+        return [event_to_dict(e, hospital) for e in events]
+
+    def _open(self, request: dict[str, Any]) -> dict[str, Any]:
+        if len(self.sessions) >= self.max_sessions:
+            raise RuntimeError(f"Too many sessions open ({self.max_sessions})")
+
+        hospital = Hospital(
+            clock=Clock(),
+            waiting_room=WaitingRoom(int(request.get("capacity", 4))),
+            diseases=self.diseases,
+            treatments=self.treatments,
+            max_days=int(request.get("max_days", 5)),
+            rng=SimulationRNG(request.get("seed"))
+        )
+        session = Session(next(self._ids), SimulationEngine(hospital))
+        self.sessions[session.id] = session
+
+        observation, events = session.engine.reset()
+        return {
+            "session": session.id,
+            "observation": observation_to_dict(observation),
+            "events": self._events(session, events),
+        }
+
+    def _step(self, session: Session, request: dict[str, Any]) -> dict[str, Any]:
+        action = request.get("action")
+        if not isinstance(action, dict):
+            raise ValueError("Missing action")
+        action = action_from_dict(action, self.treatments)
+        if action.kind is ActionKind.WAIT:
+            # requests are served on the event loop: bound the work of one step
+            action = Action.wait(max(1, min(action.hours, session.engine.hospital.clock.hours_left())))
+        observation, events = session.engine.step(action)
+        return {
+            "observation": observation_to_dict(observation),
+            "events": self._events(session, events),
+            "done": observation.done,
+        }
+
+    def _observe(self, session: Session, request: dict[str, Any]) -> dict[str, Any]:
+        return {"observation": observation_to_dict(session.engine.observe())}
+
+    def _close(self, session: Session, request: dict[str, Any]) -> dict[str, Any]:
+        del self.sessions[session.id]
+        return {"total_score": session.engine.hospital.total_score}
+
+    def _stats(self, request: dict[str, Any]) -> dict[str, Any]:
+        if request.get("session") is not None:
+            return {"latency": self._session(request).latency.summary()}
+        return {"sessions": len(self.sessions), "expired": self.expired, "latency": self.latency.summary()}
+
+    _OPS = {
+        "open": _open,
+        "step": _step,
+        "observe": _observe,
+        "close": _close,
+        "stats": _stats,
+    }
+
+    def expire_idle(self) -> int:
+        """
+        Closes the sessions inactive for longer than `idle_timeout`; returns how many.
+        """
+        if self.idle_timeout is None:
+            return 0
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [sid for sid, s in self.sessions.items() if s.last_active < cutoff]
+        for sid in idle:
+            del self.sessions[sid]
+        self.expired += len(idle)
+        return len(idle)
+
+    # -------------------------
+    # Network
+    # -------------------------
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # longer than MAX_LINE: the stream cannot be resynchronized
+                    writer.write(b'{"ok": false, "error": "Request too long"}\n')
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("A request must be a JSON object")
+                except ValueError as e:
+                    response = {"ok": False, "error": f"Invalid request: {e}"}
+                else:
+                    response = self.handle(request)
+
+                writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _expire_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            self.expire_idle()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> tuple[str, int]:
+        """
+        Starts listening; returns the bound address (useful with ``port=0``).
+        """
+        self._server = await asyncio.start_server(self._serve_connection, host, port, limit=MAX_LINE)
+        if self.idle_timeout is not None:
+            self._expire_task = asyncio.get_running_loop().create_task(self._expire_loop())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        await self.start(host, port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._expire_task is not None:
+            self._expire_task.cancel()
+            # waits for the task to finish, without swallowing our own cancellation
+            await asyncio.gather(self._expire_task, return_exceptions=True)
+            self._expire_task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+# -------------------------
+# Client
+# -------------------------
+
+class SessionClient:
+    """
+    Minimal asyncio client of a `SessionServer`; one connection can drive
+    any number of sessions.
+
+    Parameters
+    ----------
+    host : str, optional (default="127.0.0.1")
+    port : int, optional (default=8765)
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> "SessionClient":
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port, limit=1 << 24)
+        return self
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def __aenter__(self) -> "SessionClient":
+        return await self.connect()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def request(self, op: str, **fields: Any) -> dict[str, Any]:
+        """
+        Sends one request and returns its response.
+
+        Raises
+        ------
+        RuntimeError
+            If the server answers with an error.
+        """
+        async with self._lock:
+            self._writer.write(json.dumps({"op": op, **fields}).encode() + b"\n")
+            await self._writer.drain()
+            line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by the server")
+
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "request failed"))
+        return response
+
+    async def open(self, seed: Optional[int] = None, max_days: int = 5, capacity: int = 4) -> dict[str, Any]:
+        return await self.request("open", seed=seed, max_days=max_days, capacity=capacity)
+
+    async def step(self, session: int, **action: Any) -> dict[str, Any]:
+        """
+        E.g. ``step(sid, kind="perform", patient=0, treatment="Blood Test")``.
+        """
+        return await self.request("step", session=session, action=action)
+
+    async def observe(self, session: int) -> dict[str, Any]:
+        return await self.request("observe", session=session)
+
+    async def close_session(self, session: int) -> dict[str, Any]:
+        return await self.request("close", session=session)
+
+    async def stats(self, session: Optional[int] = None) -> dict[str, Any]:
+        return await self.request("stats", session=session)
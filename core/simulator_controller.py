@@ -1,5 +1,11 @@
+from typing import Optional
+
+from medical_simulator.core.diagnosis import DiagnosisIndex, DifferentialDiagnosis
+from medical_simulator.core.engine import Action, SimulationEngine
+from medical_simulator.core.events import Event, EventKind
 from medical_simulator.core.hospital import Hospital
-from medical_simulator.utils.utils import generate_random_patient
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.treatment import TestType
 
 
 class SimulatorController:
@@ -7,38 +13,62 @@ class SimulatorController:
     """
     Controls the flow of the clinical decision-making simulation.
 
-    This class manages the day-to-day simulation, user interactions, and actions to the Hospital instance.
+    This class is a thin terminal front-end: it turns user input into engine
+    actions and prints the events the engine returns.
+
+    Parameters
+    ----------
+    hospital : Hospital
+        The hospital to play.
+    suggest : bool, optional (default=False)
+        Whether visits list the diseases still consistent with the findings.
+    engine : SimulationEngine | None, optional (default=None)
+        Engine driving `hospital` (e.g. a `RecordingEngine`); a plain one when omitted.
 
     Attributes
     ----------
     hospital : Hospital
         The hospital instance for the simulation.
+    engine : SimulationEngine
+        The headless engine driving the hospital.
+    suggest : bool
+        Whether visits list the diseases still consistent with the findings.
     """
 
-    def __init__(self, hospital: Hospital):
+    TEST_HEADERS = {
+        TestType.BLOOD: "Blood findings:",
+        TestType.XRAY: "X-Ray findings:",
+        TestType.VITALS: "Vital signs:",
+        TestType.ECG: "ECG findings:",
+    }
+
+    MAX_SUGGESTIONS = 10
+
+    def __init__(self, hospital: Hospital, suggest: bool = False, engine: Optional[SimulationEngine] = None):
         self.hospital = hospital
+        self.engine = engine if engine is not None else SimulationEngine(hospital)
+        self.suggest = suggest
+        self._diagnosis_index: Optional[DiagnosisIndex] = DiagnosisIndex(hospital.diseases) if suggest else None
+        self._differentials: dict[Patient, DifferentialDiagnosis] = {}
 
     def run(self) -> None:
         print("Clinical Decision-Making Simulator")
         print("---------------------------------")
 
-        while not self.hospital.is_simulation_over():
-            self.run_day()
+        _, events = self.engine.reset()
+        self.render(events)
 
-        print("\nSimulation finished.")
-        print(f"Total score: {self.hospital.total_score}")
+        while not self.engine.done:
+            self.show_status()
+            self.handle_user_choice()
 
-    def run_day(self) -> None:
-        self.hospital.start_new_day()
-        self.hospital.waiting_room.add_patient(generate_random_patient(self.hospital.diseases))
-        try:
-            while not self.hospital.clock.is_day_over():
-                self.show_status()
-                self.handle_user_choice()
-        except StopIteration:
-            pass
+    def step(self, action: Action) -> None:
+        _, events = self.engine.step(action)
+        self.render(events)
 
-        self.hospital.end_day()
+    # -------------------------
+    # Input
+    # -------------------------
 
     def show_status(self) -> None:
         print(f"\n=== Day {self.hospital.clock.day} | Hour {self.hospital.clock.hour}/12 ===")
@@ -50,10 +80,12 @@ class SimulatorController:
         choice = input("\nSelect patient or action: ").strip()
 
         if choice == "0":
-            raise StopIteration
+            self.step(Action.end_day())
+            return
 
         if choice == "9":
-            self.hospital.wait_and_observe(1)
+            print("\nWaiting for 1 hour...")
+            self.step(Action.wait(1))
             return
 
         if not choice.isdigit():
@@ -65,9 +97,119 @@ class SimulatorController:
             print("Invalid patient.")
             return
 
+        self.hospital.sync(patient)
         patient.show_patient_record()
         input("\nPress ENTER to start visit...")
-        self.hospital.visit_patient(patient)
+        self.visit_patient(patient)
+
+    def visit_patient(self, patient: Patient) -> None:
+        """
+        Handles the visit of a single patient.
+
+        It runs a loop until the player returns to the waiting room, the patient
+        leaves the waiting room, or the hospital day is over.
+        """
+        day = self.hospital.clock.day
+
+        while not self.engine.done and self.hospital.clock.day == day:
+
+            self.hospital.sync(patient)
+            if patient.is_dead() or patient not in self.hospital.waiting_room:
+                return
+
+            patient.show_patient_status()
+            if self.suggest:
+                self.show_suggestions(patient)
+            self.show_available_actions()
+
+            print("0) Back to waiting room")
+
+            choice = input("\nChoose action: ").strip()
+
+            if choice == "0":
+                return
+
+            if not choice.isdigit():
+                print("Invalid input. Please enter a number.")
+                continue
+
+            choice_num = int(choice)
+            total_actions = len(self.hospital.treatments) + 1
+            index = self.hospital.waiting_room.position(patient)
+
+            if choice_num == total_actions:
+                guess = input("Enter the disease name: ").strip()
+                self.step(Action.guess_disease(index, guess))
+
+            elif 1 <= choice_num < total_actions:
+                self.step(Action.perform(index, choice_num - 1))
+
+    def show_suggestions(self, patient: Patient) -> None:
+        differential = self._differentials.get(patient)
+        if differential is None:
+            differential = self._differentials[patient] = self._diagnosis_index.tracker()
+
+        names = differential.update(patient)
+        shown = ", ".join(names[:self.MAX_SUGGESTIONS])
+        more = f" (+{len(names) - self.MAX_SUGGESTIONS} more)" if len(names) > self.MAX_SUGGESTIONS else ""
+        print(f"Consistent diagnoses: {shown or 'none'}{more}")
+
+    def show_available_actions(self) -> None:
+        print("\nAvailable actions:")
+        for i, t in enumerate(self.hospital.treatments, start=1):
+            print(f"{i}) {t.name} ({t.time_cost}h) – {t.description}")
+
+        print(f"{len(self.hospital.treatments) + 1}) Guess Disease")
+
+    # -------------------------
+    # Output
+    # -------------------------
+
+    def render(self, events: list[Event]) -> None:
+        for event in events:
+            self.render_event(event)
+
+    def render_event(self, event: Event) -> None:
+        kind = event.kind
+
+        if kind is EventKind.ARRIVAL:
+            print(f"New patient arrived: {event.patient.name}")
+
+        elif kind is EventKind.DIVERTED:
+            print("A patient was diverted: the waiting room is full.")
+
+        elif kind is EventKind.DEATH:
+            print(f"\nPatient {event.patient.name} has died.")
+
+        elif kind is EventKind.TEST_RESULT:
+            print(f"\n{self.TEST_HEADERS.get(event.data['test_type'], 'Findings:')}")
+            findings = event.data["findings"]
+            if isinstance(findings, dict):
+                for name, value in findings.items():
+                    print(f"- {name}: {value}")
+            else:
+                for f in findings:
+                    print(f"- {f}")
+
+        elif kind is EventKind.TREATMENT_RESULT:
+            print(f"- treatment {'effective' if event.data['effective'] else 'ineffective'}")
+
+        elif kind is EventKind.DIAGNOSIS:
+            if event.data["correct"]:
+                print(f"Correct! The patient had {event.patient.disease.name}.")
+            else:
+                print("Incorrect.")
+
+        elif kind is EventKind.DAY_ENDED:
+            print("\n--- Day Summary ---")
 
+            for r in event.data["results"]:
+                print(f"{r.patient_name}: {r.outcome.value} → {r.score} points")
 
+            print(f"Total day score: {event.data['day_score']}")
+            # every patient left with the day
+            self._differentials.clear()
 
+        elif kind is EventKind.SIMULATION_ENDED:
+            print("\nSimulation finished.")
+            print(f"Total score: {event.data['total_score']}")
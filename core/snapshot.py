@@ -0,0 +1,175 @@
+import copy
+import io
+import pickle
+import zlib
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.engine import SimulationEngine
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.result_sink import ResultSink
+from medical_simulator.core.treatment import Treatment
+
+
+CHECKPOINT_MAGIC = b"MSCK"
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointError(ValueError):
+    """
+    Raised when a checkpoint is malformed or does not match the given catalog.
+    """
+
+
+def _hospital_of(obj: Union[Hospital, SimulationEngine]) -> Hospital:
+    if isinstance(obj, SimulationEngine):
+        return obj.hospital
+    if isinstance(obj, Hospital):
+        return obj
+    raise TypeError(f"Expected a Hospital or a SimulationEngine, got {type(obj).__name__}")
+
+
+# -------------------------
+# Fork
+# -------------------------
+
+def fork(obj: Any, hospital: Optional[Hospital] = None, keep_sink: bool = False) -> Any:
+    """
+    Returns an independent copy of simulation state to branch from.
+
+    `obj` is a `Hospital`, a `SimulationEngine`, or any structure holding
+    them, as for `dumps` (e.g. an engine together with its policy, or a ward
+    and its policy); objects shared within it stay shared in the copy.
+    Everything that evolves (clock, waiting room, patients and their random
+    streams, pending events and results) is copied; the disease catalog and
+    the treatments are read-only and shared with the original, which keeps
+    forks cheap. Both copies continue identically if driven the same way.
+
+    Parameters
+    ----------
+    obj : Any
+        State to fork.
+    hospital : Hospital | None, optional (default=None)
+        Hospital whose catalog is shared; inferred when `obj` is a hospital or engine.
+    keep_sink : bool, optional (default=False)
+        Whether the fork streams its results to the original's result sink.
+        By default forks have none, so what-if branches do not end up in the
+        results of the main run.
+    """
+    hospital = hospital if hospital is not None else _hospital_of(obj)
+
+    # pre-seeding the memo makes deepcopy reuse these objects instead of copying them
+    memo: dict[int, Any] = {id(hospital.diseases): hospital.diseases, id(hospital.treatments): hospital.treatments}
+    for disease in hospital.diseases:
+        memo[id(disease)] = disease
+    for treatment in hospital.treatments:
+        memo[id(treatment)] = treatment
+    if hospital.result_sink is not None:
+        memo[id(hospital.result_sink)] = hospital.result_sink if keep_sink else None
+
+    return copy.deepcopy(obj, memo)
+
+
+# -------------------------
+# Checkpoints
+# -------------------------
+
+class _CheckpointPickler(pickle.Pickler):
+    """
+    Pickles simulation state, writing catalog objects as references by name.
+    """
+
+    def __init__(self, file, hospital: Hospital):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._refs: dict[int, tuple] = {id(hospital.diseases): ("diseases",), id(hospital.treatments): ("treatments",)}
+        for disease in hospital.diseases:
+            self._refs[id(disease)] = ("disease", disease.name)
+        for treatment in hospital.treatments:
+            self._refs[id(treatment)] = ("treatment", treatment.name)
+        if hospital.result_sink is not None:
+            self._refs[id(hospital.result_sink)] = ("sink",)
+
+    def persistent_id(self, obj: Any) -> Optional[tuple]:
+        return self._refs.get(id(obj))
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, diseases: list[Disease], treatments: list[Treatment], result_sink: Optional[ResultSink]):
+        super().__init__(file)
+        self._objects = {
+            ("diseases",): diseases,
+            ("treatments",): treatments,
+            ("sink",): result_sink,
+        }
+        self._objects.update({("disease", d.name): d for d in diseases})
+        self._objects.update({("treatment", t.name): t for t in treatments})
+
+    def persistent_load(self, pid: tuple) -> Any:
+        try:
+            return self._objects[tuple(pid)]
+        except KeyError:
+            raise CheckpointError(f"The checkpoint refers to {pid[0]} {pid[1]!r}, missing from the given catalog") from None
+
+
+def dumps(obj: Any, hospital: Optional[Hospital] = None, level: int = 6) -> bytes:
+    """
+    Serializes simulation state into a compact, compressed checkpoint.
+
+    `obj` is a `Hospital`, a `SimulationEngine`, or any picklable structure
+    holding them (e.g. an engine together with its policy). Diseases and
+    treatments are stored by name and must be supplied again to `loads`.
+
+    Parameters
+    ----------
+    obj : Any
+        State to serialize.
+    hospital : Hospital | None, optional (default=None)
+        Hospital whose catalog is referenced; inferred when `obj` is a hospital or engine.
+    level : int, optional (default=6)
+        zlib compression level.
+    """
+    hospital = hospital if hospital is not None else _hospital_of(obj)
+
+    buffer = io.BytesIO()
+    _CheckpointPickler(buffer, hospital).dump(obj)
+    return CHECKPOINT_MAGIC + bytes([CHECKPOINT_VERSION]) + zlib.compress(buffer.getvalue(), level)
+
+
+def loads(data: bytes, diseases: list[Disease], treatments: list[Treatment], result_sink: Optional[ResultSink] = None) -> Any:
+    """
+    Restores state written by `dumps`, against the given catalog and treatments.
+
+    Raises
+    ------
+    CheckpointError
+        If `data` is not a checkpoint of a supported version, or refers to
+        diseases or treatments that are not in the given catalog.
+    """
+    header = len(CHECKPOINT_MAGIC) + 1
+    if data[:len(CHECKPOINT_MAGIC)] != CHECKPOINT_MAGIC:
+        raise CheckpointError("Not a simulation checkpoint")
+    if data[header - 1] != CHECKPOINT_VERSION:
+        raise CheckpointError(f"Unsupported checkpoint version {data[header - 1]}")
+
+    try:
+        payload = zlib.decompress(data[header:])
+    except zlib.error as e:
+        raise CheckpointError(f"Corrupted checkpoint: {e}") from e
+
+    return _CheckpointUnpickler(io.BytesIO(payload), diseases, treatments, result_sink).load()
+
+
+def save(obj: Any, path: Union[str, Path], hospital: Optional[Hospital] = None) -> None:
+    """
+    Writes a checkpoint to `path`, atomically replacing any previous one.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(dumps(obj, hospital))
+    tmp.replace(path)
+
+
+def load(path: Union[str, Path], diseases: list[Disease], treatments: list[Treatment], result_sink: Optional[ResultSink] = None) -> Any:
+    return loads(Path(path).read_bytes(), diseases, treatments, result_sink)
@@ -0,0 +1,477 @@
+"""
+Parameter sweeps over the scoring rules, treatments and diseases.
+
+Every point of a sweep is played on the same seeds (common random numbers),
+so differences between points come from the parameters rather than from
+the patients drawn. Completed points are cached on disk, one JSON file each,
+so an interrupted sweep resumes where it stopped.
+
+Run from the folder containing the medical_simulator package::
+
+    python -m medical_simulator.core.sweep --grid misdiagnosis_penalty=10,30,50 \\
+        --lhs severity_scale=0.5:2 --points 20 --runs 200 --cache sweep_cache --csv sweep.csv
+"""
+import argparse
+import copy
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Sequence, Union
+
+from medical_simulator.core.batch import DEFAULT_DISEASES_PATH, run_simulation
+from medical_simulator.core.case_result import Outcome
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.policies import Policy, RandomPolicy, WaitPolicy
+from medical_simulator.core.scoring import ScoringRules
+from medical_simulator.core.treatment import Treatment
+from medical_simulator.utils.catalog import catalog_key, load_catalog
+from medical_simulator.utils.utils import build_treatments
+
+
+CACHE_VERSION = 1
+
+Point = dict[str, float]
+
+
+# -------------------------
+# Parameters
+# -------------------------
+
+def describe_parameters(diseases: list[Disease], treatments: list[Treatment]) -> list[str]:
+    """
+    Names of every parameter a sweep can vary:
+
+    - the fields of `ScoringRules` (e.g. ``misdiagnosis_penalty``);
+    - ``severity_scale``, multiplying the severity of every disease;
+    - ``severity.<disease>``, the severity of one disease;
+    - ``effect.<treatment>`` and ``penalty.<treatment>``, of one treatment.
+    """
+    names = list(ScoringRules.FIELDS) + ["severity_scale"]
+    names += [f"severity.{d.name}" for d in diseases]
+    for t in treatments:
+        if t.test_type is None:
+            names += [f"effect.{t.name}", f"penalty.{t.name}"]
+    return names
+
+
+def apply_point(point: Mapping[str, float], diseases: list[Disease], treatments: list[Treatment]) -> tuple[list[Disease], list[Treatment], ScoringRules]:
+    """
+    Catalog, treatments and scoring rules of one point of a sweep.
+
+    Diseases and treatments that a parameter changes are copied; the others
+    are shared with the originals, which are never modified.
+
+    Raises
+    ------
+    ValueError
+        If a parameter is unknown.
+    """
+    scoring = ScoringRules()
+    severities: dict[str, float] = {}
+    scale = 1.0
+    treatment_changes: dict[str, dict[str, int]] = {}
+    disease_names = {d.name for d in diseases}
+    treatment_names = {t.name for t in treatments if t.test_type is None}
+
+    for name, value in point.items():
+        kind, _, target = name.partition(".")
+        if name in ScoringRules.FIELDS:
+            setattr(scoring, name, value)
+        elif name == "severity_scale":
+            scale = float(value)
+        elif kind == "severity" and target in disease_names:
+            severities[target] = float(value)
+        elif kind in ("effect", "penalty") and target in treatment_names:
+            # health stays an integer
+            treatment_changes.setdefault(target, {})[kind] = int(round(value))
+        else:
+            raise ValueError(f"Unknown sweep parameter: {name!r}")
+
+    if scale != 1.0 or severities:
+        changed = []
+        for disease in diseases:
+            severity = severities.get(disease.name, disease.severity) * scale
+            if severity != disease.severity:
+                disease = copy.copy(disease)
+                disease.severity = severity
+            changed.append(disease)
+        diseases = changed
+
+    if treatment_changes:
+        changed = []
+        for treatment in treatments:
+            if treatment.name in treatment_changes:
+                treatment = copy.copy(treatment)
+                for attribute, value in treatment_changes[treatment.name].items():
+                    setattr(treatment, attribute, value)
+            changed.append(treatment)
+        treatments = changed
+
+    return diseases, treatments, scoring
+
+
+# -------------------------
+# Designs
+# -------------------------
+
+def grid(axes: Mapping[str, Sequence[float]]) -> list[Point]:
+    """
+    Every combination of the values of `axes` (a full factorial design).
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[n] for n in names))]
+
+
+def latin_hypercube(bounds: Mapping[str, tuple[float, float]], n_points: int, seed: int = 0) -> list[Point]:
+    """
+    `n_points` points spread over the box `bounds` by Latin hypercube sampling:
+    the range of every parameter is cut into `n_points` equal strata, and each
+    stratum is sampled exactly once.
+    """
+    rng = random.Random(seed)
+    columns = {}
+    for name, (low, high) in bounds.items():
+        strata = list(range(n_points))
+        rng.shuffle(strata)
+        columns[name] = [low + (high - low) * (s + rng.random()) / n_points for s in strata]
+    return [{name: columns[name][i] for name in bounds} for i in range(n_points)]
+
+
+# -------------------------
+# Results
+# -------------------------
+
+class PointResult:
+    """
+    Aggregated outcome of all the runs of one point.
+
+    Attributes
+    ----------
+    params : dict[str, float]
+        The parameters of the point.
+    n_runs : int
+        Runs played.
+    mean, std : float
+        Mean and sample standard deviation of the total score.
+    ci95 : float
+        Half-width of the normal 95% confidence interval of the mean.
+    discharged, died, unresolved : float
+        Mean number of cases per run with each outcome.
+    """
+
+    FIELDS = ("n_runs", "mean", "std", "ci95", "discharged", "died", "unresolved")
+
+    def __init__(self, params: Point, n_runs: int, mean: float, std: float, ci95: float, discharged: float, died: float, unresolved: float):
+        self.params = params
+        self.n_runs = n_runs
+        self.mean = mean
+        self.std = std
+        self.ci95 = ci95
+        self.discharged = discharged
+        self.died = died
+        self.unresolved = unresolved
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"params": self.params, **{name: getattr(self, name) for name in self.FIELDS}}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PointResult":
+        return cls(data["params"], *(data[name] for name in cls.FIELDS))
+
+
+class SweepResult:
+    """
+    Results of every point of a sweep, in the order of the design.
+    """
+
+    def __init__(self, points: list[PointResult]):
+        self.points = points
+
+    @property
+    def parameters(self) -> list[str]:
+        names: dict[str, None] = {}
+        for point in self.points:
+            names.update(dict.fromkeys(point.params))
+        return list(names)
+
+    def best(self) -> PointResult:
+        return max(self.points, key=lambda p: p.mean)
+
+    def rows(self) -> list[dict[str, Any]]:
+        return [{**p.params, **{name: getattr(p, name) for name in PointResult.FIELDS}} for p in self.points]
+
+    def sensitivity(self) -> dict[str, float]:
+        """
+        Correlation between each parameter and the mean score over the points:
+        a quick global sensitivity measure for grid and Latin hypercube designs.
+        """
+        scores = [p.mean for p in self.points]
+        result = {}
+        for name in self.parameters:
+            values = [p.params.get(name) for p in self.points]
+            if None in values or len(set(values)) < 2 or len(set(scores)) < 2:
+                result[name] = 0.0
+            else:
+                result[name] = statistics.correlation(values, scores)
+        return result
+
+    def table(self, sort_by: Optional[str] = "mean", limit: Optional[int] = None) -> str:
+        rows = self.rows()
+        if sort_by is not None:
+            rows.sort(key=lambda r: r[sort_by], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+
+        columns = self.parameters + ["mean", "ci95", "discharged", "died", "unresolved"]
+        widths = [max(10, len(c) + 2) for c in columns]
+        lines = ["".join(f"{c:>{w}}" for c, w in zip(columns, widths))]
+        for row in rows:
+            lines.append("".join(f"{row.get(c, float('nan')):>{w}.4g}" for c, w in zip(columns, widths)))
+        return "\n".join(lines)
+
+    def to_csv(self, path: Union[str, Path]) -> None:
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=self.parameters + list(PointResult.FIELDS))
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+
+def summarize_point(params: Point, runs) -> PointResult:
+    scores = [r.total_score for r in runs]
+    n = len(scores)
+    std = statistics.stdev(scores) if n > 1 else 0.0
+    counts = {outcome: 0 for outcome in Outcome}
+    for run in runs:
+        for case in run.case_results:
+            counts[case.outcome] += 1
+    return PointResult(
+        params, n, statistics.fmean(scores), std, 1.96 * std / n ** 0.5,
+        counts[Outcome.DISCHARGED] / n, counts[Outcome.DIED] / n, counts[Outcome.NOT_DISCHARGED] / n
+    )
+
+
+# -------------------------
+# Running
+# -------------------------
+
+def run_point(point: Point, policy: Policy, diseases: list[Disease], seeds: Sequence[int], max_days: int = 5, capacity: int = 4) -> PointResult:
+    """
+    Plays every seed with the parameters of `point`.
+    """
+    point_diseases, treatments, scoring = apply_point(point, diseases, build_treatments())
+    runs = [
+        run_simulation(seed, policy, point_diseases, max_days, capacity, treatments=treatments, scoring=scoring)
+        for seed in seeds
+    ]
+    return summarize_point(dict(point), runs)
+
+
+def point_key(point: Point, policy: Policy, seeds: Sequence[int], max_days: int, capacity: int, catalog: str) -> str:
+    """
+    Cache key of a point: everything its result depends on.
+    """
+    policy_id = {
+        "type": f"{type(policy).__module__}.{type(policy).__qualname__}",
+        "config": {k: v for k, v in sorted(vars(policy).items()) if not k.startswith("_")},
+    }
+    raw = json.dumps({
+        "version": CACHE_VERSION,
+        "params": sorted(point.items()),
+        "policy": policy_id,
+        "seeds": list(seeds),
+        "max_days": max_days,
+        "capacity": capacity,
+        "catalog": catalog,
+    }, sort_keys=True, default=repr)
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def _read_cached(path: Path) -> Optional[PointResult]:
+    try:
+        return PointResult.from_dict(json.loads(path.read_text()))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cached(path: Path, result: PointResult) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as file:
+        json.dump(result.to_dict(), file)
+    # atomic, so an interrupted sweep never leaves a half-written point behind
+    os.replace(tmp, path)
+
+
+_worker_diseases: Optional[list[Disease]] = None
+_worker_config: dict = {}
+
+
+def _init_worker(diseases_path: str, policy: Policy, seeds: list[int], max_days: int, capacity: int) -> None:
+    global _worker_diseases, _worker_config
+    _worker_diseases = load_catalog(diseases_path)
+    _worker_config = {"policy": policy, "seeds": seeds, "max_days": max_days, "capacity": capacity}
+
+
+def _run_in_worker(task: tuple[int, Point]) -> tuple[int, PointResult]:
+    index, point = task
+    config = _worker_config
+    return index, run_point(point, config["policy"], _worker_diseases, config["seeds"], config["max_days"], config["capacity"])
+
+
+def iter_sweep(
+    points: Sequence[Point],
+    policy: Policy,
+    n_runs: int = 100,
+    seeds: Optional[Sequence[int]] = None,
+    workers: Optional[int] = None,
+    max_days: int = 5,
+    capacity: int = 4,
+    diseases_path: Optional[str] = None,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> Iterator[tuple[int, PointResult]]:
+    """
+    Plays every point of a sweep and yields ``(index, result)`` pairs as
+    points complete, cached points first.
+
+    Parameters
+    ----------
+    points : Sequence[dict[str, float]]
+        The design, e.g. from `grid` or `latin_hypercube`; see `describe_parameters`.
+    policy : Policy
+        Automated doctor playing every run.
+    n_runs : int, optional (default=100)
+        Runs per point.
+    seeds : Sequence[int] | None, optional (default=None)
+        Seeds shared by every point (common random numbers); ``range(n_runs)`` by default.
+    workers : int | None, optional (default=None)
+        Worker processes, one point at a time each; all CPU cores by default.
+    max_days, capacity : int
+        Simulation length and waiting-room capacity of every run.
+    diseases_path : str | None, optional (default=None)
+        Disease catalog; the bundled ``data/diseases.json`` by default.
+    cache_dir : str | Path | None, optional (default=None)
+        Folder keeping one JSON file per completed point; no caching when omitted.
+    """
+    seeds = list(range(n_runs)) if seeds is None else list(seeds)
+    diseases_path = str(diseases_path or DEFAULT_DISEASES_PATH)
+    diseases = load_catalog(diseases_path)
+    workers = workers or multiprocessing.cpu_count()
+
+    # unknown parameters fail before anything runs
+    for point in points:
+        apply_point(point, diseases, build_treatments())
+
+    cache = Path(cache_dir) if cache_dir is not None else None
+    catalog = catalog_key(diseases_path)
+    paths: dict[int, Path] = {}
+    todo: list[tuple[int, Point]] = []
+
+    for index, point in enumerate(points):
+        if cache is not None:
+            path = paths[index] = cache / f"{point_key(point, policy, seeds, max_days, capacity, catalog)}.json"
+            cached = _read_cached(path) if path.exists() else None
+            if cached is not None:
+                yield index, cached
+                continue
+        todo.append((index, dict(point)))
+
+    def finished(index: int, result: PointResult) -> tuple[int, PointResult]:
+        if cache is not None:
+            _write_cached(paths[index], result)
+        return index, result
+
+    if workers <= 1 or len(todo) <= 1:
+        for index, point in todo:
+            yield finished(index, run_point(point, policy, diseases, seeds, max_days, capacity))
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(diseases_path, policy, seeds, max_days, capacity)) as pool:
+        for index, result in pool.imap_unordered(_run_in_worker, todo):
+            yield finished(index, result)
+
+
+def run_sweep(points: Sequence[Point], policy: Policy, n_runs: int = 100, **kwargs: Any) -> SweepResult:
+    """
+    Plays a whole sweep; see `iter_sweep` for the parameters.
+    """
+    results: list[Optional[PointResult]] = [None] * len(points)
+    for index, result in iter_sweep(points, policy, n_runs, **kwargs):
+        results[index] = result
+    return SweepResult(results)
+
+
+# -------------------------
+# Command line
+# -------------------------
+
+def _parse_axis(text: str) -> tuple[str, str]:
+    name, sep, values = text.partition("=")
+    if not sep or not name or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUES, got {text!r}")
+    return name, values
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Sweep simulation parameters on common random numbers")
+    parser.add_argument("--grid", type=_parse_axis, action="append", default=[], metavar="NAME=V1,V2,...", help="values of a grid axis")
+    parser.add_argument("--lhs", type=_parse_axis, action="append", default=[], metavar="NAME=LOW:HIGH", help="range of a Latin hypercube axis")
+    parser.add_argument("--points", type=int, default=20, help="Latin hypercube points (default 20)")
+    parser.add_argument("--runs", type=int, default=100, help="runs per point (default 100)")
+    parser.add_argument("--seed", type=int, default=0, help="first seed of the runs and seed of the design (default 0)")
+    parser.add_argument("--policy", choices=("random", "wait"), default="random", help="automated doctor (default random)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--max-days", type=int, default=5)
+    parser.add_argument("--capacity", type=int, default=4)
+    parser.add_argument("--diseases", help="disease catalog (default: the bundled one)")
+    parser.add_argument("--cache", metavar="DIR", help="cache completed points here and resume from them")
+    parser.add_argument("--csv", metavar="PATH", help="write the results table as CSV")
+    parser.add_argument("--top", type=int, help="print only the best TOP points")
+    parser.add_argument("--list-parameters", action="store_true", help="list the parameters that can be swept")
+    args = parser.parse_args(argv)
+
+    if args.list_parameters:
+        diseases = load_catalog(args.diseases or DEFAULT_DISEASES_PATH)
+        print("\n".join(describe_parameters(diseases, build_treatments())))
+        return
+
+    try:
+        axes = {name: [float(v) for v in values.split(",")] for name, values in args.grid}
+        bounds = {}
+        for name, values in args.lhs:
+            low, high = values.split(":")
+            bounds[name] = (float(low), float(high))
+    except ValueError as e:
+        parser.error(f"invalid axis: {e}")
+
+    points = grid(axes)
+    if bounds:
+        points = [{**g, **l} for g in points for l in latin_hypercube(bounds, args.points, args.seed)]
+
+    policy = RandomPolicy() if args.policy == "random" else WaitPolicy()
+    seeds = range(args.seed, args.seed + args.runs)
+    try:
+        result = run_sweep(
+            points, policy, args.runs, seeds=seeds, workers=args.workers, max_days=args.max_days,
+            capacity=args.capacity, diseases_path=args.diseases, cache_dir=args.cache
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(result.table(limit=args.top))
+    print("\nCorrelation with the mean score:")
+    for name, r in result.sensitivity().items():
+        print(f"  {name:<30}{r:+.3f}")
+
+    if args.csv:
+        result.to_csv(args.csv)
+
+
+if __name__ == "__main__":
+    main()
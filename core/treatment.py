@@ -1,4 +1,15 @@
-from typing import Any
+from enum import Enum
+from typing import Any, Optional, Union
+
+
+class TestType(Enum):
+    """
+    Kinds of diagnostic tests.
+    """
+    VITALS = "vitals"
+    BLOOD = "blood"
+    XRAY = "xray"
+    ECG = "ecg"
 
 
 class Treatment:
@@ -17,9 +28,13 @@ class Treatment:
         The number of hours the treatment or test takes to perform.
     description : str, optional (default="")
         A brief description of the treatment or test.
-    test_type : str or None, optional (default=None)
-        The type of diagnostic test, e.g., "blood", "xray", "vitals", or "ecg".
+    test_type : TestType or None, optional (default=None)
+        The type of diagnostic test. Strings such as "blood", "xray", "vitals"
+        or "ecg" are converted to the matching `TestType`.
     """
+
+    __slots__ = ("name", "effect", "penalty", "time_cost", "description", "test_type")
+
     def __init__(
         self,
         name,
@@ -27,14 +42,14 @@ class Treatment:
         penalty=0,
         time_cost=1,
         description="",
-        test_type=None
+        test_type: Optional[Union[TestType, str]] = None
     ):
         self.name = name
         self.effect = effect
         self.penalty = penalty
         self.time_cost = time_cost
         self.description = description
-        self.test_type = test_type
+        self.test_type = TestType(test_type) if test_type is not None else None
 
     def info(self) -> dict[str, Any]:
         return {
@@ -42,6 +57,6 @@ class Treatment:
             "Effect": self.effect,
             "Penalty": self.penalty,
             "Time cost (hours)": self.time_cost,
-            "Test type": self.test_type,
+            "Test type": self.test_type.value if self.test_type is not None else None,
             "Description": self.description
         }
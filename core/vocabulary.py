@@ -0,0 +1,42 @@
+from typing import Optional
+
+
+class Vocabulary:
+    """
+    Interns names (e.g. symptoms) into dense integer ids.
+
+    A catalog shares one vocabulary, so every occurrence of a name across all
+    diseases and patients refers to the same string object and the same id.
+
+    Attributes
+    ----------
+    names : list[str]
+        Interned names, indexed by id.
+    """
+
+    def __init__(self):
+        self.names: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __getitem__(self, id_: int) -> str:
+        return self.names[id_]
+
+    def intern(self, name: str) -> int:
+        """
+        Returns the id of `name`, adding it to the vocabulary if needed.
+        """
+        id_ = self._ids.get(name)
+        if id_ is None:
+            id_ = len(self.names)
+            self.names.append(name)
+            self._ids[name] = id_
+        return id_
+
+    def get_id(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
@@ -1,8 +1,36 @@
-from medical_simulator.core.disease import Disease
+from medical_simulator.core.indexed_heap import IndexedHeap
 from medical_simulator.core.patient import Patient
-import random
-from medical_simulator.utils.utils import generate_random_patient
-from typing import Optional
+import itertools
+from typing import Callable, Optional, ValuesView
+
+
+class AcuityScore:
+    """
+    Configurable triage score; lower scores are more urgent.
+
+    ``score = health_weight * health - severity_weight * severity - wait_weight * time_elapsed``
+
+    Parameters
+    ----------
+    health_weight : float, optional (default=1.0)
+        Weight of the current health: sicker patients come first.
+    severity_weight : float, optional (default=5.0)
+        Weight of `Disease.severity` (the hourly health loss).
+    wait_weight : float, optional (default=1.0)
+        Weight of the hours spent waiting: long waits come first.
+    """
+
+    def __init__(self, health_weight: float = 1.0, severity_weight: float = 5.0, wait_weight: float = 1.0):
+        self.health_weight = health_weight
+        self.severity_weight = severity_weight
+        self.wait_weight = wait_weight
+
+    def __call__(self, patient: Patient) -> float:
+        return (
+            self.health_weight * patient.health
+            - self.severity_weight * patient.disease.severity
+            - self.wait_weight * patient.time_elapsed
+        )
 
 
 class WaitingRoom:
@@ -10,20 +38,51 @@ class WaitingRoom:
     """
     Hospital waiting room that holds patients.
 
+    Every admitted patient gets a stable integer id. Patients are kept in a
+    dict keyed by id, so lookups and removals are O(1) while `patients` still
+    lists them in arrival order. Access by position (`get_patient`,
+    `position`) walks that order, so it costs O(index). When an `acuity` score is given, patients
+    are also kept in an indexed heap ordered by that score, for O(log n)
+    triage ordering and reprioritization as their health changes.
+
     Parameters
     ----------
     capacity : int
         Maximum number of patients that can be in the waiting room.
+    acuity : Callable[[Patient], float] | None, optional (default=None)
+        Triage score, lower is more urgent (see `AcuityScore`). No triage
+        ordering is maintained when omitted.
 
     Attributes
     ----------
-    patients : list[Patient]
-        List of patients currently in the waiting room.
+    patients : ValuesView[Patient]
+        Read-only, live view of the patients in the waiting room, in arrival
+        order. Copy it (``list(room.patients)``) to admit or remove patients
+        while iterating.
+    triage : bool
+        Whether an acuity heap is maintained.
     """
 
-    def __init__(self, capacity: int):
-        self.patients = []
+    def __init__(self, capacity: int, acuity: Optional[Callable[[Patient], float]] = None):
         self.capacity = capacity
+        self.acuity = acuity
+        self.triage = acuity is not None
+
+        self._next_id = 0
+        self._by_id: dict[int, Patient] = {}
+        self._ids: dict[Patient, int] = {}
+        self._heap = IndexedHeap()
+
+    @property
+    def patients(self) -> ValuesView[Patient]:
+        # ids only grow, so the insertion order of the dict is the arrival order
+        return self._by_id.values()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, patient: Patient) -> bool:
+        return patient in self._ids
 
     def show_patients(self) -> None:
         print("\n--- Waiting Room ---")
@@ -31,29 +90,83 @@ class WaitingRoom:
             print(f"{i}) {p.name}")
 
     def get_patient(self, index: int) -> Optional[Patient]:
-        if 0 <= index < len(self.patients):
-            return self.patients[index]
+        """
+        The `index`-th patient in arrival order, None if there is no such patient.
+        """
+        if 0 <= index < len(self._by_id):
+            return next(itertools.islice(self._by_id.values(), index, None))
         return None
 
-    def add_patient(self, patient: Patient) -> None:
-        self.patients.append(patient)
+    def position(self, patient: Patient) -> Optional[int]:
+        """
+        Index of a patient in arrival order, None if it is not in the room.
+        """
+        patient_id = self._ids.get(patient)
+        if patient_id is None:
+            return None
+        return next(i for i, other in enumerate(self._by_id) if other == patient_id)
+
+    def get_by_id(self, patient_id: int) -> Optional[Patient]:
+        return self._by_id.get(patient_id)
+
+    def id_of(self, patient: Patient) -> Optional[int]:
+        return self._ids.get(patient)
+
+    def add_patient(self, patient: Patient) -> int:
+        """
+        Admits a patient and returns its id.
+        """
+        patient_id = self._next_id
+        self._next_id += 1
+
+        self._by_id[patient_id] = patient
+        self._ids[patient] = patient_id
+        if self.triage:
+            self._heap.push(patient_id, self.acuity(patient))
+        return patient_id
 
     def remove_patient(self, patient: Patient) -> None:
-        self.patients.remove(patient)
-
-    def maybe_add_new_patients(self, current_hour: int, diseases: list[Disease]) -> None:
-
-        if current_hour < 1:
-            return
-
-        max_add = self.capacity - len(self.patients)
-        if max_add <= 0:
-            return
-
-        if current_hour < 7 and random.random() < 0.5:
-            new_patient = generate_random_patient(diseases)
-            self.add_patient(new_patient)
-            print(f"New patient arrived: {new_patient.name}")
-
-
-
+        patient_id = self._ids.pop(patient)
+        del self._by_id[patient_id]
+        if self.triage:
+            self._heap.remove(patient_id)
+
+    # -------------------------
+    # Triage
+    # -------------------------
+
+    def reprioritize(self, patient: Patient) -> None:
+        """
+        Recomputes the acuity of a patient whose state changed.
+        """
+        if self.triage:
+            self._heap.update(self._ids[patient], self.acuity(patient))
+
+    def reprioritize_all(self) -> None:
+        if self.triage:
+            acuity = self.acuity
+            for patient_id, patient in self._by_id.items():
+                self._heap.update(patient_id, acuity(patient))
+
+    def most_urgent(self) -> Optional[Patient]:
+        """
+        Patient with the lowest acuity score, None if the room is empty.
+
+        Raises
+        ------
+        RuntimeError
+            If the room has no acuity score.
+        """
+        if not self.triage:
+            raise RuntimeError("This waiting room has no acuity score")
+        patient_id = self._heap.peek()
+        return self._by_id[patient_id] if patient_id is not None else None
+
+    def by_acuity(self) -> list[Patient]:
+        """
+        Patients sorted from most to least urgent.
+        """
+        if not self.triage:
+            raise RuntimeError("This waiting room has no acuity score")
+        heap = self._heap
+        return [self._by_id[i] for i in sorted(heap, key=lambda i: (heap.key(i), i))]
@@ -0,0 +1,436 @@
+from collections import deque
+from functools import partial
+from typing import Mapping, Optional, Sequence
+
+from medical_simulator.core.arrivals import ArrivalProcess
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.diagnosis import DiagnosisIndex, DifferentialDiagnosis
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.treatment import TestType, Treatment
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+from medical_simulator.utils.utils import build_treatments
+
+
+# one X-ray machine, a lab processing two samples at a time
+DEFAULT_RESOURCES = {"xray": 1, "lab": 2}
+DEFAULT_REQUIREMENTS = {TestType.XRAY: ("xray",), TestType.BLOOD: ("lab",)}
+
+
+class Resource:
+    """
+    A pool of identical units shared by the whole ward (clinicians, an X-ray
+    machine, lab throughput, exam rooms).
+
+    Parameters
+    ----------
+    name : str
+        Name of the resource, used in reports.
+    capacity : int
+        Number of units, i.e. how many visits can use the resource at once.
+
+    Attributes
+    ----------
+    in_use : int
+        Units currently held by running visits.
+    busy_hours : int
+        Unit-hours spent serving visits so far.
+    served : int
+        Visits that held the resource until their completion.
+    wait_hours : int
+        Hours those visits spent queued before starting.
+    """
+
+    def __init__(self, name: str, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"Resource {name!r} needs a capacity of at least 1, got {capacity}")
+        self.name = name
+        self.capacity = capacity
+        self.in_use = 0
+        self.busy_hours = 0
+        self.served = 0
+        self.wait_hours = 0
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self.in_use
+
+    def utilization(self, open_hours: int) -> float:
+        """
+        Fraction of the available unit-hours spent serving visits.
+        """
+        return self.busy_hours / (self.capacity * open_hours) if open_hours else 0.0
+
+    def __repr__(self) -> str:
+        return f"Resource({self.name!r}, {self.in_use}/{self.capacity} in use)"
+
+
+class Visit:
+    """
+    One test or treatment requested for a patient, from its request to its completion.
+
+    Attributes
+    ----------
+    patient : Patient
+        The patient visited.
+    treatment : Treatment
+        The test or treatment performed.
+    needs : tuple[Resource, ...]
+        Resources held for the whole `treatment.time_cost`, a clinician first.
+    requested_at : int
+        Hour of the day the visit was requested.
+    started_at : int | None
+        Hour it started, None while queued.
+    finished_at : int | None
+        Hour it completed, None until then.
+    cancelled : bool
+        Whether the visit was dropped (patient gone, or the day ended first).
+    outcome : list
+        Receives the test result or treatment effect once completed.
+    """
+
+    __slots__ = ("patient", "treatment", "needs", "requested_at", "started_at", "finished_at", "cancelled", "outcome")
+
+    def __init__(self, patient: Patient, treatment: Treatment, needs: tuple[Resource, ...], requested_at: int):
+        self.patient = patient
+        self.treatment = treatment
+        self.needs = needs
+        self.requested_at = requested_at
+        self.started_at: Optional[int] = None
+        self.finished_at: Optional[int] = None
+        self.cancelled = False
+        self.outcome: list = []
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+    def __repr__(self) -> str:
+        state = "cancelled" if self.cancelled else "done" if self.done else "running" if self.started_at is not None else "queued"
+        return f"Visit({self.patient.name}, {self.treatment.name}, {state})"
+
+
+class Ward:
+    """
+    Several clinicians working concurrently on the patients of one `Hospital`,
+    sharing a few diagnostic resources.
+
+    Visits are requested without advancing time: each one waits in a single
+    FIFO queue until a clinician, every resource its test needs and the
+    patient are all free, then holds them for the treatment's `time_cost`
+    hours and completes as a scheduled hospital event. Time moves only with
+    `advance`, so many visits run side by side. A visit that cannot start
+    does not block the visits queued behind it.
+
+    Parameters
+    ----------
+    hospital : Hospital
+        Hospital whose clock, waiting room and scoring the ward uses.
+    doctors : int, optional (default=1)
+        Number of clinicians; every visit needs one.
+    resources : Mapping[str, int] | None, optional (default=None)
+        Capacity of each shared resource, by name; `DEFAULT_RESOURCES` when omitted.
+    requirements : Mapping[TestType | None, Sequence[str]] | None, optional (default=None)
+        Resources needed by each kind of test (None for treatments);
+        `DEFAULT_REQUIREMENTS` when omitted.
+    rooms : int | None, optional (default=None)
+        Number of exam rooms, needed by every visit; unlimited when omitted.
+
+    Attributes
+    ----------
+    doctors : Resource
+        The clinicians.
+    resources : dict[str, Resource]
+        The shared resources, exam rooms included.
+    completed : list[Visit]
+        Visits completed so far, in completion order.
+    cancelled : int
+        Visits dropped before completing.
+    open_hours : int
+        Hours the ward has been open, over all days, used for utilization.
+    """
+
+    def __init__(
+        self,
+        hospital: Hospital,
+        doctors: int = 1,
+        resources: Optional[Mapping[str, int]] = None,
+        requirements: Optional[Mapping[Optional[TestType], Sequence[str]]] = None,
+        rooms: Optional[int] = None
+    ):
+        self.hospital = hospital
+        self.doctors = Resource("doctor", doctors)
+
+        resources = dict(DEFAULT_RESOURCES if resources is None else resources)
+        requirements = DEFAULT_REQUIREMENTS if requirements is None else requirements
+        if rooms is not None:
+            resources["room"] = rooms
+        self.resources = {name: Resource(name, capacity) for name, capacity in resources.items()}
+
+        # resources needed by each kind of action, resolved once
+        self._needs: dict[Optional[TestType], tuple[Resource, ...]] = {}
+        for test_type in (None, *TestType):
+            names = list(requirements.get(test_type, ()))
+            if rooms is not None:
+                names.append("room")
+            unknown = [name for name in names if name not in self.resources]
+            if unknown:
+                raise ValueError(f"Unknown resources required by {test_type}: {', '.join(unknown)}")
+            self._needs[test_type] = (self.doctors, *(self.resources[name] for name in names))
+
+        self._queue: deque[Visit] = deque()
+        self._running: dict[Patient, Visit] = {}
+        self.completed: list[Visit] = []
+        self.cancelled = 0
+        self.open_hours = 0
+
+    # -------------------------
+    # Visits
+    # -------------------------
+
+    def request(self, patient: Patient, treatment: Treatment) -> Visit:
+        """
+        Queues a test or treatment for `patient`; it starts as soon as possible,
+        possibly right away. Returns the visit to follow its progress.
+        """
+        if patient not in self.hospital.waiting_room:
+            raise ValueError(f"{patient.name} is not in the waiting room")
+
+        visit = Visit(patient, treatment, self._needs[treatment.test_type], self.hospital.clock.hour)
+        self._queue.append(visit)
+        self._dispatch()
+        return visit
+
+    def diagnose(self, patient: Patient, guess: str) -> bool:
+        """
+        Guesses the disease of `patient` (see `Hospital.guess_disease`).
+
+        A guess takes no time, but not while a visit of the patient is running.
+        """
+        if patient in self._running:
+            raise ValueError(f"{patient.name} is busy with {self._running[patient].treatment.name}")
+        return self.hospital.guess_disease(patient, guess)
+
+    def is_busy(self, patient: Patient) -> bool:
+        return patient in self._running
+
+    def queued(self, patient: Optional[Patient] = None) -> list[Visit]:
+        """
+        Visits waiting to start, of one patient or of everyone.
+        """
+        return [v for v in self._queue if patient is None or v.patient is patient]
+
+    @property
+    def running(self) -> list[Visit]:
+        return list(self._running.values())
+
+    def _dispatch(self) -> None:
+        # one pass over the queue in request order, starting whatever fits;
+        # every visit needs a clinician, so the pass stops when none is free
+        if not self._queue:
+            return
+
+        hour = self.hospital.clock.hour
+        waiting_room = self.hospital.waiting_room
+        kept: deque[Visit] = deque()
+
+        while self._queue and self.doctors.free:
+            visit = self._queue.popleft()
+            if visit.patient not in waiting_room:
+                visit.cancelled = True
+                self.cancelled += 1
+            elif visit.patient in self._running or any(not r.free for r in visit.needs):
+                kept.append(visit)
+            else:
+                self._start(visit, hour)
+
+        kept.extend(self._queue)
+        self._queue = kept
+
+    def _start(self, visit: Visit, hour: int) -> None:
+        visit.started_at = hour
+        for resource in visit.needs:
+            resource.in_use += 1
+        self._running[visit.patient] = visit
+        visit.outcome = self.hospital.start_action(visit.patient, visit.treatment, partial(self._finish, visit))
+
+    def _finish(self, visit: Visit) -> None:
+        hour = self.hospital.clock.hour
+        visit.finished_at = hour
+        del self._running[visit.patient]
+
+        wait = visit.started_at - visit.requested_at
+        for resource in visit.needs:
+            resource.in_use -= 1
+            resource.busy_hours += hour - visit.started_at
+            resource.served += 1
+            resource.wait_hours += wait
+
+        self.completed.append(visit)
+        self._dispatch()
+
+    # -------------------------
+    # Time
+    # -------------------------
+
+    def advance(self, hours: int) -> None:
+        """
+        Lets `hours` pass; visits complete and queued ones start along the way.
+        """
+        self.hospital.advance_time(hours)
+
+    def start_new_day(self) -> None:
+        self.hospital.start_new_day()
+
+    def end_day(self):
+        """
+        Closes the day (see `Hospital.end_day`).
+
+        Visits still queued or running are cancelled: the hospital drops
+        their completions along with the rest of the day.
+        """
+        hour = self.hospital.clock.hour
+        self.open_hours += hour
+
+        for visit in self._running.values():
+            visit.cancelled = True
+            for resource in visit.needs:
+                resource.in_use -= 1
+                resource.busy_hours += hour - visit.started_at
+        for visit in self._queue:
+            visit.cancelled = True
+
+        self.cancelled += len(self._running) + len(self._queue)
+        self._running.clear()
+        self._queue.clear()
+
+        return self.hospital.end_day()
+
+    # -------------------------
+    # Metrics
+    # -------------------------
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """
+        Utilization, completed visits and mean queueing delay of every resource,
+        clinicians included, over the hours the ward has been open.
+        """
+        open_hours = self.open_hours + self.hospital.clock.hour
+        report = {}
+        for resource in (self.doctors, *self.resources.values()):
+            report[resource.name] = {
+                "capacity": resource.capacity,
+                "utilization": resource.utilization(open_hours),
+                "served": resource.served,
+                "mean_wait": resource.wait_hours / resource.served if resource.served else 0.0,
+            }
+        return report
+
+    def bottleneck(self) -> Optional[str]:
+        """
+        Name of the most utilized resource, None before anything was served.
+        """
+        report = self.report()
+        busiest = max(report, key=lambda name: report[name]["utilization"])
+        return busiest if report[busiest]["utilization"] > 0 else None
+
+
+# -------------------------
+# Staffing studies
+# -------------------------
+
+class WorkupPolicy:
+    """
+    Simple automated ward: every idle patient, most urgent first, gets the
+    next test they have not had yet; once the tests are done (or, with
+    `guess_early`, as soon as only one disease is left in their
+    differential) the first consistent disease is guessed. A wrong guess is
+    remembered and never made again for that patient.
+
+    Parameters
+    ----------
+    diseases : list[Disease]
+        The catalog, used to keep a differential diagnosis per patient.
+    tests : Sequence[TestType], optional
+        Order in which tests are run.
+    guess_early : bool, optional (default=True)
+        Whether to skip the remaining tests once the differential is down to one disease.
+    """
+
+    TESTS = (TestType.VITALS, TestType.BLOOD, TestType.XRAY, TestType.ECG)
+
+    def __init__(self, diseases: list[Disease], tests: Sequence[TestType] = TESTS, guess_early: bool = True):
+        self.index = DiagnosisIndex(diseases)
+        self.tests = tuple(tests)
+        self.guess_early = guess_early
+        self._differentials: dict[Patient, DifferentialDiagnosis] = {}
+        # names already guessed wrong, per patient
+        self._rejected: dict[Patient, set[str]] = {}
+
+    def reset(self) -> None:
+        self._differentials.clear()
+        self._rejected.clear()
+
+    def act(self, ward: Ward) -> None:
+        ward.hospital.sync_all()
+        room = ward.hospital.waiting_room
+        by_type = {t.test_type: t for t in ward.hospital.treatments if t.test_type is not None}
+        patients = room.by_acuity() if room.triage else list(room.patients)
+
+        for patient in patients:
+            if ward.is_busy(patient) or ward.queued(patient) or patient.is_dead():
+                continue
+
+            differential = self._differentials.get(patient)
+            if differential is None:
+                differential = self._differentials[patient] = self.index.tracker()
+            candidates = differential.update(patient)
+            rejected = self._rejected.get(patient)
+            if rejected:
+                candidates = [name for name in candidates if name not in rejected]
+
+            missing = [t for t in self.tests if not patient.has_done_test(t) and t in by_type]
+            if missing and not (self.guess_early and len(candidates) == 1):
+                ward.request(patient, by_type[missing[0]])
+            elif candidates and not ward.diagnose(patient, candidates[0]):
+                self._rejected.setdefault(patient, set()).add(candidates[0])
+
+
+def run_ward(
+    diseases: list[Disease],
+    doctors: int = 1,
+    resources: Optional[Mapping[str, int]] = None,
+    rooms: Optional[int] = None,
+    capacity: int = 20,
+    max_days: int = 5,
+    seed: int = 0,
+    arrivals: Optional[ArrivalProcess] = None,
+    policy: Optional[WorkupPolicy] = None
+) -> tuple[Hospital, Ward]:
+    """
+    Runs a whole simulation of a ward driven by `policy` (a `WorkupPolicy`
+    when omitted), one hour at a time, and returns the hospital and the ward
+    for inspection (`hospital.total_score`, `ward.report()`).
+
+    The same seed gives the same patients whatever the staffing, so runs
+    with different `doctors` or `resources` can be compared directly.
+    """
+    hospital = Hospital(
+        Clock(), WaitingRoom(capacity), diseases, build_treatments(),
+        max_days=max_days, rng=SimulationRNG(seed), arrivals=arrivals
+    )
+    ward = Ward(hospital, doctors, resources, rooms=rooms)
+    policy = policy if policy is not None else WorkupPolicy(diseases)
+
+    while not hospital.is_simulation_over():
+        ward.start_new_day()
+        policy.reset()
+        while not hospital.clock.is_day_over():
+            policy.act(ward)
+            ward.advance(1)
+        ward.end_day()
+        hospital.pop_events()
+
+    return hospital, ward
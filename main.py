@@ -1,43 +1,153 @@
-from medical_simulator.core.clock import Clock
-from medical_simulator.utils.utils import load_diseases_from_json
-from medical_simulator.core.hospital import Hospital
-from medical_simulator.core.treatment import Treatment
-from medical_simulator.core.waiting_room import WaitingRoom
-from medical_simulator.core.simulator_controller import SimulatorController
+from medical_simulator import __version__
+import argparse
 import sys
-import os
 from pathlib import Path
+from typing import Optional
+
+# Everything else is imported by the code path that needs it, so that
+# `--version`, `--validate-catalog` and the other short invocations start
+# without loading the simulator, the server (asyncio) or the profiler.
+# `python -m medical_simulator.benchmarks.startup` checks the budget.
 
 
 BASE_DIR = Path(__file__).parent
+DEFAULT_DISEASES_PATH = BASE_DIR / "data" / "diseases.json"
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Clinical Decision-Making Simulator")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument(
+        "--suggest", action="store_true",
+        help="list the diseases still consistent with the findings during visits"
+    )
+    parser.add_argument("--seed", type=int, help="seed of the run (random when omitted)")
+    parser.add_argument("--record", metavar="PATH", help="write every action and event to a binary log")
+    parser.add_argument(
+        "--replay", metavar="PATH", nargs="+",
+        help="replay recorded logs without the UI, checking they reproduce exactly"
+    )
+    parser.add_argument("--serve", action="store_true", help="host simulator sessions over TCP (JSON lines) instead of playing")
+    # defaults come from core/server.py, which is only imported to serve
+    parser.add_argument("--host", help="address to listen on with --serve (default: localhost)")
+    parser.add_argument("--port", type=int, help="port to listen on with --serve (default: DEFAULT_PORT of core/server.py)")
+    parser.add_argument("--idle-timeout", type=float, help="close sessions idle for this many seconds (with --serve)")
+    parser.add_argument(
+        "--profile", metavar="RUNS", type=int,
+        help="profile a headless batch of RUNS random-policy runs and print where the time goes"
+    )
+    parser.add_argument("--profile-out", metavar="PATH", help="also dump the raw cProfile statistics here (with --profile)")
+    parser.add_argument(
+        "--validate-catalog", metavar="PATH", nargs="?", const=str(DEFAULT_DISEASES_PATH),
+        help="check a disease catalog (JSON or NDJSON) against the schema and exit; the bundled one by default"
+    )
+    return parser.parse_args(argv)
+
+
+def validate_catalog_file(path: str) -> int:
+    from medical_simulator.utils.catalog import CatalogError
+    from medical_simulator.utils.lazy_catalog import LazyCatalog
+
+    try:
+        # streamed, and without writing any cache next to the catalog
+        catalog = LazyCatalog(path, use_cache=False)
+        catalog.validate()
+    except (OSError, CatalogError) as e:
+        print(f"{path}: INVALID - {e}")
+        return 1
+    print(f"{path}: ok, {len(catalog)} diseases")
+    return 0
+
+
+def replay_logs(paths: list[str], diseases, treatments) -> int:
+    from medical_simulator.core.event_log import ReplayError, replay
+
+    failures = 0
+    for path in paths:
+        try:
+            engine = replay(path, diseases, treatments)
+        except (OSError, ReplayError) as e:
+            failures += 1
+            print(f"{path}: FAILED - {e}")
+        else:
+            print(f"{path}: ok, total score {engine.hospital.total_score}")
+    return 1 if failures else 0
 
-def build_treatments():
-    return [
-        Treatment("IV Fluids", effect=10, penalty=2, time_cost=1, description="Hydration support"),
-        Treatment("Antibiotics", effect=20, penalty=15, time_cost=1, description="Broad-spectrum antibiotics"),
-        Treatment("Vital Signs Check", time_cost=1, test_type="vitals", description="Measure temperature and blood pressure"),
-        Treatment("Blood Test", time_cost=2, test_type="blood", description="Laboratory analysis"),
-        Treatment("X-Ray", time_cost=2, test_type="xray", description="Chest imaging"),
-        Treatment("ECG", time_cost=1, test_type="ecg", description="Electrocardiogram")
-    ]
+
+def profile_batch(n_runs: int, diseases_path: Path, out: Optional[str] = None) -> None:
+    from medical_simulator.core.batch import run_batch
+    from medical_simulator.core.instrumentation import Instrumentation, profile
+    from medical_simulator.core.policies import RandomPolicy
+
+    with Instrumentation() as instrumentation:
+        batch, stats = profile(run_batch, n_runs, RandomPolicy(), workers=1, diseases_path=str(diseases_path), path=out)
+
+    print(f"{n_runs} runs, mean score {batch.summary.mean:.1f}\n")
+    print(instrumentation.report())
+    print()
+    print(stats)
+
+
+def serve(diseases, treatments, host: Optional[str], port: Optional[int], idle_timeout: Optional[float]) -> None:
+    import asyncio
+    from medical_simulator.core.server import DEFAULT_HOST, DEFAULT_PORT, SessionServer
+
+    host = DEFAULT_HOST if host is None else host
+    # 0 asks the OS for a free port
+    port = DEFAULT_PORT if port is None else port
+    server = SessionServer(diseases, treatments, idle_timeout=idle_timeout)
+    print(f"Serving simulator sessions on {host}:{port}")
+    try:
+        asyncio.run(server.serve_forever(host, port))
+    except KeyboardInterrupt:
+        pass
 
 
 def main():
+    args = parse_args()
 
+    if args.validate_catalog:
+        sys.exit(validate_catalog_file(args.validate_catalog))
 
-    diseases_path = BASE_DIR / "data" / "diseases.json"
-    diseases = load_diseases_from_json(str(diseases_path))
+    if args.profile:
+        # the batch loads the catalog itself, in every worker
+        profile_batch(args.profile, DEFAULT_DISEASES_PATH, args.profile_out)
+        return
+
+    from medical_simulator.utils.catalog import load_catalog
+    from medical_simulator.utils.utils import build_treatments
+
+    diseases = load_catalog(DEFAULT_DISEASES_PATH)
     treatments = build_treatments()
 
+    if args.replay:
+        sys.exit(replay_logs(args.replay, diseases, treatments))
+
+    if args.serve:
+        serve(diseases, treatments, args.host, args.port, args.idle_timeout)
+        return
+
+    from medical_simulator.core.clock import Clock
+    from medical_simulator.core.hospital import Hospital
+    from medical_simulator.core.simulator_controller import SimulatorController
+    from medical_simulator.core.waiting_room import WaitingRoom
+    from medical_simulator.utils.rng import SimulationRNG
+
     hospital = Hospital(
         clock=Clock(),
         waiting_room=WaitingRoom(4),
         diseases=diseases,
         treatments=treatments,
-        max_days=5
+        max_days=5,
+        rng=SimulationRNG(args.seed)
     )
 
-    SimulatorController(hospital).run()
+    if args.record:
+        from medical_simulator.core.event_log import EventLogWriter, RecordingEngine
+
+        with EventLogWriter(args.record, hospital) as log:
+            SimulatorController(hospital, suggest=args.suggest, engine=RecordingEngine(hospital, log)).run()
+    else:
+        SimulatorController(hospital, suggest=args.suggest).run()
 
 
 if __name__ == "__main__":
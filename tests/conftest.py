@@ -0,0 +1,28 @@
+"""
+Shared fixtures. Run from the folder containing the medical_simulator package::
+
+    python -m pytest medical_simulator/tests
+"""
+import pytest
+
+from medical_simulator.core.batch import DEFAULT_DISEASES_PATH
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.treatment import Treatment
+from medical_simulator.utils.catalog import CACHE_DIR_ENV
+from medical_simulator.utils.utils import build_treatments, load_diseases_from_json
+
+
+@pytest.fixture(autouse=True)
+def _private_catalog_cache(tmp_path_factory, monkeypatch):
+    # never read or write the user's own catalog caches
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path_factory.mktemp("catalog_cache")))
+
+
+@pytest.fixture
+def diseases() -> list[Disease]:
+    return load_diseases_from_json(str(DEFAULT_DISEASES_PATH))
+
+
+@pytest.fixture
+def treatments() -> list[Treatment]:
+    return build_treatments()
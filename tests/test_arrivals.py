@@ -0,0 +1,60 @@
+import statistics
+from collections import Counter
+
+import pytest
+
+from medical_simulator.benchmarks.suite import _arrival_case
+from medical_simulator.core.arrivals import HourlyCoinArrivals, PoissonArrivals, SurgeArrivals, poisson_counts
+from medical_simulator.utils.rng import SimulationRNG
+
+
+def test_hourly_coin_schedule_stays_within_its_hours():
+    process = HourlyCoinArrivals(0.5, range(2, 5))
+    rng = SimulationRNG(1)
+    hours = [hour for day in range(1, 200) for hour, _ in process.schedule_day(day, rng)]
+
+    assert set(hours) == {2, 3, 4}
+    # at most one arrival per hour
+    assert all(len(process.schedule_day(day, rng)) <= 3 for day in range(1, 200))
+
+
+def test_draw_patient_follows_disease_weights(diseases):
+    weights = {diseases[0].name: 3.0, diseases[1].name: 1.0}
+    process = PoissonArrivals(1.0, disease_weights=weights)
+    rng = SimulationRNG(2)
+
+    counts = Counter(process.draw_patient(diseases, rng).disease.name for _ in range(4000))
+    assert set(counts) == set(weights)
+    assert 2.5 < counts[diseases[0].name] / counts[diseases[1].name] < 3.5
+
+
+def test_surge_keeps_base_arrivals_first_within_an_hour():
+    base = HourlyCoinArrivals(1.0, range(1, 7))
+    process = SurgeArrivals(base, 3.0, [2, 3], days=[1])
+    rng = SimulationRNG(3)
+
+    schedule = process.schedule_day(1, rng)
+    assert [hour for hour, _ in schedule] == sorted(hour for hour, _ in schedule)
+    for hour in (2, 3):
+        sources = [source for h, source in schedule if h == hour]
+        assert sources[0] is base and all(s is process.surge for s in sources[1:])
+
+    assert all(source is base for _, source in process.schedule_day(2, rng))
+
+
+def test_arrival_benchmark_draws_every_scheduled_patient(diseases):
+    case = _arrival_case(diseases, days=50)
+    calls = case.run(case.setup())
+    # about 3 arrivals a day with the default process
+    assert 100 < calls < 200
+
+
+@pytest.mark.parametrize("rate", [0.3, 4.0, 60.0, 1_300.0])
+def test_poisson_counts_have_the_poisson_mean_and_variance(rate):
+    rng = SimulationRNG(4)
+    counts = [c for _ in range(1000) for c in poisson_counts([rate] * 4, rng)]
+
+    # both are `rate`; five standard errors of margin
+    assert abs(statistics.fmean(counts) - rate) < 5 * (rate / len(counts)) ** 0.5
+    assert abs(statistics.variance(counts) / rate - 1) < 5 * (2 / len(counts)) ** 0.5
+    assert poisson_counts([0.0, 0.0], rng) == [0, 0]
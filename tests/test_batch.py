@@ -0,0 +1,51 @@
+import pytest
+
+from medical_simulator.core.batch import run_batch
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.engine import Action, ActionKind, SimulationEngine
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.policies import Policy, RandomPolicy, WaitPolicy
+from medical_simulator.core.result_sink import ResultSink
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_runs_follow_the_seeds_even_when_repeated(workers):
+    seeds = [3, 8, 3, 5, 8, 3]
+    batch = run_batch(len(seeds), RandomPolicy(), seeds=seeds, workers=workers)
+    single = {seed: run_batch(1, RandomPolicy(), seeds=[seed], workers=1).runs[0] for seed in set(seeds)}
+
+    assert [run.seed for run in batch.runs] == seeds
+    assert [run.total_score for run in batch.runs] == [single[seed].total_score for seed in seeds]
+    assert batch.summary.n_runs == len(seeds)
+
+
+def test_seed_count_must_match():
+    with pytest.raises(ValueError):
+        run_batch(3, WaitPolicy(), seeds=[1, 2], workers=1)
+
+
+def test_wait_policy_waits_out_each_day(diseases, treatments):
+    hospital = Hospital(Clock(), WaitingRoom(4), diseases, treatments, max_days=2, rng=SimulationRNG(1))
+    engine = SimulationEngine(hospital)
+    policy = WaitPolicy()
+    policy.reset(hospital, 1)
+
+    engine.reset()
+    observation, _ = engine.step(Action.wait(5))
+    action = policy.act(observation)
+    assert action.kind is ActionKind.WAIT and action.hours == Clock.DAY_LENGTH - 5
+
+
+def test_bases_are_abstract():
+    with pytest.raises(TypeError):
+        Policy()
+    with pytest.raises(TypeError):
+        ResultSink()
+
+    class Incomplete(ResultSink):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,81 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from medical_simulator.core.batched_env import BatchedEnv
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.engine import SimulationEngine
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+
+
+def _random_actions(env: BatchedEnv, rng: np.random.Generator) -> np.ndarray:
+    mask = env.action_mask()
+    return np.array([rng.choice(np.flatnonzero(row)) for row in mask])
+
+
+def test_observation_shapes(diseases):
+    env = BatchedEnv(3, diseases, capacity=4)
+    observation = env.reset()
+
+    assert observation["present"].shape == (3, 4)
+    assert observation["symptoms"].shape == (3, 4, len(env.symptom_names))
+    assert observation["findings"].shape == (3, 4, len(env.finding_names))
+    assert env.action_mask().shape == (3, env.n_actions)
+
+
+def test_rewards_add_up_to_the_episode_score(diseases):
+    env = BatchedEnv(4, diseases, max_days=2)
+    env.reset(seeds=[10, 11, 12, 13])
+    rng = np.random.default_rng(0)
+
+    totals = np.zeros(4)
+    finished = {}
+    while len(finished) < 4:
+        _, rewards, dones, info = env.step(_random_actions(env, rng))
+        totals += rewards
+        for i in np.flatnonzero(dones):
+            finished.setdefault(i, (totals[i], info["final_score"][i]))
+            totals[i] = 0
+
+    for reward_sum, score in finished.values():
+        assert reward_sum == score
+
+
+def test_each_environment_plays_like_a_single_engine(diseases, treatments):
+    env = BatchedEnv(2, diseases, treatments, max_days=2)
+    env.reset(seeds=[5, 6])
+    rng = np.random.default_rng(1)
+
+    engines = []
+    for seed in (5, 6):
+        hospital = Hospital(Clock(), WaitingRoom(env.capacity), diseases, treatments, max_days=2, rng=SimulationRNG(seed))
+        engine = SimulationEngine(hospital)
+        engine.reset()
+        engines.append(engine)
+
+    while not any(e.done for e in engines):
+        actions = _random_actions(env, rng)
+        for i, engine in enumerate(engines):
+            engine.apply(env.decode(int(actions[i]), engine.hospital))
+        observation, _, dones, _ = env.step(actions)
+        if dones.any():
+            break
+        for i, engine in enumerate(engines):
+            engine.hospital.sync_all()
+            health = [p.health for p in engine.hospital.waiting_room.patients]
+            assert observation["health"][i, :len(health)].tolist() == health
+
+    assert [e.done for e in engines] == [bool(d) for d in dones]
+
+
+def test_invalid_action_waits(diseases):
+    env = BatchedEnv(1, diseases, capacity=4)
+    env.reset()
+    empty_slot = 2 + 3 * (env.n_treatments + env.n_diseases)
+    if env.action_mask()[0, empty_slot]:
+        pytest.skip("the room is full")
+
+    _, _, _, info = env.step([empty_slot])
+    assert info["invalid"][0]
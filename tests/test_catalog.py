@@ -0,0 +1,105 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from medical_simulator.core.batch import DEFAULT_DISEASES_PATH
+from medical_simulator.utils import catalog
+from medical_simulator.utils.catalog import CatalogError, cache_path, default_cache_dir, load_catalog, parse_catalog
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(DEFAULT_DISEASES_PATH.read_text())
+    yield path
+    catalog._loaded.clear()
+
+
+def _fresh_load(path, **kwargs):
+    catalog._loaded.clear()
+    return load_catalog(path, **kwargs)
+
+
+def _names(diseases):
+    return [(d.name, d.severity, d.correct_treatments) for d in diseases]
+
+
+def test_cached_load_matches_parse(catalog_file):
+    first = _fresh_load(catalog_file)
+    cached = _fresh_load(catalog_file)
+    assert _names(first) == _names(cached) == _names(parse_catalog(catalog_file))
+
+
+def test_cache_is_reused_without_parsing(catalog_file, monkeypatch):
+    _fresh_load(catalog_file)
+
+    def fail(path):
+        raise AssertionError("parsed again")
+
+    monkeypatch.setattr(catalog, "parse_catalog", fail)
+    assert len(_fresh_load(catalog_file)) > 0
+
+
+def test_cache_lives_in_the_user_cache_folder(catalog_file):
+    _fresh_load(catalog_file)
+    assert cache_path(catalog_file).exists()
+    assert cache_path(catalog_file).parent == default_cache_dir()
+    assert not (catalog_file.parent / ".catalog_cache").exists()
+
+
+def test_edit_with_same_size_and_mtime_invalidates_cache(catalog_file):
+    _fresh_load(catalog_file)
+    stat = catalog_file.stat()
+
+    data = json.loads(catalog_file.read_text())
+    original = data[0]["name"]
+    data[0]["name"] = original[::-1] if original[::-1] != original else original.upper()
+    text = json.dumps(data)
+    catalog_file.write_text(text.ljust(stat.st_size) if len(text) < stat.st_size else text)
+    os.utime(catalog_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert catalog_file.stat().st_size == stat.st_size
+
+    assert _fresh_load(catalog_file)[0].name == data[0]["name"]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_cache_writable_by_others_is_ignored(catalog_file, tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+
+    planted = cache_path(catalog_file, shared)
+    planted.write_bytes(pickle.dumps(["planted"]))
+
+    diseases = _fresh_load(catalog_file, cache_dir=shared)
+    assert diseases != ["planted"]
+    assert _names(diseases) == _names(parse_catalog(catalog_file))
+    assert pickle.loads(planted.read_bytes()) == ["planted"]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_world_writable_cache_file_is_ignored(catalog_file):
+    _fresh_load(catalog_file)
+    target = cache_path(catalog_file)
+    target.write_bytes(pickle.dumps(["planted"]))
+    target.chmod(0o666)
+
+    assert _fresh_load(catalog_file) != ["planted"]
+
+
+def test_invalid_catalog_lists_every_problem(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('[{"name": "a"}, {"name": "a", "severity": -1}]')
+
+    with pytest.raises(CatalogError) as error:
+        _fresh_load(path)
+    assert any("duplicate" in e for e in error.value.errors)
+    assert any("severity" in e for e in error.value.errors)
+
+
+def test_ndjson_catalog(catalog_file, tmp_path):
+    path = tmp_path / "catalog.ndjson"
+    path.write_text("\n".join(json.dumps(d) for d in json.loads(catalog_file.read_text())) + "\n")
+    assert _names(_fresh_load(path)) == _names(parse_catalog(catalog_file))
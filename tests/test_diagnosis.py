@@ -0,0 +1,98 @@
+import random
+from bisect import bisect_right
+
+import pytest
+
+from medical_simulator.core.diagnosis import DiagnosisIndex
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.patient import Patient
+from medical_simulator.core import treatment
+from medical_simulator.utils.catalog import build_diseases
+from medical_simulator.utils.synthetic import generate_catalog
+
+
+@pytest.fixture(scope="module")
+def catalog() -> list[Disease]:
+    # families of look-alike diseases, so differentials stay large for a while
+    return build_diseases(generate_catalog(300, seed=11, ambiguity=0.8))
+
+
+def _visible_at(disease: Disease, hour: int) -> set[str]:
+    # symptoms are revealed on the first time step after arrival
+    return set(disease.visible_prefixes[bisect_right(disease.reveal_hours, hour) if hour > 0 else 0])
+
+
+def brute_force(diseases: list[Disease], patient: Patient, seen: list[tuple[int, set[str]]]) -> list[str]:
+    """
+    Every disease that, at each hour in `seen`, would have shown exactly the
+    symptoms seen then, and gives the same results for the tests done so far.
+    """
+    names = []
+    for disease in diseases:
+        if any(_visible_at(disease, hour) != symptoms for hour, symptoms in seen):
+            continue
+        if patient.has_done_test(treatment.TestType.VITALS) and (
+            disease.base_temperature != patient.vital_signs["temperature"]
+            or disease.base_systolic_bp != patient.vital_signs["systolic_bp"]
+        ):
+            continue
+        if any(
+            patient.has_done_test(test) and set(disease.test_results[test]) != set(patient.discovered_findings(test))
+            for test in (treatment.TestType.BLOOD, treatment.TestType.XRAY, treatment.TestType.ECG)
+        ):
+            continue
+        names.append(disease.name)
+    return names
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_differential_matches_brute_force(catalog, seed):
+    rng = random.Random(seed)
+    index = DiagnosisIndex(catalog)
+    patient = Patient(rng.choice(catalog), rng=random.Random(seed))
+    incremental = index.tracker()
+    tests = list(treatment.TestType)
+    rng.shuffle(tests)
+    seen = []
+
+    while patient.time_elapsed < 30:
+        seen.append((patient.time_elapsed, set(patient.visible_symptoms)))
+        # a tracker remembers every hour it saw the patient at
+        expected = brute_force(catalog, patient, seen)
+        assert patient.disease.name in expected
+        assert incremental.update(patient) == expected
+        # a new one only knows the current hour
+        assert index.tracker().update(patient) == brute_force(catalog, patient, seen[-1:])
+
+        # observed at irregular intervals
+        patient.advance_time(rng.randint(1, 4))
+        if tests and rng.random() < 0.4:
+            patient.apply_test(tests.pop())
+
+
+def test_symptom_with_a_later_onset_rules_the_disease_out(catalog):
+    early = Disease("early", [{"name": "cough", "from_hour": 1}], [], [], [], 37.0, 120, 1, (50, 60), [])
+    late = Disease("late", [{"name": "cough", "from_hour": 5}], [], [], [], 37.0, 120, 1, (50, 60), [])
+    index = DiagnosisIndex([early, late])
+
+    patient = Patient(early, rng=random.Random(0))
+    patient.advance_time(2)
+    assert patient.visible_symptoms == ("cough",)
+    assert index.tracker().update(patient) == ["early"]
+
+    patient = Patient(late, rng=random.Random(0))
+    patient.advance_time(6)
+    assert index.tracker().update(patient) == ["early", "late"]
+
+
+def test_showing_follows_onsets():
+    diseases = [
+        Disease(f"d{h}", [{"name": "rash", "from_hour": h}], [], [], [], 37.0, 120, 1, (50, 60), [])
+        for h in (0, 3, 7)
+    ]
+    index = DiagnosisIndex(diseases)
+
+    assert index.showing("rash", 0) == {0}
+    assert index.showing("rash", 5) == {0, 1}
+    assert index.showing("rash", 100) == {0, 1, 2}
+    assert index.showing("fever", 100) == frozenset()
@@ -0,0 +1,109 @@
+import json
+import random
+
+from medical_simulator.core import treatment
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.engine import Action, SimulationEngine
+from medical_simulator.core.events import EventKind
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.waiting_room import WaitingRoom
+
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.patient import Patient
+from medical_simulator.utils.catalog import build_diseases, load_catalog
+from medical_simulator.utils.rng import SimulationRNG
+from medical_simulator.utils.synthetic import generate_catalog
+
+
+def _disease(timeline: list[tuple[str, int]], **kwargs) -> Disease:
+    return Disease(
+        "Test", [{"name": name, "from_hour": hour} for name, hour in timeline],
+        [], [], [], 37.0, 120.0, 1.0, (60, 80), [], **kwargs
+    )
+
+
+def _visible_by_scanning(disease: Disease, hour: int) -> set[str]:
+    return {s["name"] for s in disease.symptoms_timeline if s["from_hour"] <= hour}
+
+
+def test_reveal_groups_follow_the_timeline():
+    disease = _disease([("cough", 3), ("fever", 0), ("rash", 3), ("pain", 7), ("chills", 0)])
+
+    assert disease.reveal_hours == (0, 3, 7)
+    # in timeline order within an hour
+    assert disease.reveal_groups == (("fever", "chills"), ("cough", "rash"), ("pain",))
+    assert disease.visible_prefixes[2] == ("fever", "chills", "cough", "rash")
+
+
+def test_repeated_symptom_appears_once_at_its_earliest_hour():
+    disease = _disease([("cough", 5), ("fever", 2), ("cough", 1), ("cough", 9)])
+
+    assert disease.reveal_hours == (1, 2)
+    assert disease.reveal_groups == (("cough",), ("fever",))
+
+
+def test_patients_see_what_a_timeline_scan_would_show():
+    diseases = build_diseases(generate_catalog(50, seed=6))
+    rng = random.Random(6)
+
+    for disease in diseases:
+        patient = Patient(disease, rng)
+        patient.health = 10**6
+        while patient.time_elapsed < 30:
+            patient.advance_time(rng.randint(1, 4))
+            assert sorted(patient.visible_symptoms) == sorted(_visible_by_scanning(disease, patient.time_elapsed))
+            assert len(set(patient.visible_symptoms)) == len(patient.visible_symptoms)
+
+
+def test_catalog_shares_interned_symptom_names():
+    first, second = build_diseases([
+        {**item, "symptoms_timeline": [{"name": "".join(["fe", "ver"]), "from_hour": 0}]}
+        for item in generate_catalog(2, seed=1)
+    ])
+
+    assert first.symptom_vocabulary is second.symptom_vocabulary
+    assert first.reveal_groups[0][0] is second.reveal_groups[0][0]
+
+
+def test_test_results_are_computed_once_as_tuples():
+    disease = _disease([("fever", 0)])
+    disease.blood_findings.append("anemia")
+    # findings are compiled when the disease is built
+    assert disease.test_results[treatment.TestType.BLOOD] == ("normal blood test",)
+
+    disease = Disease("Test", [], ["anemia", "leukocytosis"], [], [], 37.0, 120.0, 1.0, (60, 80), [])
+    assert disease.test_results == {
+        treatment.TestType.BLOOD: ("anemia", "leukocytosis"),
+        treatment.TestType.XRAY: ("normal chest x-ray",),
+        treatment.TestType.ECG: ("normal ECG",),
+    }
+    assert Patient(disease).apply_test(treatment.TestType.BLOOD) is disease.test_results[treatment.TestType.BLOOD]
+
+
+def test_cached_catalogs_keep_their_test_results(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(generate_catalog(5, seed=2)), encoding="utf-8")
+
+    fresh = load_catalog(path)
+    cached = load_catalog(path)
+    assert [d.test_results for d in cached] == [d.test_results for d in fresh]
+
+
+def test_hospital_reports_the_shared_findings(diseases, treatments):
+    hospital = Hospital(Clock(), WaitingRoom(4), diseases, treatments, max_days=1, rng=SimulationRNG(3))
+    engine = SimulationEngine(hospital)
+    engine.reset()
+    patient = hospital.waiting_room.get_patient(0)
+
+    found = {}
+    for index, action in enumerate(treatments):
+        if action.test_type is not None:
+            _, events = engine.step(Action.perform(0, index))
+            result, = [e for e in events if e.kind is EventKind.TEST_RESULT]
+            found[action.test_type] = result.data["findings"]
+
+    for test_type, findings in found.items():
+        if test_type is treatment.TestType.VITALS:
+            assert findings == patient.vital_signs and findings is not patient.vital_signs
+        else:
+            assert findings is patient.disease.test_results[test_type] is patient.discovered_findings(test_type)
@@ -0,0 +1,161 @@
+import io
+import random
+import subprocess
+import sys
+
+import pytest
+
+from medical_simulator.benchmarks.startup import MAIN, _environment
+from medical_simulator.core.arrivals import HourlyCoinArrivals, OverflowPolicy, PoissonArrivals, SurgeArrivals
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.engine import Action
+from medical_simulator.core.event_log import (
+    ACTION, ACTION_CODES, EVENT, HEADER, MAX_HOUR, NO_PATIENT, NO_TREATMENT, TAG_ACTION, EventLogWriter, RecordingEngine, ReplayError, read_log, replay
+)
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.scoring import ScoringRules
+from medical_simulator.core.waiting_room import AcuityScore, WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+
+
+CONFIGS = {
+    "default": {},
+    "poisson-queue": {"arrivals": PoissonArrivals({1: 0.5, 3: 2.0, 5: 1.0}), "overflow": OverflowPolicy.QUEUE},
+    "surge": {"arrivals": SurgeArrivals(HourlyCoinArrivals(0.7, range(2, 9)), 1.5, [3, 4], days=[2])},
+    "scoring": {"scoring": ScoringRules(discharge_base=50, misdiagnosis_penalty=60)},
+    "fast-forward": {"fast_forward": True},
+    "triage": {"acuity": AcuityScore(health_weight=2.0, wait_weight=0.5)},
+}
+
+
+def _hospital(diseases, treatments, seed, acuity=None, capacity=4, **kwargs) -> Hospital:
+    return Hospital(
+        Clock(), WaitingRoom(capacity, acuity), diseases, treatments,
+        max_days=3, rng=SimulationRNG(seed), **kwargs
+    )
+
+
+def _record(hospital: Hospital, seed: int) -> bytes:
+    """
+    Plays random actions on `hospital`, recording them, and returns the log.
+    """
+    rng = random.Random(seed)
+    file = io.BytesIO()
+    engine = RecordingEngine(hospital, EventLogWriter(file, hospital))
+    engine.reset()
+
+    while not engine.done:
+        room = len(hospital.waiting_room)
+        roll = rng.random()
+        if room == 0 or roll < 0.3:
+            action = Action.wait(rng.randint(1, 4))
+        elif roll < 0.45:
+            action = Action.guess_disease(rng.randrange(room), rng.choice(hospital.diseases).name)
+        else:
+            action = Action.perform(rng.randrange(room), rng.randrange(len(hospital.treatments)))
+        engine.apply(action)
+
+    engine.log.close()
+    return file.getvalue()
+
+
+@pytest.mark.parametrize("config", CONFIGS, ids=list(CONFIGS))
+@pytest.mark.parametrize("seed", [0, 7, -3, 2**64 - 1])
+def test_replay_reproduces_the_recorded_run(diseases, treatments, config, seed):
+    hospital = _hospital(diseases, treatments, seed, capacity=3, **CONFIGS[config])
+    data = _record(hospital, seed)
+
+    engine = replay(data, diseases, treatments)
+    assert engine.hospital.total_score == hospital.total_score
+    assert read_log(data).seed == seed
+
+
+def test_unrecordable_configuration_is_refused(diseases, treatments, tmp_path):
+    class Custom(HourlyCoinArrivals):
+        pass
+
+    path = tmp_path / "run.log"
+    with pytest.raises(ValueError):
+        EventLogWriter(path, _hospital(diseases, treatments, 1, arrivals=Custom()))
+    with pytest.raises(ValueError):
+        EventLogWriter(path, _hospital(diseases, treatments, 1, acuity=lambda p: p.health))
+    assert not path.exists()
+
+
+def test_action_after_the_end_raises_replay_error(diseases, treatments):
+    data = _record(_hospital(diseases, treatments, 5), 5)
+    extra = ACTION.pack(TAG_ACTION, ACTION_CODES[Action.wait(1).kind], NO_PATIENT, NO_TREATMENT, 1, 0)
+
+    with pytest.raises(ReplayError):
+        replay(data + extra, diseases, treatments)
+    with pytest.raises(ReplayError):
+        replay(data + extra, diseases, treatments, verify=False)
+
+
+def test_truncated_log_raises_replay_error(diseases, treatments):
+    data = _record(_hospital(diseases, treatments, 6), 6)
+    records = HEADER.size + HEADER.unpack_from(data)[3]
+
+    # in the header, in the second record and in the last one
+    for cut in (10, records + EVENT.size + 3, len(data) - 3):
+        with pytest.raises(ReplayError):
+            replay(data[:cut], diseases, treatments)
+
+
+def test_out_of_range_action_raises_replay_error(diseases, treatments):
+    hospital = _hospital(diseases, treatments, 8)
+    file = io.BytesIO()
+    engine = RecordingEngine(hospital, EventLogWriter(file, hospital))
+    engine.reset()
+    # a visit to a patient who is not there, as a corrupted record would ask
+    engine.log.write_action(Action.perform(1000, 0))
+
+    with pytest.raises(ReplayError):
+        replay(file.getvalue(), diseases, treatments, verify=False)
+
+
+def test_main_records_negative_seeds(tmp_path):
+    path = tmp_path / "run.log"
+    completed = subprocess.run(
+        [sys.executable, str(MAIN), "--seed", "-3", "--record", str(path)],
+        input="0\n" * 50, env=_environment(), capture_output=True, text=True, timeout=60
+    )
+    assert "Traceback" not in completed.stderr
+    assert read_log(path).seed == -3
+
+
+def test_waits_longer_than_16_bits_are_recorded(diseases, treatments):
+    hospital = _hospital(diseases, treatments, 9)
+    file = io.BytesIO()
+    engine = RecordingEngine(hospital, EventLogWriter(file, hospital))
+    engine.reset()
+    while not engine.done:
+        engine.apply(Action.wait(70_000))
+
+    data = file.getvalue()
+    assert [a.hours for a in read_log(data).actions] == [70_000] * 3
+    assert replay(data, diseases, treatments).hospital.total_score == hospital.total_score
+
+
+def test_unrecordable_action_is_refused_before_it_is_applied(diseases, treatments):
+    hospital = _hospital(diseases, treatments, 10)
+    file = io.BytesIO()
+    engine = RecordingEngine(hospital, EventLogWriter(file, hospital))
+    engine.reset()
+    engine.apply(Action.wait(3))
+    size = len(file.getvalue())
+    for action in (Action.wait(2**32), Action.wait(MAX_HOUR - 2)):
+        with pytest.raises(ValueError):
+            engine.apply(action)
+    assert hospital.clock.hour == 3 and len(file.getvalue()) == size
+
+
+def test_unexpected_errors_are_not_reported_as_corrupted_logs(diseases, treatments, monkeypatch):
+    data = _record(_hospital(diseases, treatments, 11), 11)
+
+    def broken(self, hours):
+        raise ZeroDivisionError("bug")
+
+    monkeypatch.setattr(Hospital, "wait_and_observe", broken)
+    with pytest.raises(ZeroDivisionError):
+        replay(data, diseases, treatments)
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from medical_simulator.core.arrivals import OverflowPolicy, PoissonArrivals
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.engine import Action, SimulationEngine
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.waiting_room import AcuityScore, WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+
+
+class HourlyHospital(Hospital):
+    """
+    The tick loop the scheduler replaced: every patient is stepped every hour.
+    """
+
+    def advance_time(self, hours: int) -> None:
+        for _ in range(hours):
+            super().advance_time(1)
+            self.sync_all()
+
+
+CONFIGS = {
+    "default": {},
+    "triage": {"acuity": AcuityScore()},
+    "poisson-queue": {"arrivals": PoissonArrivals(1.5), "overflow": OverflowPolicy.QUEUE},
+}
+
+
+def _hospital(cls, diseases, treatments, seed, acuity=None, **kwargs) -> Hospital:
+    return cls(
+        Clock(), WaitingRoom(4, acuity), diseases, treatments,
+        max_days=3, rng=SimulationRNG(seed), **kwargs
+    )
+
+
+def _play(hospital: Hospital, seed: int) -> tuple:
+    """
+    Plays random actions without ever observing the room, so that patients
+    are only brought up to date by the hospital itself.
+    """
+    rng = random.Random(seed)
+    engine = SimulationEngine(hospital)
+    engine.reset()
+    events = []
+
+    while not engine.done:
+        room = len(hospital.waiting_room)
+        roll = rng.random()
+        if room == 0 or roll < 0.3:
+            action = Action.wait(rng.randint(1, 4))
+        elif roll < 0.45:
+            action = Action.guess_disease(rng.randrange(room), rng.choice(hospital.diseases).name)
+        else:
+            action = Action.perform(rng.randrange(room), rng.randrange(len(hospital.treatments)))
+        events.extend(engine.apply(action))
+
+    return hospital.total_score, [
+        (e.kind, e.day, e.hour, e.patient.name if e.patient is not None else None, e.health)
+        for e in events
+    ]
+
+
+@pytest.mark.parametrize("config", CONFIGS, ids=list(CONFIGS))
+@pytest.mark.parametrize("seed", range(20))
+def test_event_driven_run_matches_hourly_loop(diseases, treatments, config, seed):
+    lazy = _play(_hospital(Hospital, diseases, treatments, seed, **CONFIGS[config]), seed)
+    hourly = _play(_hospital(HourlyHospital, diseases, treatments, seed, **CONFIGS[config]), seed)
+    assert lazy == hourly
+
+
+def test_advance_time_leaves_idle_patients_behind(diseases, treatments):
+    hospital = _hospital(Hospital, diseases, treatments, seed=1)
+    hospital.start_new_day()
+    patient = hospital.waiting_room.get_patient(0)
+
+    hospital.advance_time(1)
+    assert patient.time_elapsed == 0
+
+    hospital.sync(patient)
+    assert patient.time_elapsed == 1
+
+
+def test_observation_is_up_to_date(diseases, treatments):
+    engine = SimulationEngine(_hospital(Hospital, diseases, treatments, seed=2))
+    engine.reset()
+    engine.apply(Action.wait(3))
+
+    observation = engine.observe()
+    assert [p.time_elapsed for p in observation.patients][0] == observation.hour
+
+
+def test_acuity_order_after_sync_all(diseases, treatments):
+    acuity = AcuityScore()
+    hospital = _hospital(Hospital, diseases, treatments, seed=3, acuity=acuity)
+    engine = SimulationEngine(hospital)
+    engine.reset()
+    engine.apply(Action.wait(6))
+
+    hospital.sync_all()
+    room = hospital.waiting_room
+    expected = sorted(room.patients, key=lambda p: (acuity(p), room.id_of(p)))
+    assert room.by_acuity() == expected
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+import types
+
+import pytest
+
+from medical_simulator.benchmarks.startup import MAIN, _environment
+from medical_simulator.core import arrivals
+from medical_simulator.core.batch import run_batch
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.instrumentation import Instrumentation
+from medical_simulator.core.policies import RandomPolicy
+
+
+def _originals() -> dict:
+    return {
+        label: (owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name))
+        for owner, name, label in Instrumentation.TARGETS
+    } | {"emit": Hospital.emit, "arrivals.generate_random_patient": arrivals.generate_random_patient}
+
+
+def test_enable_and_disable_restore_the_hot_paths():
+    before = _originals()
+
+    with Instrumentation() as inst:
+        assert inst.enabled
+        assert Hospital.__dict__["advance_time"] is not before["Hospital.advance_time"]
+        assert arrivals.generate_random_patient is not before["arrivals.generate_random_patient"]
+
+    assert not inst.enabled
+    assert _originals() == before
+    assert Instrumentation._active is None
+
+
+def test_counters_after_a_short_run():
+    with Instrumentation() as inst:
+        batch = run_batch(3, RandomPolicy(), workers=1, seeds=range(3))
+
+    summary = inst.summary()
+    assert summary["simulated_hours"] > 0 and summary["events"] > 0
+    functions = summary["functions"]
+    for label in ("Hospital.advance_time", "Hospital.end_day", "generate_random_patient"):
+        assert functions[label]["calls"] > 0
+    assert functions["Hospital.end_day"]["calls"] == 3 * 5
+    assert len(batch.runs) == 3
+
+
+def test_failed_enable_leaves_nothing_patched(monkeypatch):
+    before = _originals()
+    # a target that no longer exists, like a removed import
+    monkeypatch.setattr(Instrumentation, "ALIASES", {"generate_random_patient": (arrivals, types.ModuleType("gone"))})
+
+    inst = Instrumentation()
+    with pytest.raises(AttributeError):
+        inst.enable()
+
+    assert not inst.enabled
+    assert Instrumentation._active is None
+    assert _originals() == before
+    # and a new instrumentation can still be enabled
+    monkeypatch.undo()
+    with Instrumentation():
+        pass
+
+
+def test_only_one_instrumentation_at_a_time():
+    with Instrumentation():
+        with pytest.raises(RuntimeError):
+            Instrumentation().enable()
+
+
+def test_profile_command():
+    completed = subprocess.run(
+        [sys.executable, str(MAIN), "--profile", "2"],
+        env=_environment(), capture_output=True, text=True, timeout=120
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert "2 runs, mean score" in completed.stdout
+    assert "Hospital.advance_time" in completed.stdout
@@ -0,0 +1,203 @@
+import io
+import json
+import os
+import time
+
+import pytest
+
+from medical_simulator.utils.catalog import CatalogError, catalog_key
+from medical_simulator.utils.lazy_catalog import LazyCatalog, scan_catalog
+from medical_simulator.utils.synthetic import generate_catalog
+
+
+class CountingReader(io.BytesIO):
+    """
+    In-memory file that counts the bytes read from it.
+    """
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _catalog(n: int = 20) -> list[dict]:
+    items = generate_catalog(n, seed=3)
+    # strings a chunk may cut inside an escape or a multi-byte character
+    items[0]["name"] = 'Fièvre "aiguë" \\ été ☃'
+    items[1]["blood_findings"] = ["a\nb", "\u0001\u001f", "😀"]
+    return items
+
+
+def _array(items: list[dict]) -> bytes:
+    return ("[\n" + ",\n".join(json.dumps(i) for i in items) + "\n]\n").encode("utf-8")
+
+
+def _ndjson(items: list[dict]) -> bytes:
+    return "".join(json.dumps(i, ensure_ascii=False) + "\n\n" for i in items).encode("utf-8")
+
+
+def _scan(data: bytes, chunk_size: int) -> list:
+    return list(scan_catalog(io.BytesIO(data), chunk_size))
+
+
+@pytest.mark.parametrize("layout", [_array, _ndjson], ids=["array", "ndjson"])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+def test_chunk_size_does_not_change_the_result(layout, chunk_size):
+    items = _catalog()
+    data = layout(items)
+
+    scanned = _scan(data, chunk_size)
+    assert scanned == _scan(data, 1 << 20)
+    for (offset, length, _), item in zip(scanned, items):
+        assert json.loads(data[offset:offset + length]) == item
+    assert len(scanned) == len(items)
+
+
+@pytest.mark.parametrize("text", ["", "  \n", "[]", "[ ]\n", '[{"a": 1}]', '{"a": 1}\n{"b": 2}', '{"a": 1} {"b": 2}'])
+def test_accepted_layouts(text):
+    assert [item for _, _, item in _scan(text.encode(), 4)] == json.loads("[" + text.strip().strip("[]").replace("} {", "},{").replace("}\n{", "},{") + "]")
+
+
+@pytest.mark.parametrize("text", [
+    '[[{"a": 1}]]',
+    '[{"a": 1},,{"b": 2}]',
+    '[,{"a": 1}]',
+    '[{"a": 1},]',
+    '[{"a": 1} {"b": 2}]',
+    '[{"a": 1}]]',
+    '[{"a": 1}],',
+    '[{"a": 1}',
+    '{"a": 1}]',
+    '{"a": 1},{"b": 2}',
+    '{"a": 1}{"b": 2}',
+    ']',
+    ',{"a": 1}',
+])
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_rejected_layouts(text, chunk_size):
+    with pytest.raises(CatalogError):
+        _scan(text.encode(), chunk_size)
+
+
+def test_malformed_entry_fails_without_reading_the_rest():
+    tail = _array(generate_catalog(2000, seed=1))[1:]
+    data = b'[{"name": "broken" "severity": 1},' + tail
+    file = CountingReader(data)
+
+    with pytest.raises(CatalogError, match="byte 19"):
+        list(scan_catalog(file, chunk_size=4096))
+    assert file.bytes_read <= 4096
+
+
+def test_value_spanning_many_chunks_is_decoded_a_few_times(monkeypatch):
+    item = {"name": "long", "text": "x" * 200_000}
+    calls = []
+    decoder = json.JSONDecoder()
+
+    class Decoder:
+        def raw_decode(self, s, idx=0):
+            calls.append(idx)
+            return decoder.raw_decode(s, idx)
+
+    monkeypatch.setattr("medical_simulator.utils.lazy_catalog._DECODER", Decoder())
+    assert [i for _, _, i in _scan(_array([item]), 64)] == [item]
+    assert len(calls) < 20
+
+
+def test_lazy_catalog_rejects_nested_array(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_bytes(b"[" + _array(_catalog(3)) + b"]")
+
+    with pytest.raises(CatalogError):
+        LazyCatalog(path, use_cache=False)
+
+
+def _hashes(monkeypatch) -> list:
+    calls = []
+    key = catalog_key
+
+    def counting(path):
+        calls.append(path)
+        return key(path)
+
+    monkeypatch.setattr("medical_simulator.utils.lazy_catalog.catalog_key", counting)
+    return calls
+
+
+def _set_mtime(path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_catalog_is_not_hashed_again(tmp_path, monkeypatch):
+    path = tmp_path / "catalog.json"
+    path.write_bytes(_array(_catalog(5)))
+    # long enough ago for its modification time to be trusted
+    _set_mtime(path, time.time_ns() - 10**10)
+    hashes = _hashes(monkeypatch)
+
+    names = LazyCatalog(path).names()
+    assert len(hashes) == 1
+    assert LazyCatalog(path).names() == names
+    assert len(hashes) == 1
+
+    # touched but unchanged: hashed, not scanned again
+    _set_mtime(path, time.time_ns() - 5 * 10**9)
+    monkeypatch.setattr(LazyCatalog, "_build_index", lambda self: pytest.fail("rescanned"))
+    assert LazyCatalog(path).names() == names
+    assert len(hashes) == 2
+    assert LazyCatalog(path).names() == names
+    assert len(hashes) == 2
+
+
+def test_edit_keeping_size_and_modification_time_is_caught(tmp_path, monkeypatch):
+    path = tmp_path / "catalog.json"
+    items = _catalog(5)
+    path.write_bytes(_array(items))
+    mtime_ns = path.stat().st_mtime_ns
+    assert LazyCatalog(path).names()[0] == items[0]["name"]
+
+    # same size, same timestamp, e.g. rewritten within one tick of a coarse clock
+    items[0]["name"] = items[0]["name"][::-1]
+    path.write_bytes(_array(items))
+    _set_mtime(path, mtime_ns)
+    assert LazyCatalog(path).names()[0] == items[0]["name"]
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_non_ascii_names(tmp_path, ensure_ascii):
+    items = _catalog(4)
+    items[2]["name"] = "café"
+    path = tmp_path / "catalog.json"
+    text = json.dumps(items, ensure_ascii=ensure_ascii)
+    # raw UTF-8 and an escape in the same name
+    text = text.replace('"caf\\u00e9"' if ensure_ascii else '"café"', '"c\\u00e1fé"')
+    path.write_bytes(text.encode("utf-8"))
+
+    catalog = LazyCatalog(path, use_cache=False)
+    assert catalog.names() == [items[0]["name"], items[1]["name"], "cáfé", items[3]["name"]]
+    assert catalog[items[0]["name"]].name == items[0]["name"]
+    assert catalog["cáfé"].severity == items[2]["severity"]
+
+
+def test_invalid_utf8_raises_catalog_error_with_its_offset(tmp_path):
+    items = _catalog(3)
+    # lone surrogates, encoded as one invalid byte each
+    items[1]["name"] = "bad \udcff name"
+    items[2]["ecg_findings"] = ["bad \udcfe finding"]
+    raw = "".join(json.dumps(i, ensure_ascii=False) + "\n" for i in items).encode("utf-8", "surrogateescape")
+    in_name, in_finding = raw.index(b"\xff"), raw.index(b"\xfe")
+    path = tmp_path / "catalog.ndjson"
+
+    path.write_bytes(raw)
+    with pytest.raises(CatalogError, match=f"byte {in_name}"):
+        LazyCatalog(path, use_cache=False)
+
+    # only read when the disease is built
+    path.write_bytes(raw.replace(b"\xff", b"-"))
+    catalog = LazyCatalog(path, use_cache=False)
+    with pytest.raises(CatalogError, match=f"byte {in_finding}"):
+        catalog[items[2]["name"]]
@@ -0,0 +1,60 @@
+import subprocess
+import sys
+import textwrap
+
+from medical_simulator.benchmarks.startup import _environment
+
+
+def _run_without_numpy(code: str) -> subprocess.CompletedProcess:
+    # a None entry in sys.modules makes `import numpy` raise ImportError
+    script = "import sys\nsys.modules['numpy'] = None\n" + textwrap.dedent(code)
+    return subprocess.run([sys.executable, "-c", script], env=_environment(), capture_output=True, text=True)
+
+
+def test_game_runs_without_numpy():
+    completed = _run_without_numpy("""
+        from medical_simulator.core.arrivals import PoissonArrivals
+        from medical_simulator.core.batch import DEFAULT_DISEASES_PATH
+        from medical_simulator.core.clock import Clock
+        from medical_simulator.core.engine import Action, SimulationEngine
+        from medical_simulator.core.hospital import Hospital
+        from medical_simulator.core.waiting_room import WaitingRoom
+        from medical_simulator.utils.rng import SimulationRNG
+        from medical_simulator.utils.utils import build_treatments, load_diseases_from_json
+
+        diseases = load_diseases_from_json(str(DEFAULT_DISEASES_PATH))
+        hospital = Hospital(
+            Clock(), WaitingRoom(10), diseases, build_treatments(), max_days=2,
+            rng=SimulationRNG(3), arrivals=PoissonArrivals(1.0)
+        )
+        engine = SimulationEngine(hospital)
+        observation, _ = engine.reset()
+        while not observation.done:
+            observation, _ = engine.step(Action.end_day())
+        print("numpy" in sys.modules and sys.modules["numpy"] is not None)
+    """)
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "False"
+
+
+def test_numpy_modules_name_the_missing_dependency():
+    for module in ("population", "batched_env"):
+        completed = _run_without_numpy(f"import medical_simulator.core.{module}")
+        assert completed.returncode != 0
+        assert "requires numpy" in completed.stderr
+
+
+def test_poisson_arrivals_do_not_depend_on_numpy():
+    code = """
+        from medical_simulator.core.arrivals import PoissonArrivals
+        from medical_simulator.utils.rng import SimulationRNG
+
+        process, rng = PoissonArrivals({1: 0.5, 3: 4.0, 5: 900.0}), SimulationRNG(7)
+        print([len(process.arrival_hours(day, rng)) for day in range(20)])
+    """
+    with_numpy = subprocess.run(
+        [sys.executable, "-c", "import numpy\n" + textwrap.dedent(code)], env=_environment(), capture_output=True, text=True
+    )
+    without_numpy = _run_without_numpy(code)
+    assert with_numpy.returncode == 0 and without_numpy.returncode == 0, with_numpy.stderr + without_numpy.stderr
+    assert with_numpy.stdout == without_numpy.stdout
@@ -0,0 +1,76 @@
+import pytest
+
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.patient import Patient
+from medical_simulator.utils.rng import SplitMix64
+
+
+def _disease(severity: float, health: tuple[int, int] = (40, 90)) -> Disease:
+    timeline = [{"name": "fever", "from_hour": 0}, {"name": "rash", "from_hour": 6}, {"name": "shock", "from_hour": 20}]
+    return Disease("Test", timeline, [], [], [], 37.0, 120.0, severity, health, [])
+
+
+def _outcomes(disease: Disease, hours: int, fast: bool, n: int, seed: int) -> list[tuple[int, int]]:
+    outcomes = []
+    for i in range(n):
+        patient = Patient(disease, SplitMix64(seed * 1_000_003 + i))
+        if fast:
+            patient.fast_forward(hours)
+        else:
+            patient.catch_up(hours)
+        assert patient.visible_symptoms == disease.visible_prefixes[sum(h <= patient.time_elapsed for h in disease.reveal_hours)]
+        outcomes.append((patient.health, patient.time_elapsed))
+    return outcomes
+
+
+def _ks(a: list[int], b: list[int]) -> float:
+    """
+    Two-sample Kolmogorov–Smirnov distance between the empirical distributions of `a` and `b`.
+    """
+    a, b = sorted(a), sorted(b)
+    i = j = 0
+    distance = 0.0
+    for value in sorted(set(a) | set(b)):
+        while i < len(a) and a[i] <= value:
+            i += 1
+        while j < len(b) and b[j] <= value:
+            j += 1
+        distance = max(distance, abs(i / len(a) - j / len(b)))
+    return distance
+
+
+@pytest.mark.parametrize("severity, hours", [(1.3, 24), (3.7, 30), (7.0, 12), (2.6, 28)])
+def test_fast_forward_matches_the_hourly_loop_in_distribution(severity, hours):
+    # a fixed initial health leaves only the decay to compare
+    disease = _disease(severity, (70, 70))
+    n = 4000
+    hourly = _outcomes(disease, hours, fast=False, n=n, seed=1)
+    fast = _outcomes(disease, hours, fast=True, n=n, seed=2)
+
+    # a KS distance above 0.044 (the 0.1% critical value for these sample
+    # sizes) would mean the distributions differ; seeded, so the test is stable
+    for column in (0, 1):
+        assert _ks([o[column] for o in hourly], [o[column] for o in fast]) < 0.044
+
+    deaths = sum(h == 0 for h, _ in hourly), sum(h == 0 for h, _ in fast)
+    assert abs(deaths[0] - deaths[1]) / n < 0.03
+    mean = sum(h for h, _ in hourly) / n, sum(h for h, _ in fast) / n
+    assert abs(mean[0] - mean[1]) < 0.3
+
+
+def test_fast_forward_stops_at_death():
+    patient = Patient(_disease(9.0), SplitMix64(5))
+    patient.fast_forward(1000)
+
+    assert patient.health == 0
+    # at least 5 points are lost an hour, at most 9
+    assert 40 / 9 <= patient.time_elapsed <= 90 / 4.5 + 1
+
+
+def test_short_waits_use_the_hourly_loop():
+    disease = _disease(2.5)
+    for hours in (0, 1, 2):
+        fast, hourly = Patient(disease, SplitMix64(8)), Patient(disease, SplitMix64(8))
+        fast.fast_forward(hours)
+        hourly.catch_up(hours)
+        assert (fast.health, fast.time_elapsed) == (hourly.health, hourly.time_elapsed)
@@ -0,0 +1,72 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.population import PatientPopulation
+from medical_simulator.utils.catalog import build_diseases
+from medical_simulator.utils.rng import SplitMix64
+from medical_simulator.utils.synthetic import generate_catalog
+
+
+def test_symptoms_are_revealed_like_patients_reveal_them():
+    diseases = build_diseases(generate_catalog(40, seed=4))
+    population = PatientPopulation(diseases, capacity=8)
+    patients = [Patient(d, SplitMix64(i)) for i, d in enumerate(diseases)]
+    # health high enough that nobody dies during the test
+    for patient in patients:
+        patient.health = 10**6
+    slots = [population.add(i, 10**6) for i in range(len(diseases))]
+    rng = np.random.default_rng(0)
+
+    for hours in (1, 1, 2, 3, 5, 8, 13, 21):
+        update = population.advance(hours, rng)
+        assert update.died.shape[0] == 0
+        for slot, patient in zip(slots, patients):
+            patient.catch_up(hours)
+            assert population.visible_symptoms(slot) == list(patient.visible_symptoms)
+        assert set(update.revealed) <= set(slots)
+
+
+def test_freed_slots_are_reused_and_growth_keeps_patients(diseases):
+    population = PatientPopulation(diseases, capacity=2)
+    first, second = population.add(0, 50), population.add(1, 60)
+    population.remove(first)
+    assert population.add(2, 70) == first
+    assert len(population) == 2
+
+    more = population.add_many(np.array([3, 4, 0]), np.array([10, 20, 30]), hospital=1)
+    assert population.capacity >= 5 and len(population) == 5
+    assert population.health[second] == 60 and population.disease[second] == 1
+    assert list(population.health[more]) == [10, 20, 30]
+    assert sorted(population.slots(1)) == sorted(more)
+
+
+def test_advance_only_touches_the_given_hospital(diseases):
+    population = PatientPopulation(diseases)
+    ours = population.add_many(np.array([0, 1]), np.array([80, 80]), hospital=0)
+    theirs = population.add_many(np.array([0, 1]), np.array([80, 80]), hospital=1)
+
+    population.advance(3, np.random.default_rng(1), hospital=1)
+    assert list(population.time_elapsed[ours]) == [0, 0] and list(population.health[ours]) == [80, 80]
+    assert list(population.time_elapsed[theirs]) == [3, 3]
+
+    assert sorted(population.remove_hospital(1)) == sorted(theirs)
+    assert sorted(population.slots()) == sorted(ours)
+
+
+def test_decay_stays_within_the_hourly_bounds_and_deaths_free_slots(diseases):
+    population = PatientPopulation(diseases)
+    slots = population.add_many(np.arange(len(diseases)), np.full(len(diseases), 3))
+    severity = np.array([diseases[i].severity for i in population.disease[slots]])
+    before = population.health[slots].astype(np.float64)
+
+    update = population.advance(1, np.random.default_rng(2))
+    after = population.health[slots]
+    assert np.all(after >= np.maximum(np.trunc(before - severity), 0))
+    assert np.all(after <= np.trunc(before - severity / 2))
+
+    dead = slots[after == 0]
+    assert sorted(update.died) == sorted(dead)
+    assert not population.active[dead].any()
+    assert len(population) == len(slots) - len(dead)
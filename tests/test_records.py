@@ -0,0 +1,68 @@
+import copy
+import pickle
+
+import pytest
+
+from medical_simulator.core import treatment
+from medical_simulator.core.case_result import CaseResult, Outcome
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.treatment import Treatment
+from medical_simulator.utils.rng import SplitMix64
+
+
+def test_slotted_objects_have_no_instance_dict(diseases):
+    objects = [
+        Patient(diseases[0], SplitMix64(1)),
+        CaseResult("Ana", Outcome.DIED, -50),
+        Treatment("Rest"),
+    ]
+    for obj in objects:
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.typo = 1
+
+
+def test_outcomes_and_test_types_accept_their_codes():
+    result = CaseResult("Ana", "Discharged", 100, health=72)
+    assert result.outcome is Outcome.DISCHARGED
+    assert result.notes == "Health at discharge: 72"
+    assert CaseResult("Ana", Outcome.DIED, -50).notes == "Critical deterioration"
+
+    assert Treatment("Blood test", test_type="blood").test_type is treatment.TestType.BLOOD
+    assert Treatment("Rest").test_type is None
+    with pytest.raises(ValueError):
+        CaseResult("Ana", "Cured", 0)
+    with pytest.raises(ValueError):
+        Treatment("Scan", test_type="mri")
+
+
+def test_patient_findings_are_shared_and_only_shown_once_tested(diseases):
+    disease = next(d for d in diseases if d.blood_findings)
+    patient, other = Patient(disease, SplitMix64(2)), Patient(disease, SplitMix64(3))
+
+    assert patient.discovered_blood_findings == () and patient.vital_signs == {}
+    assert not patient.has_done_test(treatment.TestType.BLOOD)
+
+    findings = patient.apply_blood_test()
+    assert findings == tuple(disease.blood_findings)
+    assert patient.discovered_blood_findings is findings is other.apply_blood_test()
+    assert patient.discovered_xray_findings == ()
+    patient.apply_vital_signs_test()
+    assert patient.vital_signs == {"temperature": disease.base_temperature, "systolic_bp": disease.base_systolic_bp}
+
+
+def test_copies_are_independent_and_pickle(diseases):
+    patient = Patient(diseases[1], SplitMix64(4))
+    patient.name = "Ana"
+    patient.record_action("Blood test")
+    patient.apply_blood_test()
+
+    for clone in (copy.deepcopy(patient), pickle.loads(pickle.dumps(patient))):
+        assert clone.name == "Ana" and clone.health == patient.health
+        assert clone.has_done_test(treatment.TestType.BLOOD)
+        clone.record_action("ECG")
+        clone.advance_time(5)
+        assert patient.actions == ["Blood test"] and patient.time_elapsed == 0
+
+    result = pickle.loads(pickle.dumps(CaseResult("Ana", Outcome.NOT_DISCHARGED, 0, actions=("ECG",))))
+    assert result.outcome is Outcome.NOT_DISCHARGED and result.actions == ("ECG",)
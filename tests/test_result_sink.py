@@ -0,0 +1,105 @@
+import csv
+import json
+
+import pytest
+
+from medical_simulator.core.batch import run_batch
+from medical_simulator.core.case_result import CaseResult, Outcome
+from medical_simulator.core.policies import RandomPolicy
+from medical_simulator.core.result_sink import COLUMNS, CsvSink, JsonlSink, MemorySink, ResultSink, open_sink
+
+
+RESULTS = [
+    CaseResult("Ana", Outcome.DISCHARGED, 120, 64, "Flu", 1, 5, ("Blood test", "Rest")),
+    CaseResult("Luis", Outcome.DIED, -100, 0, "Sepsis", 2, 12, ()),
+    CaseResult("Marta, \"Jr\"", Outcome.NOT_DISCHARGED, 0, 40, "Asthma", 3, 12, ("ECG",)),
+]
+
+
+def _expected() -> list[dict]:
+    return [
+        {**dict(zip(COLUMNS, (run_id, r.day, r.hour, r.patient_name, r.disease, r.outcome.value, r.score, r.health))),
+         "actions": list(r.actions)}
+        for run_id, r in enumerate(RESULTS * 3)
+    ]
+
+
+def _fill(sink: ResultSink) -> ResultSink:
+    with sink:
+        for run_id, result in enumerate(RESULTS * 3):
+            sink.write(run_id, result)
+    return sink
+
+
+def _read_jsonl(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _read_csv(path) -> list[dict]:
+    with open(path, encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    for row in rows:
+        for column in ("run_id", "day", "hour", "score", "health"):
+            row[column] = int(row[column])
+        row["actions"] = row["actions"].split("|") if row["actions"] else []
+    return rows
+
+
+def _read_parquet(path) -> list[dict]:
+    import pyarrow.parquet as pq
+    return pq.read_table(path).to_pylist()
+
+
+@pytest.mark.parametrize("suffix, read", [(".jsonl", _read_jsonl), (".csv", _read_csv), (".parquet", _read_parquet)])
+def test_every_sink_round_trips(tmp_path, suffix, read):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    path = tmp_path / f"results{suffix}"
+
+    sink = _fill(open_sink(path, batch_size=4))
+    assert sink.rows_written == len(RESULTS) * 3
+    assert read(path) == _expected()
+
+
+def test_memory_sink_keeps_rows():
+    sink = _fill(MemorySink())
+    assert [dict(zip(COLUMNS, row[:-1] + (list(row[-1]),))) for row in sink.rows] == _expected()
+
+
+def test_rows_are_written_in_batches(tmp_path):
+    path = tmp_path / "results.jsonl"
+    sink = JsonlSink(path, batch_size=4)
+    for run_id, result in enumerate(RESULTS * 3):
+        sink.write(run_id, result)
+        # only full batches reach the file before closing
+        assert sink.rows_written == (run_id + 1) // 4 * 4
+    sink.close()
+    assert sink.rows_written == 9 and len(_read_jsonl(path)) == 9
+
+
+def test_parquet_writes_one_row_group_per_batch(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "results.parquet"
+
+    _fill(open_sink(path, batch_size=4))
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
+
+
+def test_open_sink_rejects_unknown_extensions(tmp_path):
+    with pytest.raises(ValueError):
+        open_sink(tmp_path / "results.xlsx")
+    with pytest.raises(ValueError):
+        CsvSink(tmp_path / "results.csv", batch_size=0)
+
+
+def test_batch_streams_results_to_the_sink():
+    kept = run_batch(3, RandomPolicy(), workers=1, seeds=[4, 5, 6])
+    sink = MemorySink(batch_size=7)
+
+    streamed = run_batch(3, RandomPolicy(), workers=1, seeds=[4, 5, 6], sink=sink)
+    sink.close()
+    assert all(run.case_results == [] for run in streamed.runs)
+    assert [row[0] for row in sink.rows] == [run.seed for run in kept.runs for _ in run.case_results]
+    assert [row[3:] for row in sink.rows] == [
+        (r.patient_name, r.disease, r.outcome.value, r.score, r.health, r.actions) for run in kept.runs for r in run.case_results
+    ]
@@ -0,0 +1,72 @@
+import copy
+import pickle
+import subprocess
+import sys
+
+from medical_simulator.benchmarks.startup import _environment
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.engine import Action, SimulationEngine
+from medical_simulator.core.events import EventKind
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG, SplitMix64, derive_seed
+
+
+def _draws(rng, n: int = 5) -> list[float]:
+    return [rng.random() for _ in range(n)]
+
+
+def test_spawned_streams_depend_only_on_the_seed_and_path():
+    root = SimulationRNG(42)
+    _draws(root, 100)
+    patient = root.spawn("patient", 3)
+    arrivals = root.spawn("arrivals")
+    # drawing from one stream does not move the others
+    first = _draws(patient)
+    assert _draws(arrivals) == _draws(SimulationRNG(42).spawn("arrivals"))
+    assert first == _draws(SimulationRNG(42).spawn("patient").spawn(3))
+
+    assert _draws(root.spawn("patient", 4)) != first
+    assert _draws(SimulationRNG(43).spawn("patient", 3)) != first
+
+
+def test_derived_seeds_are_the_same_in_another_process():
+    code = "from medical_simulator.utils.rng import derive_seed; print(derive_seed(7, ('arrivals', 2)))"
+    completed = subprocess.run([sys.executable, "-c", code], env=_environment(), capture_output=True, text=True)
+    assert int(completed.stdout) == derive_seed(7, ("arrivals", 2))
+
+
+def test_copies_continue_the_same_stream():
+    rng = SimulationRNG(5).spawn("x")
+    _draws(rng, 10)
+    for clone in (copy.deepcopy(rng), pickle.loads(pickle.dumps(rng))):
+        assert clone.path == rng.path
+        assert _draws(clone) == _draws(copy.deepcopy(rng))
+
+    stream = SplitMix64(9)
+    stream.random()
+    assert copy.deepcopy(stream).next64() == stream.next64()
+
+
+def _arrivals(diseases, treatments, seed: int, treat: bool) -> list[tuple]:
+    """
+    Plays `seed` waiting hour by hour, or treating the first patient when
+    `treat`, and returns who arrived when.
+    """
+    hospital = Hospital(Clock(), WaitingRoom(50), diseases, treatments, max_days=4, rng=SimulationRNG(seed))
+    engine = SimulationEngine(hospital)
+    _, events = engine.reset()
+    arrived = []
+    while True:
+        arrived += [(e.day, e.hour, e.patient.name, e.patient.disease.name) for e in events if e.kind is EventKind.ARRIVAL]
+        if engine.done:
+            return arrived
+        action = Action.perform(0, 0) if treat and len(hospital.waiting_room) else Action.wait(1)
+        _, events = engine.step(action)
+
+
+def test_arrivals_do_not_depend_on_how_the_day_is_played(diseases, treatments):
+    waited = _arrivals(diseases, treatments, 11, treat=False)
+    assert len(waited) > 4
+    assert _arrivals(diseases, treatments, 11, treat=True) == waited
+    assert _arrivals(diseases, treatments, 12, treat=False) != waited
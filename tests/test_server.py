@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+from medical_simulator import main
+from medical_simulator.core.server import DEFAULT_HOST, DEFAULT_PORT, SessionServer
+
+
+def _open(server: SessionServer, **options) -> int:
+    response = server.handle({"op": "open", "seed": 3, **options})
+    assert response["ok"]
+    return response["session"]
+
+
+def test_wait_stops_at_the_end_of_the_day(diseases):
+    server = SessionServer(diseases)
+    capped, exact = _open(server), _open(server)
+    server.handle({"op": "step", "session": exact, "action": {"kind": "wait", "hours": 2}})
+    server.handle({"op": "step", "session": capped, "action": {"kind": "wait", "hours": 2}})
+
+    start = time.perf_counter()
+    response = server.handle({"op": "step", "session": capped, "action": {"kind": "wait", "hours": 10**12}})
+    assert time.perf_counter() - start < 1
+    assert response["ok"]
+    assert response["observation"]["day"] == 2 and response["observation"]["hour"] == 0
+
+    # the same as waiting out the rest of the day
+    expected = server.handle({"op": "step", "session": exact, "action": {"kind": "wait", "hours": 10}})
+    assert response["events"] == expected["events"]
+    assert response["observation"] == expected["observation"]
+
+
+def test_wait_within_the_day_is_not_capped(diseases):
+    server = SessionServer(diseases)
+    session = _open(server)
+
+    response = server.handle({"op": "step", "session": session, "action": {"kind": "wait", "hours": 5}})
+    assert response["observation"]["day"] == 1 and response["observation"]["hour"] == 5
+
+
+def test_any_step_failure_is_a_protocol_error(diseases):
+    server = SessionServer(diseases)
+    session = _open(server)
+
+    def broken(action):
+        raise KeyError("boom")
+
+    server.sessions[session].engine.step = broken
+    response = server.handle({"op": "step", "session": session, "action": {"kind": "wait"}, "id": 9})
+    assert response == {"ok": False, "error": "Internal error: KeyError: 'boom'", "id": 9}
+
+    # the server, and the other sessions, keep working
+    other = _open(server)
+    assert server.handle({"op": "observe", "session": other})["ok"]
+    assert server.handle({"op": "stats"})["latency"]["requests"] == 4
+
+
+def test_invalid_action_is_reported(diseases):
+    server = SessionServer(diseases)
+    session = _open(server)
+
+    response = server.handle({"op": "step", "session": session, "action": {"kind": "perform", "patient": 99, "treatment": 0}})
+    assert not response["ok"] and response["error"]
+
+
+def test_stop_cancels_the_expiry_task(diseases):
+    server = SessionServer(diseases, idle_timeout=0.05)
+
+    async def run():
+        await server.start(port=0)
+        task = server._expire_task
+        assert task is not None and not task.done()
+        await server.stop()
+        assert task.cancelled() and server._expire_task is None
+        # nothing of the server is left running
+        return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
+
+
+def test_idle_sessions_expire_while_serving(diseases):
+    server = SessionServer(diseases, idle_timeout=0.02)
+
+    async def run():
+        await server.start(port=0)
+        _open(server)
+        await asyncio.sleep(0.1)
+        await server.stop()
+
+    asyncio.run(run())
+    assert server.expired == 1 and not server.sessions
+
+
+def test_serve_honours_port_zero(diseases, monkeypatch):
+    bound = []
+
+    async def serve_forever(self, host, port):
+        bound.append((host, port))
+
+    monkeypatch.setattr(SessionServer, "serve_forever", serve_forever)
+    main.serve(diseases, None, "127.0.0.1", 0, None)
+    main.serve(diseases, None, None, None, None)
+
+    assert bound == [("127.0.0.1", 0), (DEFAULT_HOST, DEFAULT_PORT)]
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+from medical_simulator.benchmarks import startup
+
+
+@pytest.mark.parametrize("case", startup.cases(), ids=lambda case: case.name)
+def test_startup_skips_heavy_modules(case):
+    assert not startup.imported_modules(case.args) & set(case.forbidden)
+
+
+@pytest.mark.parametrize("case", startup.cases(), ids=lambda case: case.name)
+def test_startup_within_budget(case):
+    assert startup.wall_time(case.args, repeat=3) * 1000 <= startup.BUDGET_MS
+
+
+def _main(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(startup.MAIN), *args],
+        env=startup._environment(), capture_output=True, text=True
+    )
+
+
+def test_version():
+    from medical_simulator import __version__
+
+    completed = _main("--version")
+    assert completed.returncode == 0
+    assert __version__ in completed.stdout
+
+
+def test_validate_catalog_accepts_the_bundled_catalog():
+    completed = _main("--validate-catalog")
+    assert completed.returncode == 0
+    assert ": ok, " in completed.stdout
+
+
+def test_validate_catalog_reports_every_problem(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('[{"name": "a", "severity": -1}]')
+
+    completed = _main("--validate-catalog", str(path))
+    assert completed.returncode == 1
+    assert "INVALID" in completed.stdout
+    assert "diseases[0].severity" in completed.stdout
+    assert not (tmp_path / ".catalog_cache").exists()
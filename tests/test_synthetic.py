@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from medical_simulator.utils.catalog import load_catalog, validate_catalog
+from medical_simulator.utils.lazy_catalog import LazyCatalog
+from medical_simulator.utils.synthetic import generate_catalog, main, write_catalog
+
+
+FEATURES = ("blood_findings", "xray_findings", "ecg_findings", "base_temperature", "base_systolic_bp", "severity", "correct_treatments")
+
+
+def _shared_features(catalog: list[dict], family_size: int) -> float:
+    """
+    Share of features equal to the ones of the first disease of the family.
+    """
+    same = total = 0
+    for i, disease in enumerate(catalog):
+        first = catalog[i - i % family_size]
+        if disease is not first:
+            same += sum(disease[key] == first[key] for key in FEATURES)
+            total += len(FEATURES)
+    return same / total
+
+
+@pytest.mark.parametrize("ambiguity", [0.0, 0.3, 1.0])
+def test_catalogs_are_valid_and_determined_by_the_seed(ambiguity):
+    catalog = generate_catalog(200, seed=9, ambiguity=ambiguity)
+
+    validate_catalog(catalog)
+    assert [d["name"] for d in catalog] == [f"disease {i}" for i in range(200)]
+    assert generate_catalog(200, seed=9, ambiguity=ambiguity) == catalog
+    assert generate_catalog(200, seed=10, ambiguity=ambiguity) != catalog
+
+
+def test_ambiguity_controls_how_alike_families_are():
+    shared = [_shared_features(generate_catalog(300, seed=1, ambiguity=a, family_size=3), 3) for a in (0.0, 0.5, 1.0)]
+
+    assert shared[0] < shared[1] < shared[2] == 1.0
+    identical = generate_catalog(6, seed=2, ambiguity=1.0, family_size=3)
+    assert all({**d, "name": None} == {**identical[0], "name": None} for d in identical[:3])
+
+
+def test_correct_treatments_come_from_the_given_list():
+    catalog = generate_catalog(50, seed=3, treatments=["Rest", "Surgery"])
+    assert {t for d in catalog for t in d["correct_treatments"]} <= {"Rest", "Surgery"}
+
+
+@pytest.mark.parametrize("options", [
+    {"n_diseases": -1},
+    {"ambiguity": 1.5},
+    {"family_size": 0},
+    {"n_symptoms": 0},
+    {"n_findings": -2},
+])
+def test_invalid_arguments_raise_value_error(options):
+    with pytest.raises(ValueError):
+        generate_catalog(**{"n_diseases": 10, **options})
+
+
+def test_empty_treatments_raise_a_clear_error():
+    with pytest.raises(ValueError, match="treatments must name at least one"):
+        generate_catalog(10, treatments=[])
+
+
+def test_pool_sizes_are_used_as_given():
+    catalog = generate_catalog(40, seed=5, n_symptoms=1, n_findings=0)
+
+    validate_catalog(catalog)
+    assert {s["name"] for d in catalog for s in d["symptoms_timeline"]} == {"symptom 0"}
+    assert not any(d[test] for d in catalog for test in ("blood_findings", "xray_findings", "ecg_findings"))
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_written_catalogs_load(tmp_path, ndjson):
+    catalog = generate_catalog(30, seed=4)
+    path = tmp_path / "catalog.json"
+    write_catalog(path, catalog, ndjson=ndjson)
+
+    names = [d["name"] for d in catalog]
+    lazy = LazyCatalog(path, use_cache=False)
+    assert list(lazy) == names
+    assert lazy[names[7]].severity == catalog[7]["severity"]
+    if not ndjson:
+        assert [d.name for d in load_catalog(path, use_cache=False)] == names
+
+
+def test_command_line(tmp_path, capsys):
+    path = tmp_path / "catalog.json"
+    main(["12", "-o", str(path), "--seed", "5", "--ambiguity", "0.5"])
+    assert json.loads(path.read_text()) == generate_catalog(12, seed=5, ambiguity=0.5)
+
+    main(["3", "--ndjson"])
+    assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == generate_catalog(3)
+
+    with pytest.raises(SystemExit):
+        main(["3", "--ambiguity", "2"])
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from medical_simulator.core.waiting_room import AcuityScore, WaitingRoom
+from medical_simulator.utils.utils import generate_random_patient
+
+
+@pytest.fixture
+def patients(diseases):
+    rng = random.Random(0)
+    return [generate_random_patient(diseases, rng) for _ in range(6)]
+
+
+def test_ids_and_arrival_order_survive_removals(patients):
+    room = WaitingRoom(10)
+    ids = [room.add_patient(p) for p in patients]
+
+    room.remove_patient(patients[1])
+    room.remove_patient(patients[4])
+    left = [patients[i] for i in (0, 2, 3, 5)]
+
+    assert list(room.patients) == left
+    assert [room.id_of(p) for p in left] == [ids[i] for i in (0, 2, 3, 5)]
+    assert [room.get_patient(i) for i in range(4)] == left
+    assert room.get_patient(4) is None
+    assert [room.position(p) for p in left] == [0, 1, 2, 3]
+    assert room.position(patients[1]) is None
+    assert room.get_by_id(ids[1]) is None
+
+
+def test_patients_is_a_live_read_only_view(patients):
+    room = WaitingRoom(10)
+    view = room.patients
+    for p in patients[:3]:
+        room.add_patient(p)
+
+    assert list(view) == patients[:3]
+    room.remove_patient(patients[0])
+    assert list(view) == patients[1:3]
+
+    assert not hasattr(view, "append")
+    with pytest.raises(TypeError):
+        view[0] = patients[3]
+
+
+def test_triage_follows_reprioritization(patients):
+    acuity = AcuityScore()
+    room = WaitingRoom(10, acuity)
+    for p in patients:
+        room.add_patient(p)
+
+    patients[3].health = 1
+    room.reprioritize(patients[3])
+    assert room.most_urgent() is patients[3]
+
+    room.remove_patient(patients[3])
+    expected = sorted(room.patients, key=lambda p: (acuity(p), room.id_of(p)))
+    assert room.by_acuity() == expected
+
+
+def test_triage_needs_an_acuity_score(patients):
+    room = WaitingRoom(10)
+    with pytest.raises(RuntimeError):
+        room.most_urgent()
@@ -0,0 +1,105 @@
+import pytest
+
+from medical_simulator.core import snapshot
+from medical_simulator.core.arrivals import HourlyCoinArrivals
+from medical_simulator.core.clock import Clock
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.events import EventKind
+from medical_simulator.core.hospital import Hospital
+from medical_simulator.core.patient import Patient
+from medical_simulator.core.ward import Ward, WorkupPolicy
+from medical_simulator.core.waiting_room import WaitingRoom
+from medical_simulator.utils.rng import SimulationRNG
+
+
+def _ward(diseases, treatments, seed=4) -> Ward:
+    hospital = Hospital(Clock(), WaitingRoom(10), diseases, treatments, rng=SimulationRNG(seed))
+    ward = Ward(hospital, doctors=2)
+    ward.start_new_day()
+    return ward
+
+
+def _state(ward: Ward) -> tuple:
+    return (
+        ward.hospital.total_score,
+        [(v.patient.name, v.treatment.name, v.started_at, v.finished_at) for v in ward.completed],
+        [p.health for p in ward.hospital.waiting_room.patients],
+        ward.report()
+    )
+
+
+def test_checkpoint_with_visits_in_progress(diseases, treatments):
+    ward = _ward(diseases, treatments)
+    xray = next(t for t in treatments if t.name == "X-Ray")
+    slow = max(treatments, key=lambda t: t.time_cost)
+    for patient in list(ward.hospital.waiting_room.patients):
+        ward.request(patient, xray)
+        ward.request(patient, slow)
+    assert ward.running and ward.queued()
+
+    restored = snapshot.loads(snapshot.dumps(ward, hospital=ward.hospital), diseases, treatments)
+    assert len(restored.running) == len(ward.running)
+
+    for w in (ward, restored):
+        w.advance(8)
+        w.hospital.sync_all()
+    assert ward.completed and _state(restored) == _state(ward)
+
+
+def test_workup_does_not_repeat_a_wrong_guess(treatments):
+    # indistinguishable diseases: the differential can never tell them apart
+    twins = [
+        Disease(name, [{"name": "cough", "from_hour": 1}], ["anemia"], [], [], 38.0, 110, 0.1, (90, 95), [])
+        for name in ("first", "second")
+    ]
+    hospital = Hospital(
+        Clock(), WaitingRoom(4), twins, treatments,
+        rng=SimulationRNG(1), arrivals=HourlyCoinArrivals(probability=0)
+    )
+    ward = Ward(hospital, doctors=1)
+    ward.start_new_day()
+    patient = Patient(twins[1], rng=SimulationRNG(2))
+    patient.name = "Twin"
+    hospital.admit_patient(patient)
+
+    # no tests to run: the policy guesses at once
+    policy = WorkupPolicy(twins, tests=())
+    for _ in range(4):
+        policy.act(ward)
+        ward.advance(1)
+
+    guesses = [(e.data["guess"], e.data["correct"]) for e in hospital.pop_events()
+               if e.kind is EventKind.DIAGNOSIS and e.patient is patient]
+    assert guesses == [("first", False), ("second", True)]
+
+
+def _play(ward: Ward, policy: WorkupPolicy, hours: int) -> None:
+    for _ in range(hours):
+        policy.act(ward)
+        ward.advance(1)
+
+
+def test_fork_of_a_ward_and_its_policy(diseases, treatments):
+    ward, policy = _ward(diseases, treatments), WorkupPolicy(diseases)
+    _play(ward, policy, 3)
+    assert policy._differentials
+
+    forked_ward, forked_policy = snapshot.fork((ward, policy), hospital=ward.hospital)
+    # the copies refer to each other, and share only the catalog with the original
+    originals = set(policy._differentials)
+    assert not set(forked_policy._differentials) & originals
+    assert not set(forked_ward.hospital.waiting_room.patients) & originals
+    assert len(forked_policy._differentials) == len(originals)
+    assert forked_ward.hospital.diseases is diseases and forked_ward.hospital.treatments is treatments
+
+    before = _state(ward)
+    _play(forked_ward, forked_policy, 5)
+    assert _state(ward) == before
+    _play(ward, policy, 5)
+    assert _state(forked_ward) == _state(ward)
+
+
+def test_fork_needs_the_hospital_of_composite_state(diseases, treatments):
+    ward = _ward(diseases, treatments)
+    with pytest.raises(TypeError):
+        snapshot.fork((ward, WorkupPolicy(diseases)))
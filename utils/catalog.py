@@ -0,0 +1,284 @@
+import hashlib
+import json
+import os
+import pickle
+from numbers import Real
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.vocabulary import Vocabulary
+
+
+# bump whenever Disease (or anything it pickles) changes shape
+CACHE_VERSION = 2
+
+# overrides the per-user cache folder
+CACHE_DIR_ENV = "MEDICAL_SIMULATOR_CACHE"
+
+# catalogs with these suffixes hold one disease per line instead of a JSON array
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# catalogs already loaded by this process, keyed like the on-disk cache
+_loaded: dict[str, list[Disease]] = {}
+
+
+class CatalogError(ValueError):
+    """
+    Raised when a disease catalog does not follow the expected schema.
+
+    Attributes
+    ----------
+    errors : list[str]
+        Every problem found, each prefixed with the location of the offending value.
+    """
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        shown = "\n".join(f"  - {e}" for e in errors[:20])
+        more = f"\n  ... and {len(errors) - 20} more" if len(errors) > 20 else ""
+        super().__init__(f"Invalid disease catalog ({len(errors)} errors):\n{shown}{more}")
+
+
+# -------------------------
+# Validation
+# -------------------------
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _check_strings(errors: list[str], where: str, value: Any) -> None:
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        errors.append(f"{where}: expected a list of strings")
+
+
+def validate_disease(item: Any, where: str = "disease") -> list[str]:
+    """
+    Returns the schema problems of one catalog entry (empty if it is valid).
+    """
+    if not isinstance(item, dict):
+        return [f"{where}: expected an object"]
+
+    errors: list[str] = []
+
+    name = item.get("name")
+    if not isinstance(name, str) or not name.strip():
+        errors.append(f"{where}.name: expected a non-empty string")
+
+    timeline = item.get("symptoms_timeline")
+    if not isinstance(timeline, list):
+        errors.append(f"{where}.symptoms_timeline: expected a list")
+    else:
+        for i, symptom in enumerate(timeline):
+            at = f"{where}.symptoms_timeline[{i}]"
+            if not isinstance(symptom, dict):
+                errors.append(f"{at}: expected an object")
+                continue
+            if not isinstance(symptom.get("name"), str):
+                errors.append(f"{at}.name: expected a string")
+            if not _is_int(symptom.get("from_hour")) or symptom["from_hour"] < 0:
+                errors.append(f"{at}.from_hour: expected a non-negative integer")
+
+    for key in ("blood_findings", "xray_findings", "ecg_findings", "correct_treatments"):
+        _check_strings(errors, f"{where}.{key}", item.get(key))
+
+    for key in ("base_temperature", "base_systolic_bp"):
+        if not _is_number(item.get(key)):
+            errors.append(f"{where}.{key}: expected a number")
+
+    severity = item.get("severity")
+    if not _is_number(severity) or severity < 0:
+        errors.append(f"{where}.severity: expected a non-negative number")
+
+    health = item.get("initial_health_range")
+    if (
+        not isinstance(health, (list, tuple)) or len(health) != 2
+        or not all(_is_int(h) for h in health) or not 0 < health[0] <= health[1] <= 100
+    ):
+        errors.append(f"{where}.initial_health_range: expected [low, high] integers with 0 < low <= high <= 100")
+
+    return errors
+
+
+def validate_catalog(data: Any) -> None:
+    """
+    Checks a parsed catalog against the schema read by `build_diseases`.
+
+    Raises
+    ------
+    CatalogError
+        Listing every problem found.
+    """
+    if not isinstance(data, list):
+        raise CatalogError(["catalog: expected a list of diseases"])
+
+    errors: list[str] = []
+    seen: set[str] = set()
+
+    for i, item in enumerate(data):
+        errors.extend(validate_disease(item, f"diseases[{i}]"))
+        name = item.get("name") if isinstance(item, dict) else None
+        if isinstance(name, str):
+            if name in seen:
+                errors.append(f"diseases[{i}].name: duplicate disease {name!r}")
+            seen.add(name)
+
+    if errors:
+        raise CatalogError(errors)
+
+
+# -------------------------
+# Construction
+# -------------------------
+
+def build_disease(item: dict, symptoms: Vocabulary) -> Disease:
+    return Disease(
+        name=item["name"],
+        symptoms_timeline=item["symptoms_timeline"],
+        blood_findings=item["blood_findings"],
+        xray_findings=item["xray_findings"],
+        ecg_findings=item["ecg_findings"],
+        base_temperature=item["base_temperature"],
+        base_systolic_bp=item["base_systolic_bp"],
+        severity=item["severity"],
+        initial_health_range=item["initial_health_range"],
+        correct_treatments=item["correct_treatments"],
+        symptom_vocabulary=symptoms
+    )
+
+
+def build_diseases(data: list[dict]) -> list[Disease]:
+    # one vocabulary per catalog: symptom names are interned once
+    symptoms = Vocabulary()
+    return [build_disease(item, symptoms) for item in data]
+
+
+def parse_catalog(path: Union[str, Path]) -> list[Disease]:
+    """
+    Reads, validates and builds a JSON (or NDJSON) catalog, without any caching.
+    """
+    with open(path, "r") as file:
+        if Path(path).suffix in NDJSON_SUFFIXES:
+            data = [json.loads(line) for line in file if line.strip()]
+        else:
+            data = json.load(file)
+
+    validate_catalog(data)
+    return build_diseases(data)
+
+
+# -------------------------
+# Cached loading
+# -------------------------
+
+def catalog_key(path: Union[str, Path]) -> str:
+    """
+    Cache key of a catalog file: a hash of its contents (and of `CACHE_VERSION`).
+    """
+    digest = hashlib.sha256(f"{CACHE_VERSION}|".encode())
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+def default_cache_dir() -> Path:
+    """
+    Per-user folder of the catalog caches: ``$MEDICAL_SIMULATOR_CACHE`` if set,
+    otherwise ``medical_simulator/catalogs`` in the user cache folder
+    (``$XDG_CACHE_HOME`` or ``~/.cache``, ``%LOCALAPPDATA%`` on Windows).
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get("LOCALAPPDATA") if os.name == "nt" else os.environ.get("XDG_CACHE_HOME")
+    return Path(base or Path.home() / ".cache") / "medical_simulator" / "catalogs"
+
+
+def cache_path(path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None, key: Optional[str] = None) -> Path:
+    directory = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    return directory / f"{Path(path).stem}.{key or catalog_key(path)}.pickle"
+
+
+def _owned(stat: os.stat_result) -> bool:
+    # caches are unpickled, so nobody else may have been able to write them
+    if not hasattr(os, "getuid"):
+        # Windows: the user cache folder is private by default
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _read_cache(target: Path) -> Any:
+    """
+    Unpickles a cache file, or returns None if it is missing, unreadable, or
+    was writable by another user (it is then ignored and rebuilt).
+    """
+    try:
+        if not _owned(target.parent.stat()):
+            return None
+        with open(target, "rb") as file:
+            if not _owned(os.fstat(file.fileno())):
+                return None
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def _write_cache(target: Path, payload: Any) -> None:
+    # only needed on a cache miss, and slow to import
+    import tempfile
+    try:
+        target.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _owned(target.parent.stat()):
+            # a shared folder could serve us someone else's pickle
+            return
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        # atomic, so concurrent workers never read a half-written cache
+        os.replace(tmp, target)
+    except OSError:
+        # a read-only cache folder only costs us the cache
+        pass
+
+
+def load_catalog(path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None, use_cache: bool = True) -> list[Disease]:
+    """
+    Loads a disease catalog, validating and compiling it only once.
+
+    The first load validates the JSON file, builds the `Disease` objects
+    (with their precompiled timelines) and pickles them in the per-user
+    cache folder (`default_cache_dir()`, or `cache_dir`). Later loads, from
+    this or any other process, unpickle that file instead, as long as the
+    catalog has the same contents. Caches in a folder, or in a file, that
+    other users can write to are never read. Within a process the same list
+    is returned on every call, so worker processes forked after a first load
+    share it without loading anything.
+
+    The returned diseases are shared: treat them as read-only.
+
+    Raises
+    ------
+    CatalogError
+        If the catalog does not follow the schema.
+    """
+    if not use_cache:
+        return parse_catalog(path)
+
+    key = catalog_key(path)
+    diseases = _loaded.get(key)
+    if diseases is not None:
+        return diseases
+
+    target = cache_path(path, cache_dir, key)
+    diseases = _read_cache(target)
+    if diseases is None:
+        diseases = parse_catalog(path)
+        _write_cache(target, diseases)
+
+    _loaded[key] = diseases
+    return diseases
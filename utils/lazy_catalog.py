@@ -0,0 +1,348 @@
+import hashlib
+import json
+import re
+import time
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional, Union
+
+from medical_simulator.core.disease import Disease
+from medical_simulator.core.vocabulary import Vocabulary
+from medical_simulator.utils.catalog import (
+    CACHE_VERSION, CatalogError, _read_cache, _write_cache, build_disease, catalog_key, default_cache_dir, validate_disease
+)
+
+
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# how close to the end of the buffer a value cut by it can fail to decode: at the
+# start of a truncated literal, number or \uXXXX escape ("-Infinity" is the longest)
+_LONGEST_TOKEN = len("-Infinity")
+
+
+class _Layout(Enum):
+    """
+    Position in the layout of a catalog; the value says what may come next.
+    """
+    START = "an object or '['"          # start of the file
+    LINE = "an object"                  # NDJSON, after the whitespace following an object
+    NEWLINE = "a new line"              # NDJSON, just after an object
+    FIRST = "an object or ']'"          # just after the '[' of an array
+    ITEM = "an object after ','"        # after a ',' in an array
+    AFTER = "',' or ']'"                # after an object in an array
+    END = "the end of the file"         # after the closing ']'
+
+
+def _cut_by_end(buffer: str, error: json.JSONDecodeError) -> bool:
+    # a string cut by the end of the buffer fails at its opening quote
+    return error.pos >= len(buffer) - _LONGEST_TOKEN or error.msg.startswith("Unterminated string")
+
+
+def scan_catalog(file: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[int, int, object]]:
+    """
+    Yields ``(offset, length, item)`` for every disease of a catalog, reading
+    it a chunk at a time.
+
+    The file is either a JSON array of objects (one ``[``, objects separated
+    by single commas, one ``]``) or NDJSON (objects separated by whitespace,
+    usually one disease per line). Anything else, e.g. nested arrays or stray
+    commas, is rejected. Bytes are decoded as latin-1 so that string positions
+    are byte offsets; non-ASCII strings of `item` are therefore latin-1 views
+    of UTF-8 text (see `_decode_entry` for the real text).
+
+    An object is decoded again with more data only when it failed right at
+    the end of the buffer, where a chunk may have cut it; any other error is
+    raised at once. Such retries read as much as is already buffered, so an
+    object spanning many chunks is decoded O(log n) times rather than once per
+    chunk.
+
+    Raises
+    ------
+    CatalogError
+        If the file is not valid JSON, or not laid out as above.
+    """
+    buffer = ""
+    base = 0  # file offset of buffer[0]
+    pos = 0
+    eof = False
+    state = _Layout.START
+
+    while True:
+        if state is _Layout.NEWLINE and pos < len(buffer) and buffer[pos] in " \t\n\r":
+            state = _Layout.LINE
+        pos = _WHITESPACE.match(buffer, pos).end()
+
+        if pos < len(buffer):
+            char = buffer[pos]
+            if state is _Layout.START and char == "[":
+                state = _Layout.FIRST
+                pos += 1
+                continue
+            if state in (_Layout.FIRST, _Layout.AFTER) and char == "]":
+                state = _Layout.END
+                pos += 1
+                continue
+            if state is _Layout.AFTER and char == ",":
+                state = _Layout.ITEM
+                pos += 1
+                continue
+            if state in (_Layout.AFTER, _Layout.NEWLINE, _Layout.END) or char != "{":
+                raise CatalogError([f"catalog: unexpected {char!r} at byte {base + pos}, expected {state.value}"])
+
+            try:
+                item, end = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if eof or not _cut_by_end(buffer, e):
+                    raise CatalogError([f"catalog: invalid JSON at byte {base + e.pos}: {e.msg}"]) from None
+                # cut by the end of the chunk: read on and retry
+            else:
+                state = _Layout.NEWLINE if state in (_Layout.START, _Layout.LINE) else _Layout.AFTER
+                yield base + pos, end - pos, item
+                pos = end
+                continue
+        elif eof:
+            if state in (_Layout.START, _Layout.LINE, _Layout.NEWLINE, _Layout.END):
+                return
+            raise CatalogError([f"catalog: unexpected end of file at byte {base + pos}, expected {state.value}"])
+
+        chunk = file.read(max(chunk_size, len(buffer) - pos))
+        eof = not chunk
+        buffer = buffer[pos:] + chunk.decode("latin-1")
+        base += pos
+        pos = 0
+
+
+def _decode_entry(data: bytes, offset: int) -> object:
+    """
+    Parses the raw bytes of the entry found at byte `offset` of a catalog.
+
+    Raises
+    ------
+    CatalogError
+        If the bytes are not valid UTF-8 or not valid JSON.
+    """
+    try:
+        return json.loads(data.decode("utf-8"))
+    except UnicodeDecodeError as e:
+        raise CatalogError([f"catalog: invalid UTF-8 at byte {offset + e.start}"]) from None
+    except json.JSONDecodeError as e:
+        raise CatalogError([f"catalog: invalid JSON in the entry at byte {offset}: {e.msg}"]) from None
+
+
+class _CachedIndex:
+    """
+    Cached index of a catalog file, with what is needed to tell whether it is still current.
+
+    Attributes
+    ----------
+    size, mtime_ns : int
+        Size and modification time of the file when it was last checked.
+    checked_ns : int
+        When the file was last checked (``time.time_ns()``).
+    key : str
+        `catalog_key` of the indexed contents.
+    index : dict[str, tuple[int, int]]
+        Name -> (offset, length) of its entry in the file.
+    """
+
+    def __init__(self, size: int, mtime_ns: int, checked_ns: int, key: str, index: dict[str, tuple[int, int]]):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.checked_ns = checked_ns
+        self.key = key
+        self.index = index
+
+
+class LazyCatalog:
+    """
+    Disease catalog read on demand, for catalogs too large to load whole.
+
+    Opening the catalog only indexes it: one streaming pass records where
+    every disease is in the file, by name, without building anything. The
+    index is cached in the folder of compiled catalogs (see `load_catalog`),
+    so later opens of the same file, e.g. by worker processes, read just the
+    index. They check it with the size and modification time of the file,
+    and hash the contents only when those changed. A `Disease` is parsed,
+    validated and built the first time it is accessed, then kept.
+
+    Both JSON arrays and NDJSON files are supported.
+
+    Parameters
+    ----------
+    path : str | Path
+        The catalog file.
+    cache_dir : str | Path | None, optional (default=None)
+        Where the index is cached; `default_cache_dir()` when omitted.
+    use_cache : bool, optional (default=True)
+        Whether to read and write the cached index.
+
+    Raises
+    ------
+    CatalogError
+        If the file is not valid JSON or UTF-8, an entry has no name or a name is repeated.
+    """
+
+    # a file modified this close to when it was checked may have changed
+    # within one tick of its modification time: its contents are hashed again
+    RACY_NS = 2_000_000_000
+
+    def __init__(self, path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None, use_cache: bool = True):
+        self.path = Path(path)
+        self.symptom_vocabulary = Vocabulary()
+        self._built: dict[str, Disease] = {}
+
+        # name -> (offset, length) of its entry in the file
+        self._index: dict[str, tuple[int, int]] = (
+            self._cached_index(self.index_path(cache_dir)) if use_cache else self._build_index()
+        )
+
+    def index_path(self, cache_dir: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Where the index of this file is cached: one file per catalog path.
+        """
+        directory = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        digest = hashlib.sha256(f"{CACHE_VERSION}|{self.path.resolve()}".encode()).hexdigest()[:32]
+        return directory / f"{self.path.stem}.{digest}.index.pickle"
+
+    def _cached_index(self, target: Path) -> dict[str, tuple[int, int]]:
+        """
+        Reads the cached index, trusting it without hashing the catalog as
+        long as the file keeps the size and modification time it had when
+        the index was last checked; otherwise (re)builds and caches it.
+        """
+        stat = self.path.stat()
+        cached = _read_cache(target)
+        if not isinstance(cached, _CachedIndex):
+            cached = None
+
+        if (
+            cached is not None and (cached.size, cached.mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+            and stat.st_mtime_ns < cached.checked_ns - self.RACY_NS
+        ):
+            return cached.index
+
+        checked_ns = time.time_ns()
+        key = catalog_key(self.path)
+        # touched but unchanged: only the stamp needs refreshing
+        index = cached.index if cached is not None and cached.key == key else self._build_index()
+        _write_cache(target, _CachedIndex(stat.st_size, stat.st_mtime_ns, checked_ns, key, index))
+        return index
+
+    def _build_index(self) -> dict[str, tuple[int, int]]:
+        entries: list[tuple[object, int, int]] = []
+        with open(self.path, "rb") as file:
+            for offset, length, item in scan_catalog(file):
+                name = item.get("name") if isinstance(item, dict) else None
+                entries.append((name, offset, length))
+
+            # a non-ASCII name was read from a latin-1 view of its bytes and
+            # may mix raw UTF-8 with \u escapes: parse its entry again
+            for i, (name, offset, length) in enumerate(entries):
+                if isinstance(name, str) and not name.isascii():
+                    file.seek(offset)
+                    entries[i] = (_decode_entry(file.read(length), offset)["name"], offset, length)
+
+        index: dict[str, tuple[int, int]] = {}
+        errors = []
+        for i, (name, offset, length) in enumerate(entries):
+            if not isinstance(name, str) or not name.strip():
+                errors.append(f"diseases[{i}].name: expected a non-empty string")
+                continue
+            if name in index:
+                errors.append(f"diseases[{i}].name: duplicate disease {name!r}")
+            index[name] = (offset, length)
+        if errors:
+            raise CatalogError(errors)
+        return index
+
+    # -------------------------
+    # Access
+    # -------------------------
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def names(self) -> list[str]:
+        """
+        Names of every disease, in file order.
+        """
+        return list(self._index)
+
+    def __getitem__(self, name: str) -> Disease:
+        disease = self._built.get(name)
+        if disease is None:
+            disease = self.subset([name])[0]
+        return disease
+
+    def get(self, name: str) -> Optional[Disease]:
+        return self[name] if name in self._index else None
+
+    def subset(self, names: Iterable[str]) -> list[Disease]:
+        """
+        The named diseases, in the given order, building those not built yet
+        in one pass over the file.
+
+        Raises
+        ------
+        KeyError
+            If a name is not in the catalog.
+        CatalogError
+            If one of the entries does not follow the schema.
+        """
+        names = list(names)
+        missing = sorted({n for n in names if n not in self._built}, key=lambda n: self._entry(n)[0])
+
+        if missing:
+            errors = []
+            with open(self.path, "rb") as file:
+                for name in missing:
+                    offset, length = self._entry(name)
+                    file.seek(offset)
+                    item = _decode_entry(file.read(length), offset)
+                    problems = validate_disease(item, f"disease {name!r}")
+                    if problems:
+                        errors.extend(problems)
+                    else:
+                        self._built[name] = build_disease(item, self.symptom_vocabulary)
+            if errors:
+                raise CatalogError(errors)
+
+        return [self._built[n] for n in names]
+
+    def diseases(self) -> list[Disease]:
+        """
+        Every disease, in file order (builds the whole catalog).
+        """
+        return self.subset(self._index)
+
+    def _entry(self, name: str) -> tuple[int, int]:
+        try:
+            return self._index[name]
+        except KeyError:
+            raise KeyError(f"Unknown disease: {name!r}") from None
+
+    def validate(self) -> None:
+        """
+        Checks every entry against the schema, streaming the file without building anything.
+
+        Raises
+        ------
+        CatalogError
+            Listing every problem found.
+        """
+        errors = []
+        with open(self.path, "rb") as file:
+            for i, (_, _, item) in enumerate(scan_catalog(file)):
+                # only types are checked: latin-1 views of the strings will do
+                errors.extend(validate_disease(item, f"diseases[{i}]"))
+        if errors:
+            raise CatalogError(errors)
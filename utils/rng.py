@@ -0,0 +1,135 @@
+import copy
+import hashlib
+import random
+from typing import Any, Optional
+
+
+def derive_seed(seed: int, path: tuple) -> int:
+    """
+    Deterministically derives a 64-bit seed from a root seed and a stream path.
+
+    Uses a cryptographic hash rather than `hash()`, so derived seeds are the
+    same in every process and every Python run.
+    """
+    digest = hashlib.blake2b(repr((seed,) + path).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class SimulationRNG(random.Random):
+    """
+    Seedable random number generator that can be split into independent substreams.
+
+    It is a drop-in `random.Random`, so it can be passed wherever the simulation
+    used the global `random` module. `spawn(name)` returns a child stream whose
+    seed depends only on the root seed and the name path, so substreams (e.g.
+    arrivals, demographics, the decay of each patient) do not interfere with each
+    other and runs with the same seed are reproducible regardless of the order in
+    which the streams are consumed.
+
+    Parameters
+    ----------
+    seed : int | None, optional (default=None)
+        Root seed. A random one is drawn from the OS when omitted.
+    path : tuple, optional (default=())
+        Names of the spawns leading from the root to this stream.
+
+    Attributes
+    ----------
+    root_seed : int
+        Seed of the root stream this stream descends from.
+    path : tuple
+        Names of the spawns leading from the root to this stream.
+    """
+
+    def __init__(self, seed: Optional[int] = None, path: tuple = ()):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+
+        self.root_seed = seed
+        self.path = path
+        self._numpy = None
+        super().__init__(derive_seed(seed, path) if path else seed)
+
+    def spawn(self, *names: Any) -> "SimulationRNG":
+        """
+        Returns the independent substream identified by `names` (e.g. ``spawn("patient", 3)``).
+        """
+        return SimulationRNG(self.root_seed, self.path + names)
+
+    def numpy(self):
+        """
+        Returns a NumPy `Generator` seeded from this stream, for bulk draws.
+
+        The generator is created on first use and reused afterwards. Requires `numpy`.
+        """
+        if self._numpy is None:
+            import numpy as np
+            self._numpy = np.random.default_rng(derive_seed(self.root_seed, self.path + ("numpy",)))
+        return self._numpy
+
+    def __reduce__(self):
+        return (self.__class__, (self.root_seed, self.path), self.__getstate__())
+
+    def __getstate__(self):
+        return {"random": self.getstate(), "numpy": self._numpy}
+
+    def __setstate__(self, state):
+        self.setstate(state["random"])
+        self._numpy = state["numpy"]
+
+    def __deepcopy__(self, memo):
+        # the Mersenne Twister state is an immutable tuple of ints: share it
+        # instead of letting deepcopy walk its 625 elements
+        clone = self.__class__.__new__(self.__class__)
+        clone.root_seed = self.root_seed
+        clone.path = self.path
+        clone.setstate(self.getstate())
+        clone._numpy = copy.deepcopy(self._numpy, memo)
+        memo[id(self)] = clone
+        return clone
+
+
+class SplitMix64:
+    """
+    Minimal SplitMix64 generator whose whole state is one 64-bit integer.
+
+    Used as the private stream of each patient: a `random.Random` carries
+    about 2.5 KB of Mersenne Twister state, which dominates the footprint of
+    large populations. Only the few methods patients need are provided.
+
+    Parameters
+    ----------
+    seed : int
+        Initial state.
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(self, seed: int):
+        self.state = seed & 0xFFFFFFFFFFFFFFFF
+
+    def __deepcopy__(self, memo) -> "SplitMix64":
+        clone = memo[id(self)] = SplitMix64(self.state)
+        return clone
+
+    def next64(self) -> int:
+        self.state = z = (self.state + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        """
+        Returns a float uniformly distributed in [0, 1).
+        """
+        # next64() inlined: this is called once per patient per simulated hour
+        self.state = z = (self.state + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        return ((z ^ (z >> 31)) >> 11) * 1.1102230246251565e-16
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def randint(self, a: int, b: int) -> int:
+        return a + (self.next64() % (b - a + 1))
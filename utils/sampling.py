@@ -0,0 +1,121 @@
+"""
+Exact discrete samplers driven by any source of uniform floats.
+
+They only need ``rng.random()``, so they work with `random.Random`,
+`SimulationRNG` and the per-patient `SplitMix64` streams alike, and cost one
+uniform draw per call (plus a walk over the probabilities) whatever `n`.
+"""
+import math
+import random
+from typing import Sequence
+
+# larger binomials are split, so (1 - p) ** n never underflows (p <= 0.5)
+_MAX_BINOMIAL = 500
+# larger Poisson rates are split, so exp(-rate) never underflows
+_MAX_POISSON = 500.0
+
+
+def binomial(n: int, p: float, rng: random.Random) -> int:
+    """
+    Number of successes in `n` trials of probability `p`, by inversion.
+    """
+    if n <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return n
+    if p > 0.5:
+        return n - binomial(n, 1.0 - p, rng)
+    if n > _MAX_BINOMIAL:
+        half = n // 2
+        return binomial(half, p, rng) + binomial(n - half, p, rng)
+
+    q = 1.0 - p
+    ratio = p / q
+    pmf = q ** n
+    cdf = pmf
+    u = rng.random()
+    k = 0
+    while u > cdf and k < n:
+        k += 1
+        pmf *= ratio * (n - k + 1) / k
+        cdf += pmf
+    return k
+
+
+def poisson(rate: float, rng: random.Random) -> int:
+    """
+    Poisson count of mean `rate`, by inversion.
+    """
+    if rate <= 0.0:
+        return 0
+    if rate > _MAX_POISSON:
+        half = rate / 2
+        return poisson(half, rng) + poisson(rate - half, rng)
+
+    pmf = math.exp(-rate)
+    cdf = pmf
+    u = rng.random()
+    k = 0
+    # the pmf underflows to 0 far in the tail, where rounding may keep cdf below u
+    while u > cdf and pmf > 0.0:
+        k += 1
+        pmf *= rate / k
+        cdf += pmf
+    return k
+
+
+def hypergeometric(good: int, total: int, draws: int, rng: random.Random) -> int:
+    """
+    Good items among `draws` taken without replacement from `total` items,
+    `good` of which are good, by inversion.
+    """
+    bad = total - good
+    if draws <= 0 or good <= 0:
+        return 0
+    if bad <= 0:
+        return draws
+    if draws >= total:
+        return good
+
+    k = max(0, draws - bad)
+    high = min(good, draws)
+    pmf = math.comb(good, k) * math.comb(bad, draws - k) / math.comb(total, draws)
+    cdf = pmf
+    u = rng.random()
+    while u > cdf and k < high:
+        pmf *= (good - k) * (draws - k) / ((k + 1) * (bad - draws + k + 1))
+        k += 1
+        cdf += pmf
+    return k
+
+
+def multinomial(n: int, probabilities: Sequence[float], rng: random.Random) -> list[int]:
+    """
+    Counts of each outcome over `n` independent draws, as a chain of binomials.
+    """
+    counts = []
+    remaining = n
+    mass = 1.0
+    for p in probabilities[:-1]:
+        count = binomial(remaining, min(1.0, p / mass), rng) if mass > 0 else 0
+        counts.append(count)
+        remaining -= count
+        mass -= p
+    counts.append(remaining)
+    return counts
+
+
+def multivariate_hypergeometric(counts: Sequence[int], draws: int, rng: random.Random) -> list[int]:
+    """
+    Counts of each kind among `draws` items taken without replacement from a
+    population with `counts` items of each kind.
+    """
+    taken = []
+    total = sum(counts)
+    for count in counts[:-1]:
+        k = hypergeometric(count, total, draws, rng)
+        taken.append(k)
+        draws -= k
+        total -= count
+    taken.append(draws)
+    return taken
@@ -0,0 +1,215 @@
+"""
+Synthetic disease catalogs for scale and load testing.
+
+Catalogs follow the schema of ``data/diseases.json``, so they load with
+`load_diseases_from_json` / `load_catalog`, and are fully determined by their
+seed. Diseases come in families sharing a clinical picture; `ambiguity`
+controls how much of it members inherit, and so how hard the diseases of a
+family are to tell apart.
+
+Run from the folder containing the medical_simulator package::
+
+    python -m medical_simulator.utils.synthetic 10000 -o catalog_10k.json --ambiguity 0.5
+    python -m medical_simulator.utils.synthetic 100000 -o catalog_100k.ndjson --ndjson
+"""
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Optional, Sequence, Union
+
+from medical_simulator.utils.utils import build_treatments
+
+
+TESTS = ("blood_findings", "xray_findings", "ecg_findings")
+
+MAX_ONSET_HOUR = 10
+
+
+def _pool(prefix: str, size: int) -> list[str]:
+    return [f"{prefix} {i}" for i in range(size)]
+
+
+class _Sampler:
+    # names drawn with Zipf-like popularity, so common symptoms and findings
+    # are shared by many diseases and rare ones by few
+
+    def __init__(self, names: list[str], rng: random.Random, exponent: float = 0.8):
+        self.names = names
+        self.rng = rng
+        total = 0.0
+        self.cum_weights = []
+        for rank in range(len(names)):
+            total += 1.0 / (rank + 1) ** exponent
+            self.cum_weights.append(total)
+
+    def sample(self, k: int) -> list[str]:
+        k = min(k, len(self.names))
+        chosen: dict[str, None] = {}
+        while len(chosen) < k:
+            for name in self.rng.choices(self.names, cum_weights=self.cum_weights, k=k - len(chosen)):
+                chosen[name] = None
+        return list(chosen)
+
+
+def _profile(rng: random.Random, symptoms: _Sampler, findings: _Sampler, treatments: Sequence[str]) -> dict[str, Any]:
+    low = rng.randint(30, 85)
+    return {
+        "symptoms_timeline": [
+            {"name": name, "from_hour": rng.randint(0, MAX_ONSET_HOUR)}
+            for name in symptoms.sample(rng.randint(2, 8))
+        ],
+        "blood_findings": findings.sample(rng.randint(0, 3)),
+        "xray_findings": findings.sample(rng.randint(0, 2)),
+        "ecg_findings": findings.sample(rng.randint(0, 2)),
+        "base_temperature": round(rng.uniform(36.0, 40.5), 1),
+        "base_systolic_bp": rng.randint(75, 170),
+        "severity": rng.choice((0.5, 1, 1, 2, 2, 3, 4, 5)),
+        "initial_health_range": [low, rng.randint(low, 100)],
+        "correct_treatments": rng.sample(list(treatments), rng.randint(1, min(2, len(treatments)))),
+    }
+
+
+def _member(base: dict[str, Any], fresh: dict[str, Any], ambiguity: float, rng: random.Random) -> dict[str, Any]:
+    # every feature of the family profile is kept with probability `ambiguity`,
+    # otherwise replaced by the one of an unrelated random profile
+    def pick(key: str) -> Any:
+        return base[key] if rng.random() < ambiguity else fresh[key]
+
+    timeline = [
+        dict(base_symptom) if rng.random() < ambiguity else fresh_symptom
+        for base_symptom, fresh_symptom in zip(base["symptoms_timeline"], fresh["symptoms_timeline"])
+    ]
+    # symptoms beyond the shorter timeline: the family's are kept, and the
+    # unrelated profile's added, with the same odds as the rest
+    shared = len(timeline)
+    timeline += [dict(s) for s in base["symptoms_timeline"][shared:] if rng.random() < ambiguity]
+    timeline += [s for s in fresh["symptoms_timeline"][shared:] if rng.random() >= ambiguity]
+
+    # the same symptom can come from both profiles: keep its first onset
+    seen: set[str] = set()
+    unique = []
+    for symptom in timeline:
+        if symptom["name"] not in seen:
+            seen.add(symptom["name"])
+            unique.append(symptom)
+
+    member = {"symptoms_timeline": unique}
+    for key in (*TESTS, "correct_treatments"):
+        member[key] = list(pick(key))
+    for key in ("base_temperature", "base_systolic_bp", "severity"):
+        member[key] = pick(key)
+    member["initial_health_range"] = list(pick("initial_health_range"))
+    return member
+
+
+def generate_catalog(
+    n_diseases: int,
+    seed: int = 0,
+    ambiguity: float = 0.3,
+    family_size: int = 5,
+    n_symptoms: Optional[int] = None,
+    n_findings: Optional[int] = None,
+    treatments: Optional[Sequence[str]] = None
+) -> list[dict[str, Any]]:
+    """
+    Builds a valid, JSON-ready catalog of `n_diseases` random diseases.
+
+    Parameters
+    ----------
+    n_diseases : int
+        Number of diseases, named ``"disease <i>"``.
+    seed : int, optional (default=0)
+        The catalog is a pure function of the seed and the other arguments.
+    ambiguity : float, optional (default=0.3)
+        Probability that a disease inherits each feature (symptom, findings of
+        a test, vital signs, severity, treatments) from its family's profile.
+        0 gives unrelated diseases, 1 families of indistinguishable ones.
+    family_size : int, optional (default=5)
+        Diseases per family.
+    n_symptoms, n_findings : int | None, optional (default=None)
+        Sizes of the symptom and finding pools; scale with `n_diseases` when omitted.
+    treatments : Sequence[str] | None, optional (default=None)
+        Treatments the correct ones are chosen among; the therapeutic
+        treatments of `build_treatments()` when omitted.
+
+    Raises
+    ------
+    ValueError
+        If an argument is out of range, e.g. `treatments` is empty.
+    """
+    if n_diseases < 0:
+        raise ValueError(f"n_diseases must be non-negative, got {n_diseases}")
+    if not 0.0 <= ambiguity <= 1.0:
+        raise ValueError(f"ambiguity must be between 0 and 1, got {ambiguity}")
+    if family_size < 1:
+        raise ValueError(f"family_size must be at least 1, got {family_size}")
+    if n_symptoms is not None and n_symptoms < 1:
+        raise ValueError(f"n_symptoms must be at least 1, got {n_symptoms}")
+    if n_findings is not None and n_findings < 0:
+        raise ValueError(f"n_findings must be non-negative, got {n_findings}")
+    treatments = list(treatments) if treatments is not None else [t.name for t in build_treatments() if t.test_type is None]
+    if not treatments:
+        raise ValueError("treatments must name at least one treatment")
+
+    rng = random.Random(seed)
+    symptoms = _Sampler(_pool("symptom", n_symptoms if n_symptoms is not None else max(40, n_diseases // 4)), rng)
+    findings = _Sampler(_pool("finding", n_findings if n_findings is not None else max(20, n_diseases // 10)), rng)
+
+    catalog = []
+    base = None
+    for i in range(n_diseases):
+        if i % family_size == 0:
+            base = _profile(rng, symptoms, findings, treatments)
+        disease = _member(base, _profile(rng, symptoms, findings, treatments), ambiguity, rng)
+        catalog.append({"name": f"disease {i}", **disease})
+    return catalog
+
+
+def write_catalog(path: Union[str, Path], catalog: list[dict[str, Any]], ndjson: bool = False) -> None:
+    """
+    Writes a catalog as a JSON array, one disease per line, or as NDJSON
+    (the same lines without the brackets and commas) if `ndjson` is set.
+    """
+    with open(path, "w") as file:
+        if not ndjson:
+            file.write("[\n")
+        for i, disease in enumerate(catalog):
+            file.write(json.dumps(disease, separators=(",", ":")))
+            file.write(",\n" if i < len(catalog) - 1 and not ndjson else "\n")
+        if not ndjson:
+            file.write("]\n")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic disease catalog")
+    parser.add_argument("n_diseases", type=int, help="number of diseases")
+    parser.add_argument("-o", "--output", help="output file (default: standard output)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    parser.add_argument("--ambiguity", type=float, default=0.3, help="share of family features each disease inherits, 0-1 (default 0.3)")
+    parser.add_argument("--family-size", type=int, default=5, help="diseases per family (default 5)")
+    parser.add_argument("--symptoms", type=int, help="size of the symptom pool")
+    parser.add_argument("--findings", type=int, help="size of the finding pool")
+    parser.add_argument("--ndjson", action="store_true", help="write one disease per line, without the enclosing array")
+    args = parser.parse_args(argv)
+
+    try:
+        catalog = generate_catalog(
+            args.n_diseases, args.seed, args.ambiguity, args.family_size, args.symptoms, args.findings
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.output:
+        write_catalog(args.output, catalog, args.ndjson)
+    elif args.ndjson:
+        for disease in catalog:
+            print(json.dumps(disease, separators=(",", ":")))
+    else:
+        json.dump(catalog, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
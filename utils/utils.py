@@ -1,7 +1,9 @@
 import random
+from typing import Optional
 from medical_simulator.core.patient import Patient
 from medical_simulator.core.disease import Disease
-import json
+from medical_simulator.core.treatment import Treatment
+from medical_simulator.utils.rng import SplitMix64
 
 
 NAMES = {
@@ -9,36 +11,49 @@ NAMES = {
     "F": ["Anna", "Giulia", "Francesca", "Maria", "Elena"]
 }
 
-def generate_random_patient(diseases: list[Disease]) -> Patient:
-
-    disease = random.choice(diseases)
-    patient = Patient(disease)
-
-    patient.sex = random.choice(["M", "F"])
-    patient.name = random.choice(NAMES[patient.sex])
-    patient.age = random.randint(18, 85)
+def build_treatments() -> list[Treatment]:
+    return [
+        Treatment("IV Fluids", effect=10, penalty=2, time_cost=1, description="Hydration support"),
+        Treatment("Antibiotics", effect=20, penalty=15, time_cost=1, description="Broad-spectrum antibiotics"),
+        Treatment("Vital Signs Check", time_cost=1, test_type="vitals", description="Measure temperature and blood pressure"),
+        Treatment("Blood Test", time_cost=2, test_type="blood", description="Laboratory analysis"),
+        Treatment("X-Ray", time_cost=2, test_type="xray", description="Chest imaging"),
+        Treatment("ECG", time_cost=1, test_type="ecg", description="Electrocardiogram")
+    ]
+
+
+def generate_random_patient(diseases: list[Disease], rng: Optional[random.Random] = None, weights: Optional[list[float]] = None) -> Patient:
+    """
+    Draws a patient with a random disease and demographics from `rng`.
+
+    When `rng` is given, the patient also gets its own substream (seeded from
+    `rng`) for health decay, so patients evolve independently of each other.
+    Without `rng` the global `random` module is used. `weights` are optional
+    cumulative weights of the diseases (as for `random.choices`).
+    """
+
+    if rng is None:
+        disease = random.choice(diseases) if weights is None else random.choices(diseases, cum_weights=weights)[0]
+        patient = Patient(disease)
+        rng = random
+    else:
+        disease = rng.choice(diseases) if weights is None else rng.choices(diseases, cum_weights=weights)[0]
+        patient = Patient(disease, rng=SplitMix64(rng.getrandbits(64)))
+
+    patient.sex = rng.choice(["M", "F"])
+    patient.name = rng.choice(NAMES[patient.sex])
+    patient.age = rng.randint(18, 85)
 
     return patient
 
 
-def load_diseases_from_json(path: str) -> list:
-    with open(path, "r") as file:
-        data = json.load(file)
-
-    diseases = []
-    for item in data:
-        disease = Disease(
-            name=item["name"],
-            symptoms_timeline=item["symptoms_timeline"],
-            blood_findings=item["blood_findings"],
-            xray_findings=item["xray_findings"],
-            ecg_findings=item["ecg_findings"],
-            base_temperature=item["base_temperature"],
-            base_systolic_bp=item["base_systolic_bp"],
-            severity=item["severity"],
-            initial_health_range=item["initial_health_range"],
-            correct_treatments=item["correct_treatments"]
-        )
-        diseases.append(disease)
-
-    return diseases
\ No newline at end of file
+def load_diseases_from_json(path: str) -> list[Disease]:
+    """
+    Reads and validates a JSON disease catalog, building fresh `Disease` objects.
+
+    See `medical_simulator.utils.catalog.load_catalog` for the cached, shared variant.
+    """
+    # imported here: everything that draws patients imports this module,
+    # and most of it never parses a catalog
+    from medical_simulator.utils.catalog import parse_catalog
+    return parse_catalog(path)